@@ -0,0 +1,19 @@
+from html2pdf4doc.cache import RenderCache
+from html2pdf4doc.converter import convert, convert_to, get_default_pool
+from html2pdf4doc.pool import (
+    ChromePool,
+    ChromeWorker,
+    ConversionError,
+    print_to_pdf,
+)
+
+__all__ = [
+    "ChromePool",
+    "ChromeWorker",
+    "ConversionError",
+    "RenderCache",
+    "convert",
+    "convert_to",
+    "get_default_pool",
+    "print_to_pdf",
+]
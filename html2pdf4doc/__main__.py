@@ -0,0 +1,6 @@
+import sys
+
+from html2pdf4doc.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,315 @@
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, Optional, Set, Union
+from urllib.parse import unquote, urlsplit
+
+from html2pdf4doc.document import (
+    DEFAULT_BUNDLE_PATH,
+    REPO_ROOT,
+    Config,
+    effective_data_attributes,
+    read_source,
+)
+from html2pdf4doc.files import atomic_output
+
+VERSION_FILE = REPO_ROOT / "src" / "version.js"
+
+# * Bump when the way the key is computed changes.
+_KEY_SCHEMA = 1
+
+_VERSION_RE = re.compile(r"VERSION\s*=\s*['\"]([^'\"]+)['\"]")
+# Local resources linked from HTML: src, href, poster, data (of <object>) and srcset.
+_HTML_LINK_RE = re.compile(
+    r"\s(?:src|href|poster|data|srcset)\s*=\s*(\"[^\"]*\"|'[^']*'|[^\s>]+)",
+    re.IGNORECASE,
+)
+# Local resources linked from CSS (and <style>/style=""): url(...) and @import "...".
+_CSS_LINK_RE = re.compile(
+    r"url\(\s*(\"[^\"]*\"|'[^']*'|[^)]*?)\s*\)|@import\s+(\"[^\"]*\"|'[^']*')",
+    re.IGNORECASE,
+)
+_CSS_SUFFIXES = (".css",)
+
+
+def read_bundle_version() -> str:
+    try:
+        match = _VERSION_RE.search(VERSION_FILE.read_text(encoding="utf-8"))
+    except OSError:
+        return "unknown"
+    return match.group(1) if match else "unknown"
+
+
+class RenderCache:
+    """A content-addressed on-disk cache of the rendered PDFs.
+
+    The key is a hash of:
+    - the input HTML,
+    - the local files it links to (images, styles, scripts, fonts from CSS),
+    - the bundle version (src/version.js) and the bundle itself,
+    - the effective config (the data-* attributes the App reads).
+
+    Entries are evicted in LRU order (by file mtime, refreshed on every hit)
+    when the total size exceeds `max_size_mb`. The total is scanned once
+    and then kept up to date by store(); the directory is scanned again
+    only when the total crosses the limit (the scan also counts the entries
+    stored by other processes in the meantime).
+    The files are written atomically, so several processes can share
+    one cache directory.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, os.PathLike],
+        max_size_mb: int = 1024,
+    ) -> None:
+        self.directory: Path = Path(directory).resolve()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_size: int = max_size_mb * 1024 * 1024
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self._size: Optional[int] = None
+        self._lock = threading.Lock()
+
+    # 🔑 key
+
+    def key_for(
+        self,
+        html_or_path: Union[str, os.PathLike],
+        config: Optional[Config] = None,
+        bundle_path: Optional[Union[str, os.PathLike]] = None,
+    ) -> str:
+        markup, base_dir, _ = read_source(html_or_path)
+
+        digest = hashlib.sha256()
+        _update(digest, "schema", str(_KEY_SCHEMA))
+        _update(digest, "version", read_bundle_version())
+        _update(digest, "html", markup)
+        _update(digest, "config", json.dumps(
+            effective_data_attributes(markup, config)
+        ))
+
+        bundle = Path(bundle_path or DEFAULT_BUNDLE_PATH)
+        if bundle.is_file():
+            _update(digest, "bundle", _hash_file(bundle))
+
+        for asset in sorted(_collect_local_assets(markup, base_dir, is_css=False)):
+            _update(digest, "asset", str(asset))
+            _update(digest, "asset-content", _hash_file(asset))
+
+        return digest.hexdigest()
+
+    # 📥 lookup
+
+    def path_for(self, key: str) -> Path:
+        return self.directory / f"{key}.pdf"
+
+    def lookup(self, key: str) -> Optional[Path]:
+        """Return the path of the cached PDF, or None on a miss."""
+        path = self._touch(key)
+        self._count(hit=path is not None)
+        return path
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._touch(key)
+        data = None
+        if path is not None:
+            try:
+                data = path.read_bytes()
+            except FileNotFoundError:
+                # * Evicted by another process in the meantime.
+                pass
+        # * A hit only when the entry has actually been read.
+        self._count(hit=data is not None)
+        return data
+
+    def _touch(self, key: str) -> Optional[Path]:
+        path = self.path_for(key)
+        try:
+            # * Refresh the LRU position.
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def _count(self, *, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    # 📤 store
+
+    @contextmanager
+    def store(self, key: str) -> Iterator[BinaryIO]:
+        """Write a new entry through the yielded file object."""
+        path = self.path_for(key)
+        replaced = _size_or_zero(path)
+        with atomic_output(path) as file:
+            yield file
+        added = _size_or_zero(path) - replaced
+        with self._lock:
+            if self._size is not None:
+                self._size += added
+            size = self._size
+        if size is None or size > self.max_size:
+            self.evict(keep=key)
+
+    def put(self, key: str, data: bytes) -> None:
+        with self.store(key) as file:
+            file.write(data)
+
+    def copy_to(self, path: Path, output: Union[str, os.PathLike, BinaryIO]) -> int:
+        """Copy a cached PDF into output, a path or a writable binary object."""
+        with open(path, "rb") as source:
+            if hasattr(output, "write"):
+                shutil.copyfileobj(source, output)
+            else:
+                with atomic_output(output) as file:
+                    shutil.copyfileobj(source, file)
+        return path.stat().st_size
+
+    # 🧹 eviction
+
+    def evict(self, keep: Optional[str] = None) -> None:
+        """Remove the least recently used entries above the size limit.
+
+        keep: the key of an entry that must survive, e.g. the one just stored.
+        """
+        entries = []
+        total = 0
+        for path in self.directory.glob("*.pdf"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_size:
+                break
+            if keep is not None and path.stem == keep:
+                continue
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+            with self._lock:
+                self.evictions += 1
+        with self._lock:
+            self._size = total
+
+    def clear(self) -> None:
+        for path in self.directory.glob("*.pdf"):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+        with self._lock:
+            self._size = 0
+
+    # 📊 stats
+
+    def get_stats(self) -> Dict[str, int]:
+        entries = list(self.directory.glob("*.pdf"))
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(entries),
+                "size": sum(_size_or_zero(path) for path in entries),
+            }
+
+
+# 🔒 private
+
+
+def _update(digest, name: str, value: str) -> None:
+    digest.update(name.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(value.encode("utf-8"))
+    digest.update(b"\0")
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _size_or_zero(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+def _collect_local_assets(
+    text: str,
+    base_dir: Path,
+    *,
+    is_css: bool,
+    seen: Optional[Set[Path]] = None,
+) -> Set[Path]:
+    """Collect the existing local files linked from HTML or CSS text.
+
+    Linked CSS files are followed, so fonts and images they use
+    also become part of the key.
+    """
+    seen = set() if seen is None else seen
+
+    links = []
+    if not is_css:
+        for value in _HTML_LINK_RE.findall(text):
+            value = value.strip("\"'")
+            # * srcset: "a.png 1x, b.png 2x"
+            for candidate in value.split(","):
+                candidate = candidate.strip()
+                if candidate:
+                    links.append(candidate.split()[0])
+    for url_value, import_value in _CSS_LINK_RE.findall(text):
+        links.append((url_value or import_value).strip("\"'"))
+
+    for link in links:
+        path = _resolve_local_path(link, base_dir)
+        if path is None or path in seen:
+            continue
+        seen.add(path)
+        if path.suffix.lower() in _CSS_SUFFIXES:
+            try:
+                css = path.read_text(encoding="utf-8", errors="replace")
+            except OSError:
+                continue
+            _collect_local_assets(css, path.parent, is_css=True, seen=seen)
+    return seen
+
+
+def _resolve_local_path(link: str, base_dir: Path) -> Optional[Path]:
+    if not link or link.startswith(("#", "data:", "javascript:", "mailto:")):
+        return None
+    parts = urlsplit(link)
+    if parts.scheme == "file":
+        path = Path(unquote(parts.path))
+    elif parts.scheme or parts.netloc:
+        # * Remote resources are not part of the key.
+        return None
+    else:
+        path = base_dir / unquote(parts.path)
+    try:
+        path = path.resolve()
+    except OSError:
+        return None
+    return path if path.is_file() else None
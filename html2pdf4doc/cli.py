@@ -0,0 +1,253 @@
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import util as multiprocessing_util
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+from html2pdf4doc.cache import RenderCache
+from html2pdf4doc.converter import convert_to
+from html2pdf4doc.pool import ChromePool
+
+# * Rough memory budget of one headless Chrome worker rendering a large
+# * document. Used to keep the default number of jobs within the memory limits.
+WORKER_MEMORY_BUDGET_MB = 768
+
+# Each process of the pool keeps its own warm Chrome worker.
+_worker_pool: Optional[ChromePool] = None
+_worker_cache: Optional[RenderCache] = None
+
+
+class Result(NamedTuple):
+    source: Path
+    output: Path
+    seconds: float
+    size: int
+    error: Optional[str]
+    cached: bool = False
+
+
+def default_jobs() -> int:
+    cpus = os.cpu_count() or 1
+    available_mb = available_memory_mb()
+    if available_mb is None:
+        return cpus
+    return max(1, min(cpus, available_mb // WORKER_MEMORY_BUDGET_MB))
+
+
+def available_memory_mb() -> Optional[int]:
+    # * MemAvailable counts the page cache and the reclaimable memory
+    # * as well; the free memory (SC_AVPHYS_PAGES) is only a fraction of it
+    # * on a system that has been running for a while.
+    try:
+        with open("/proc/meminfo", encoding="utf-8") as meminfo:
+            for line in meminfo:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) // 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        return (
+            os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+        ) // (1024 * 1024)
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def collect_documents(input_dir: Path, pattern: str) -> List[Path]:
+    return sorted(
+        path for path in input_dir.glob(pattern) if path.is_file()
+    )
+
+
+def convert_directory(
+    input_dir: Path,
+    output_dir: Path,
+    *,
+    jobs: int,
+    config: Optional[Dict[str, str]] = None,
+    pattern: str = "**/*.html",
+    timeout: float = 120,
+    cache_dir: Optional[Path] = None,
+    cache_size_mb: int = 1024,
+) -> List[Result]:
+    documents = collect_documents(input_dir, pattern)
+    tasks = [
+        (
+            source,
+            output_dir / source.relative_to(input_dir).with_suffix(".pdf"),
+        )
+        for source in documents
+    ]
+    if not tasks:
+        return []
+
+    results: List[Result] = []
+    jobs = max(1, min(jobs, len(tasks)))
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_worker,
+        initargs=(cache_dir, cache_size_mb),
+    ) as executor:
+        futures = [
+            executor.submit(_convert_one, source, output, config, timeout)
+            for source, output in tasks
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            _print_progress(result, input_dir)
+            results.append(result)
+
+    results.sort(key=lambda result: str(result.source))
+    return results
+
+
+def print_summary(results: List[Result], input_dir: Path, wall_seconds: float) -> None:
+    print("")  # noqa: T201
+    print(f"{'Document':<60} {'Time, s':>9} {'Size, KB':>10}")  # noqa: T201
+    for result in results:
+        name = str(result.source.relative_to(input_dir))
+        if result.error is None:
+            print(  # noqa: T201
+                f"{name:<60} {result.seconds:>9.2f} {result.size / 1024:>10.1f}"
+                + (" (cached)" if result.cached else "")
+            )
+        else:
+            print(f"{name:<60} {result.seconds:>9.2f} {'FAILED':>10}")  # noqa: T201
+
+    failed = sum(1 for result in results if result.error is not None)
+    total_seconds = sum(result.seconds for result in results)
+    print("")  # noqa: T201
+    print(  # noqa: T201
+        f"Converted {len(results) - failed}/{len(results)} documents "
+        f"in {wall_seconds:.2f}s "
+        f"(sum of document times: {total_seconds:.2f}s)."
+    )
+    cached = sum(1 for result in results if result.cached)
+    if cached:
+        print(f"Cache hits: {cached}/{len(results)}.")  # noqa: T201
+
+
+def parse_config(items: List[str]) -> Dict[str, str]:
+    config: Dict[str, str] = {}
+    for item in items:
+        if "=" not in item:
+            raise argparse.ArgumentTypeError(
+                f"config must be given as key=value: {item}"
+            )
+        key, value = item.split("=", 1)
+        config[key.strip()] = value.strip()
+    return config
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="html2pdf4doc",
+        description="Convert a directory of HTML documents to PDF.",
+    )
+    parser.add_argument("input_dir", type=Path)
+    parser.add_argument(
+        "-o", "--output-dir", type=Path, default=None,
+        help="where to write the PDFs (default: the input directory)",
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=default_jobs(),
+        help="number of parallel browser workers "
+             "(default: CPU count, limited by the available memory)",
+    )
+    parser.add_argument(
+        "--pattern", default="**/*.html",
+        help="glob pattern of the documents (default: **/*.html)",
+    )
+    parser.add_argument(
+        "--config", action="append", default=[], metavar="KEY=VALUE",
+        help="engine option, as a data-* attribute, e.g. --config paper-width=148.5mm",
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=120,
+        help="seconds to wait for one document (default: 120)",
+    )
+    parser.add_argument(
+        "--cache-dir", type=Path, default=None,
+        help="directory of the render cache; unchanged documents are not rendered again",
+    )
+    parser.add_argument(
+        "--cache-size-mb", type=int, default=1024,
+        help="size limit of the render cache (default: 1024)",
+    )
+    args = parser.parse_args(argv)
+
+    input_dir: Path = args.input_dir.resolve()
+    if not input_dir.is_dir():
+        parser.error(f"not a directory: {input_dir}")
+    output_dir: Path = (args.output_dir or input_dir).resolve()
+
+    try:
+        config = parse_config(args.config)
+    except argparse.ArgumentTypeError as exception:
+        parser.error(str(exception))
+
+    started = time.perf_counter()
+    results = convert_directory(
+        input_dir,
+        output_dir,
+        jobs=args.jobs,
+        config=config,
+        pattern=args.pattern,
+        timeout=args.timeout,
+        cache_dir=args.cache_dir,
+        cache_size_mb=args.cache_size_mb,
+    )
+    if not results:
+        print(f"No documents matching {args.pattern} in {input_dir}")  # noqa: T201
+        return 1
+
+    print_summary(results, input_dir, time.perf_counter() - started)
+    return 1 if any(result.error is not None for result in results) else 0
+
+
+# 🔒 private
+
+
+def _init_worker(cache_dir: Optional[Path], cache_size_mb: int) -> None:
+    global _worker_pool, _worker_cache  # pylint: disable=global-statement
+    if cache_dir is not None:
+        _worker_cache = RenderCache(cache_dir, cache_size_mb)
+    _worker_pool = ChromePool(1, idle_timeout=0)
+    # * atexit handlers do not run in the pool processes,
+    # * multiprocessing finalizers do.
+    multiprocessing_util.Finalize(None, _worker_pool.close, exitpriority=10)
+
+
+def _convert_one(
+    source: Path,
+    output: Path,
+    config: Optional[Dict[str, str]],
+    timeout: float,
+) -> Result:
+    started = time.perf_counter()
+    hits = _worker_cache.hits if _worker_cache is not None else 0
+    try:
+        size = convert_to(
+            source, output, config,
+            pool=_worker_pool, timeout=timeout, cache=_worker_cache,
+        )
+    except Exception as exception:  # pylint: disable=broad-except
+        return Result(
+            source, output, time.perf_counter() - started, 0,
+            f"{type(exception).__name__}: {exception}",
+        )
+    cached = _worker_cache is not None and _worker_cache.hits > hits
+    return Result(
+        source, output, time.perf_counter() - started, size, None, cached
+    )
+
+
+def _print_progress(result: Result, input_dir: Path) -> None:
+    name = result.source.relative_to(input_dir)
+    if result.error is None:
+        print(f"-> {name} ({result.seconds:.2f}s)")  # noqa: T201
+    else:
+        print(f"-> {name} FAILED: {result.error}", file=sys.stderr)  # noqa: T201
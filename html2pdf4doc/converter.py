@@ -0,0 +1,103 @@
+import atexit
+import os
+import threading
+from typing import BinaryIO, Optional, Union
+
+from html2pdf4doc.cache import RenderCache
+from html2pdf4doc.document import Config, prepared_document
+from html2pdf4doc.files import atomic_output
+from html2pdf4doc.pool import ChromePool
+
+_default_pool: Optional[ChromePool] = None
+_default_pool_lock = threading.Lock()
+
+
+def get_default_pool() -> ChromePool:
+    """Return the process-wide pool used by convert() when no pool is given.
+
+    Its size can be set with the HTML2PDF4DOC_POOL_SIZE environment variable.
+    """
+    global _default_pool  # pylint: disable=global-statement
+    with _default_pool_lock:
+        if _default_pool is None:
+            size = int(os.environ.get("HTML2PDF4DOC_POOL_SIZE", "1"))
+            _default_pool = ChromePool(size)
+            atexit.register(_default_pool.close)
+        return _default_pool
+
+
+def convert(
+    html_or_path: Union[str, os.PathLike],
+    config: Optional[Config] = None,
+    *,
+    pool: Optional[ChromePool] = None,
+    bundle_path: Optional[Union[str, os.PathLike]] = None,
+    timeout: float = 60,
+    cache: Optional[RenderCache] = None,
+) -> bytes:
+    """Render an HTML document to PDF and return the PDF bytes.
+
+    html_or_path: an HTML string or a path to an HTML file.
+    config: the engine options, as the data-* attributes of the bundle
+      <script> tag, e.g. {"paperWidth": "148.5mm", "printTopMargin": "10mm"}.
+    pool: the Chrome pool to render with, the default pool otherwise.
+    bundle_path: the bundle to add to documents that do not include one.
+    timeout: seconds to wait for a worker and for the pagination.
+    cache: a render cache; on a hit, the stored PDF is returned
+      without starting a browser.
+
+    Example:
+        pdf = html2pdf4doc.convert("docs/index.html", {"paperWidth": "148.5mm"})
+    """
+    key = None
+    if cache is not None:
+        key = cache.key_for(html_or_path, config, bundle_path)
+        pdf = cache.get(key)
+        if pdf is not None:
+            return pdf
+
+    pool = pool or get_default_pool()
+    with prepared_document(html_or_path, config, bundle_path) as url:
+        pdf = pool.render(url, timeout)
+
+    if cache is not None:
+        cache.put(key, pdf)
+    return pdf
+
+
+def convert_to(
+    html_or_path: Union[str, os.PathLike],
+    output: Union[str, os.PathLike, BinaryIO],
+    config: Optional[Config] = None,
+    *,
+    pool: Optional[ChromePool] = None,
+    bundle_path: Optional[Union[str, os.PathLike]] = None,
+    timeout: float = 60,
+    cache: Optional[RenderCache] = None,
+) -> int:
+    """Render an HTML document to PDF, streaming the PDF into output.
+
+    output: a path, written atomically, or a writable binary object.
+    The PDF is transferred from Chrome in chunks (see print_to_pdf),
+    so the memory used does not grow with the size of the PDF.
+    The other arguments are the same as in convert().
+    Returns the size of the PDF in bytes.
+    """
+    if cache is not None:
+        key = cache.key_for(html_or_path, config, bundle_path)
+        path = cache.lookup(key)
+        if path is None:
+            # * Streamed into the cache first, then copied to the output.
+            pool = pool or get_default_pool()
+            with prepared_document(html_or_path, config, bundle_path) as url:
+                with cache.store(key) as file:
+                    pool.render_to(url, file, timeout)
+            path = cache.path_for(key)
+        return cache.copy_to(path, output)
+
+    pool = pool or get_default_pool()
+    with prepared_document(html_or_path, config, bundle_path) as url:
+        if hasattr(output, "write"):
+            return pool.render_to(url, output, timeout)
+        with atomic_output(output) as file:
+            return pool.render_to(url, file, timeout)
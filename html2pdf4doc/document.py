@@ -0,0 +1,192 @@
+import os
+import re
+import shutil
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Union
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_BUNDLE_PATH = REPO_ROOT / "dist" / "bundle.js"
+
+# The engine reads its configuration from the data-* attributes
+# of the <script> tag that loads the bundle (see src/index.js).
+_BUNDLE_SCRIPT_RE = re.compile(
+    r"<script\b[^>]*\bsrc\s*=\s*[\"'][^\"']*bundle\.js(?:\?[^\"']*)?[\"'][^>]*>",
+    re.IGNORECASE,
+)
+_HEAD_OPEN_RE = re.compile(r"<head\b[^>]*>", re.IGNORECASE)
+_HEAD_CLOSE_RE = re.compile(r"</head\s*>", re.IGNORECASE)
+_BASE_RE = re.compile(r"<base\b", re.IGNORECASE)
+_DATA_ATTRIBUTE_RE = re.compile(
+    r"\s(data-[\w-]+)(?:\s*=\s*(\"[^\"]*\"|'[^']*'|[^\s>]+))?",
+    re.IGNORECASE,
+)
+_DOCTYPE_RE = re.compile(r"^\s*<!doctype[^>]*>", re.IGNORECASE)
+
+Config = Dict[str, Union[str, int, float, bool]]
+
+
+def config_to_data_attributes(config: Optional[Config]) -> Dict[str, str]:
+    """Convert a config mapping into the data-* attributes read by the App.
+
+    Keys may be given in the dataset form (camelCase, e.g. "paperWidth"),
+    in the attribute form without the prefix (e.g. "paper-width")
+    or as full attribute names (e.g. "data-paper-width").
+    Booleans are passed as "true"/"false", as in the HTML markup.
+
+    Example:
+        config_to_data_attributes({"paperWidth": "148.5mm", "mask": False})
+        -> {"data-paper-width": "148.5mm", "data-mask": "false"}
+    """
+    attributes: Dict[str, str] = {}
+    for key, value in (config or {}).items():
+        name = key if key.startswith("data-") else "data-" + re.sub(
+            r"(?<!^)(?=[A-Z])", "-", key
+        ).lower()
+        if isinstance(value, bool):
+            value = "true" if value else "false"
+        attributes[name] = str(value)
+    return attributes
+
+
+def effective_data_attributes(markup: str, config: Optional[Config]) -> Dict[str, str]:
+    """Return the data-* attributes the App will read for this markup and config.
+
+    These are the attributes of the bundle <script> tag of the markup,
+    overridden by the config, as done by inject_bundle().
+    """
+    attributes: Dict[str, str] = {}
+    match = _BUNDLE_SCRIPT_RE.search(markup)
+    if match:
+        for name, value in _DATA_ATTRIBUTE_RE.findall(match.group(0)):
+            attributes[name.lower()] = value.strip("\"'")
+    attributes.update(config_to_data_attributes(config))
+    return dict(sorted(attributes.items()))
+
+
+def is_html_markup(html_or_path: Union[str, os.PathLike]) -> bool:
+    if isinstance(html_or_path, os.PathLike):
+        return False
+    return "<" in html_or_path
+
+
+def read_source(html_or_path: Union[str, os.PathLike]):
+    """Return (markup, base_dir, path) for an HTML string or an HTML file."""
+    if is_html_markup(html_or_path):
+        return str(html_or_path), Path.cwd(), None
+    path = Path(html_or_path).resolve()
+    if not path.is_file():
+        raise FileNotFoundError(f"HTML document does not exist: {path}")
+    return path.read_text(encoding="utf-8"), path.parent, path
+
+
+def inject_bundle(
+    markup: str,
+    config: Optional[Config] = None,
+    bundle_path: Optional[Union[str, os.PathLike]] = None,
+    base_dir: Optional[Path] = None,
+) -> str:
+    """Make sure the markup loads the bundle with the requested config.
+
+    If the document already includes the bundle, the config attributes
+    are merged into its <script> tag (the new values win).
+    Otherwise a <script> tag pointing to bundle_path is added to <head>.
+    A <base> tag is added so that relative links keep resolving against
+    base_dir when the markup is served from a temporary location.
+    """
+    attributes = config_to_data_attributes(config)
+
+    match = _BUNDLE_SCRIPT_RE.search(markup)
+    if match:
+        tag = match.group(0)
+        for name in attributes:
+            # The first occurrence of an attribute wins in HTML,
+            # so the existing values must be dropped before adding new ones.
+            tag = re.sub(
+                rf"\s{re.escape(name)}(?:\s*=\s*(?:\"[^\"]*\"|'[^']*'|[^\s>]+))?(?=[\s/>])",
+                "",
+                tag,
+                flags=re.IGNORECASE,
+            )
+        tag = tag[:-1] + _format_attributes(attributes) + ">"
+        markup = markup[:match.start()] + tag + markup[match.end():]
+    else:
+        bundle = Path(bundle_path or DEFAULT_BUNDLE_PATH).resolve()
+        if not bundle.is_file():
+            raise FileNotFoundError(
+                f"html2pdf4doc bundle does not exist: {bundle}. "
+                "Build it with `npm run build` or pass bundle_path."
+            )
+        script = (
+            f'<script src="{bundle.as_uri()}"'
+            f"{_format_attributes(attributes)}></script>"
+        )
+        markup = _insert_into_head(markup, script, at_start=False)
+
+    if base_dir is not None and not _BASE_RE.search(markup):
+        base = f'<base href="{Path(base_dir).resolve().as_uri()}/">'
+        markup = _insert_into_head(markup, base, at_start=True)
+
+    return markup
+
+
+@contextmanager
+def prepared_document(
+    html_or_path: Union[str, os.PathLike],
+    config: Optional[Config] = None,
+    bundle_path: Optional[Union[str, os.PathLike]] = None,
+) -> Iterator[str]:
+    """Yield a file:// URL of the document, ready to be opened by a browser.
+
+    An existing HTML file that already loads the bundle and needs no config
+    is opened as is. In all other cases, the prepared markup is written
+    to a temporary directory, which is removed on exit.
+    """
+    markup, base_dir, path = read_source(html_or_path)
+
+    if path is not None and not config and _BUNDLE_SCRIPT_RE.search(markup):
+        yield path.as_uri()
+        return
+
+    markup = inject_bundle(markup, config, bundle_path, base_dir)
+    temp_dir = tempfile.mkdtemp(prefix="html2pdf4doc-")
+    try:
+        name = path.name if path is not None else "index.html"
+        temp_path = Path(temp_dir) / name
+        temp_path.write_text(markup, encoding="utf-8")
+        yield temp_path.as_uri()
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def _format_attributes(attributes: Dict[str, str]) -> str:
+    return "".join(
+        f' {name}="{_escape_attribute(value)}"'
+        for name, value in attributes.items()
+    )
+
+
+def _escape_attribute(value: str) -> str:
+    return (
+        value.replace("&", "&amp;")
+        .replace('"', "&quot;")
+        .replace("<", "&lt;")
+    )
+
+
+def _insert_into_head(markup: str, snippet: str, *, at_start: bool) -> str:
+    if at_start:
+        match = _HEAD_OPEN_RE.search(markup)
+        if match:
+            return markup[:match.end()] + snippet + markup[match.end():]
+    else:
+        match = _HEAD_CLOSE_RE.search(markup)
+        if match:
+            return markup[:match.start()] + snippet + markup[match.start():]
+    # * No <head>: keep the doctype first, otherwise the page
+    # * falls back to the quirks mode.
+    match = _DOCTYPE_RE.search(markup)
+    if match:
+        return markup[:match.end()] + snippet + markup[match.end():]
+    return snippet + markup
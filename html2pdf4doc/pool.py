@@ -0,0 +1,363 @@
+import base64
+import io
+import threading
+import time
+from contextlib import contextmanager
+from typing import BinaryIO, Dict, Iterator, List, Optional
+
+from chromedriver_py import binary_path
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.chrome.service import Service
+
+# Elements should appear in the DOM on success (see App.render):
+_SUCCESS_SELECTOR = "html2pdf4doc-root[success]"
+
+# * Resolves with the result of the render (see App._exposeReady).
+# * Bundles without window.html2pdf4doc.ready are polled instead.
+_WAIT_FOR_READY_SCRIPT = """
+const done = arguments[arguments.length - 1];
+const api = window.html2pdf4doc;
+if (!api || !api.ready) {
+  done(null);
+  return;
+}
+api.ready.then(
+  (result) => done(result),
+  (error) => done({ success: false, error: String(error) }),
+);
+"""
+
+# * The page size and margins come from the @page rule generated by the engine
+# * (see Style._pageRule), so Chrome must not override them.
+PRINT_OPTIONS = {
+    "printBackground": True,
+    "preferCSSPageSize": True,
+}
+
+
+# * Size of the IO.read chunks of the streamed PDF.
+# * The peak memory of printing does not depend on the PDF size, only on this.
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+
+class ConversionError(RuntimeError):
+    pass
+
+
+def print_to_pdf(
+    driver,
+    output: BinaryIO,
+    options: Optional[Dict] = None,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> int:
+    """Print the current page of a Chrome driver to PDF, streaming it into output.
+
+    Instead of receiving the whole PDF as one base64 string in a JSON frame,
+    Chrome is asked to keep the PDF as a stream (transferMode: ReturnAsStream),
+    which is then read chunk by chunk with IO.read and written to output.
+    Returns the number of bytes written.
+    """
+    result = driver.execute_cdp_cmd("Page.printToPDF", {
+        **(PRINT_OPTIONS if options is None else options),
+        "transferMode": "ReturnAsStream",
+    })
+    handle = result["stream"]
+    written = 0
+    try:
+        while True:
+            chunk = driver.execute_cdp_cmd("IO.read", {
+                "handle": handle,
+                "size": chunk_size,
+            })
+            data = chunk.get("data", "")
+            if data:
+                if chunk.get("base64Encoded", False):
+                    data = base64.b64decode(data)
+                else:
+                    data = data.encode("latin-1")
+                output.write(data)
+                written += len(data)
+            if chunk.get("eof", False):
+                return written
+    finally:
+        driver.execute_cdp_cmd("IO.close", {"handle": handle})
+
+
+class ChromeWorker:
+    """A long-lived headless Chrome that renders documents one after another.
+
+    The browser itself is kept for the whole life of the worker,
+    only the tab is replaced (see recycle_tab) to drop the memory
+    accumulated by the previous documents.
+    """
+
+    def __init__(self, chrome_arguments: Optional[List[str]] = None) -> None:
+        options = webdriver.ChromeOptions()
+        options.add_argument("--headless=new")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--allow-file-access-from-files")
+        for argument in chrome_arguments or []:
+            options.add_argument(argument)
+
+        self.driver = webdriver.Chrome(
+            service=Service(executable_path=binary_path),
+            options=options,
+        )
+        self.documents_in_tab: int = 0
+        self.documents_total: int = 0
+        self.last_used: float = time.monotonic()
+        # The result of the last render: success, pageCount, timings, validations.
+        self.last_result: Optional[Dict] = None
+        self._enable_metrics()
+
+    def render(self, url: str, timeout: float) -> bytes:
+        """Open the URL, wait for the pagination to finish and print to PDF."""
+        buffer = io.BytesIO()
+        self.render_to(url, buffer, timeout)
+        return buffer.getvalue()
+
+    def render_to(self, url: str, output: BinaryIO, timeout: float) -> int:
+        """Same as render(), but streams the PDF into output.
+
+        Returns the number of bytes written.
+        """
+        self.driver.get(url)
+        self.last_result = self.wait_for_ready(timeout)
+
+        written = print_to_pdf(self.driver, output)
+
+        self.documents_in_tab += 1
+        self.documents_total += 1
+        self.last_used = time.monotonic()
+        return written
+
+    def wait_for_ready(self, timeout: float) -> Dict:
+        """Block until the engine reports the end of the render.
+
+        A single asynchronous script waits for the window.html2pdf4doc.ready
+        promise, instead of polling the DOM through WebDriver.
+        """
+        self.driver.set_script_timeout(timeout)
+        try:
+            result = self.driver.execute_async_script(_WAIT_FOR_READY_SCRIPT)
+        except TimeoutException as exception:
+            raise ConversionError(
+                f"html2pdf4doc did not finish within {timeout}s: "
+                f"{self.driver.current_url}"
+            ) from exception
+
+        if result is None:
+            self.wait_for_success(timeout)
+            return {"success": True}
+        if not result.get("success"):
+            raise ConversionError(
+                f"html2pdf4doc failed to render {self.driver.current_url}: "
+                f"{result.get('error', result)}"
+            )
+        return result
+
+    def wait_for_success(self, timeout: float, poll_interval: float = 0.05) -> None:
+        deadline = time.monotonic() + timeout
+        while True:
+            if self.driver.execute_script(
+                "return document.readyState === 'complete'"
+                f" && !!document.querySelector('{_SUCCESS_SELECTOR}');"
+            ):
+                return
+            if time.monotonic() > deadline:
+                raise ConversionError(
+                    f"html2pdf4doc did not finish within {timeout}s: "
+                    f"{self.driver.current_url}"
+                )
+            time.sleep(poll_interval)
+
+    def get_js_heap_size(self) -> int:
+        """Return the JS heap size of the current tab, in bytes."""
+        result = self.driver.execute_cdp_cmd("Performance.getMetrics", {})
+        for metric in result.get("metrics", []):
+            if metric["name"] == "JSHeapTotalSize":
+                return int(metric["value"])
+        return 0
+
+    def recycle_tab(self) -> None:
+        """Replace the current tab with a fresh one."""
+        old_handle = self.driver.current_window_handle
+        self.driver.switch_to.new_window("tab")
+        new_handle = self.driver.current_window_handle
+        self.driver.switch_to.window(old_handle)
+        self.driver.close()
+        self.driver.switch_to.window(new_handle)
+        self.documents_in_tab = 0
+        self._enable_metrics()
+
+    def quit(self) -> None:
+        try:
+            self.driver.quit()
+        except WebDriverException:
+            pass
+
+    def _enable_metrics(self) -> None:
+        self.driver.execute_cdp_cmd("Performance.enable", {})
+
+
+class ChromePool:
+    """A pool of warm headless Chrome workers.
+
+    Workers are started lazily, up to `size`, and are reused between
+    documents, so that the browser launch is paid once per worker
+    and not once per document.
+
+    - `max_documents_per_tab`: the tab is recycled after this number
+      of documents;
+    - `max_memory_mb`: the tab is recycled when its JS heap grows above
+      this threshold (0 disables the check);
+    - `idle_timeout`: workers unused for this number of seconds are quit
+      by a background reaper (0 disables reaping).
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        *,
+        max_documents_per_tab: int = 50,
+        max_memory_mb: int = 1024,
+        idle_timeout: float = 300,
+        chrome_arguments: Optional[List[str]] = None,
+    ) -> None:
+        assert size > 0, size
+        self.size: int = size
+        self.max_documents_per_tab: int = max_documents_per_tab
+        self.max_memory_mb: int = max_memory_mb
+        self.idle_timeout: float = idle_timeout
+        self.chrome_arguments: Optional[List[str]] = chrome_arguments
+
+        self._idle: List[ChromeWorker] = []
+        self._started: int = 0
+        self._closed: bool = False
+        self._condition = threading.Condition()
+
+        self._reaper: Optional[threading.Thread] = None
+        if idle_timeout > 0:
+            self._reaper = threading.Thread(
+                target=self._reap_idle_workers,
+                name="html2pdf4doc-pool-reaper",
+                daemon=True,
+            )
+            self._reaper.start()
+
+    def __enter__(self) -> "ChromePool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @contextmanager
+    def worker(self, timeout: Optional[float] = None) -> Iterator[ChromeWorker]:
+        """Borrow a worker for the duration of the `with` block."""
+        worker = self._acquire(timeout)
+        broken = True
+        try:
+            yield worker
+            broken = False
+        finally:
+            self._release(worker, broken=broken)
+
+    def render(self, url: str, timeout: float = 60) -> bytes:
+        with self.worker(timeout) as worker:
+            return worker.render(url, timeout)
+
+    def render_to(self, url: str, output: BinaryIO, timeout: float = 60) -> int:
+        with self.worker(timeout) as worker:
+            return worker.render_to(url, output, timeout)
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._started -= len(idle)
+            self._condition.notify_all()
+        for worker in idle:
+            worker.quit()
+
+    # 🔒 private
+
+    def _acquire(self, timeout: Optional[float]) -> ChromeWorker:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise ConversionError("The Chrome pool is closed.")
+                if self._idle:
+                    # * LIFO: the most recently used worker is the warmest one,
+                    # * and the rest of them can be reaped sooner.
+                    return self._idle.pop()
+                if self._started < self.size:
+                    self._started += 1
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise ConversionError(
+                        f"No Chrome worker became available within {timeout}s."
+                    )
+                self._condition.wait(remaining)
+
+        try:
+            return ChromeWorker(self.chrome_arguments)
+        except Exception:
+            with self._condition:
+                self._started -= 1
+                self._condition.notify()
+            raise
+
+    def _release(self, worker: ChromeWorker, broken: bool) -> None:
+        if not broken:
+            try:
+                self._maybe_recycle_tab(worker)
+            except WebDriverException:
+                broken = True
+
+        with self._condition:
+            if broken or self._closed:
+                self._started -= 1
+            else:
+                worker.last_used = time.monotonic()
+                self._idle.append(worker)
+            self._condition.notify()
+
+        if broken or self._closed:
+            worker.quit()
+
+    def _maybe_recycle_tab(self, worker: ChromeWorker) -> None:
+        if (
+            self.max_documents_per_tab > 0
+            and worker.documents_in_tab >= self.max_documents_per_tab
+        ):
+            worker.recycle_tab()
+            return
+        if (
+            self.max_memory_mb > 0
+            and worker.get_js_heap_size() > self.max_memory_mb * 1024 * 1024
+        ):
+            worker.recycle_tab()
+
+    def _reap_idle_workers(self) -> None:
+        interval = min(self.idle_timeout, 30)
+        while True:
+            time.sleep(interval)
+            now = time.monotonic()
+            with self._condition:
+                if self._closed:
+                    return
+                expired = [
+                    worker for worker in self._idle
+                    if now - worker.last_used > self.idle_timeout
+                ]
+                self._idle = [
+                    worker for worker in self._idle if worker not in expired
+                ]
+                self._started -= len(expired)
+                if expired:
+                    self._condition.notify_all()
+            for worker in expired:
+                worker.quit()
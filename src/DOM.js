@@ -1,4 +1,6 @@
 import * as Logging from './utils/logging.js';
+import { countOperation } from './utils/counters.js';
+import MeasureCache from './node/cache/measureCache.js';
 
 export default class DocumentObjectModel {
 
@@ -12,6 +14,67 @@ export default class DocumentObjectModel {
     this._debug = config.debugMode ? { ...config.debugConfig.DOM } : {};
     this._assert = config.consoleAssert ? true : false;
     Object.assign(this, Logging);
+
+    // * Layout generation: bumped by every mutation made through this class
+    // * (insert, wrap, move, remove, attributes, styles, innerHTML)
+    // * that touches a node in the document.
+    // * The geometry getters below read through the measure cache,
+    // * whose values are only valid within the generation they were read in,
+    // * so repeated reads between two mutations do not force a layout.
+    this._layoutGeneration = 0;
+    this._measure = new MeasureCache({
+      getGeneration: () => this._layoutGeneration,
+    });
+    // * Structure generation: bumped only by the mutations that change
+    // * the tree in the document (insert, wrap, move, remove, innerHTML).
+    this._structureGeneration = 0;
+  }
+
+  // LAYOUT GENERATION
+
+  getLayoutGeneration() {
+    return this._layoutGeneration;
+  }
+
+  getStructureGeneration() {
+    return this._structureGeneration;
+  }
+
+  getMeasureCache() {
+    return this._measure;
+  }
+
+  // * Must be called after changes made outside of this class
+  // * (direct DOM access, awaited resources, scrolling)
+  // * that may affect the geometry or the tree read before them.
+  invalidateLayout() {
+    this._layoutGeneration += 1;
+    this._structureGeneration += 1;
+  }
+
+  // * The same for changes that may only affect the geometry, not the tree
+  // * (late images and fonts, resizing while the main thread is yielded):
+  // * the structural answers of the ancestor index stay valid.
+  invalidateGeometry() {
+    this._layoutGeneration += 1;
+  }
+
+  // * Writes to nodes that are not in the document (e.g. a slice or a wrapper
+  // * being built before insertion) do not change the layout:
+  // * they are all accounted for by the single insertion that attaches them.
+  // ! Must be called before a structural mutation,
+  // ! while the moved nodes are still in their old place.
+  _invalidateLayoutFor(...nodes) {
+    if (nodes.some(node => node?.isConnected)) {
+      this._layoutGeneration += 1;
+    }
+  }
+
+  // * The same for structural mutations: they change the layout and the tree.
+  _invalidateTreeFor(...nodes) {
+    if (nodes.some(node => node?.isConnected)) {
+      this.invalidateLayout();
+    }
   }
 
   // CREATE ELEMENTS
@@ -24,11 +87,17 @@ export default class DocumentObjectModel {
     return this.document.createDocumentFragment()
   }
 
+  createTextNode(text) {
+    return this.document.createTextNode(text);
+  }
+
   cloneNode(node) {
+    countOperation('clones');
     return node?.cloneNode(true);
   }
 
   cloneNodeWrapper(node) {
+    countOperation('clones');
     return node?.cloneNode(false);
   }
 
@@ -36,36 +105,49 @@ export default class DocumentObjectModel {
 
   insertBefore(element, ...payload) {
     const cleanPayload = payload.filter(el => el != null);
+    countOperation('insertions');
+    this._invalidateTreeFor(element, ...cleanPayload);
     element.before(...cleanPayload);
   }
 
   insertAfter(element, ...payload) {
     const cleanPayload = payload.filter(el => el != null);
+    countOperation('insertions');
+    this._invalidateTreeFor(element, ...cleanPayload);
     element.after(...cleanPayload);
   }
 
   insertAtEnd(element, ...payload) {
     const cleanPayload = payload.filter(el => el != null);
+    countOperation('insertions');
+    this._invalidateTreeFor(element, ...cleanPayload);
     element.append(...cleanPayload);
   }
 
   insertAtStart(element, ...payload) {
     const cleanPayload = payload.filter(el => el != null);
+    countOperation('insertions');
+    this._invalidateTreeFor(element, ...cleanPayload);
     element.prepend(...cleanPayload);
   }
 
   insertInsteadOf(element, ...payload) {
     this.insertBefore(element, ...payload);
+    this._invalidateTreeFor(element);
     element.remove();
   }
 
   wrap(element, wrapper) {
+    countOperation('insertions');
+    this._invalidateTreeFor(element, wrapper);
     element.before(wrapper);
     wrapper.append(element);
     return wrapper;
   }
 
   moveContent(source, target) {
+    countOperation('insertions');
+    this._invalidateTreeFor(source, target);
     while (source.firstChild) {
       target.append(source.firstChild);
     }
@@ -109,6 +191,7 @@ export default class DocumentObjectModel {
   // REMOVE
 
   removeNode(element) {
+    this._invalidateTreeFor(element);
     element.remove();
   }
 
@@ -158,6 +241,13 @@ export default class DocumentObjectModel {
     return item.previousElementSibling
   }
 
+  // * True if `node` is `other` or precedes it in document order
+  // * (an ancestor precedes its descendants).
+  isInDocumentOrder(node, other) {
+    return node === other
+      || !!(node.compareDocumentPosition(other) & this.document.defaultView.Node.DOCUMENT_POSITION_FOLLOWING);
+  }
+
   getParentNode(element) {
     return element.parentElement;
   }
@@ -193,37 +283,65 @@ export default class DocumentObjectModel {
   }
 
   getElementOffsetParent(element) {
-    return element.offsetParent
+    return this._measure.getOffset(element, 'offsetParent', () => {
+      countOperation('layoutReads');
+      return element.offsetParent;
+    });
   }
 
   // GET ELEMENT PROPS
 
+  // * The returned CSSStyleDeclaration is live,
+  // * the cache only saves the getComputedStyle call.
   getComputedStyle(element) {
-    return window.getComputedStyle(element);
+    return this._measure.getStyle(element, undefined, () => {
+      countOperation('computedStyleReads');
+      return window.getComputedStyle(element);
+    });
   }
 
   getElementBCR(element) {
-    return element.getBoundingClientRect();
+    return this._measure.getBCR(element, undefined, () => {
+      countOperation('layoutReads');
+      return element.getBoundingClientRect();
+    });
+  }
+
+  // * Boxes of the text between two offsets of a text node
+  // * (one box per line fragment, none for collapsed whitespace).
+  getTextRangeClientRects(textNode, start, end) {
+    countOperation('layoutReads');
+    const range = this.document.createRange();
+    range.setStart(textNode, start);
+    range.setEnd(textNode, end);
+    return range.getClientRects();
   }
 
   getElementOffsetLeft(element) {
-    return element?.offsetLeft;
+    return this._getOffset(element, 'offsetLeft');
   }
 
   getElementOffsetHeight(element) {
-    return element?.offsetHeight;
+    return this._getOffset(element, 'offsetHeight');
   }
 
   getElementOffsetWidth(element) {
-    return element?.offsetWidth;
+    return this._getOffset(element, 'offsetWidth');
   }
 
   getElementOffsetTop(element) {
-    return element?.offsetTop;
+    return this._getOffset(element, 'offsetTop');
   }
 
   getElementOffsetBottom(element) {
-    return element?.offsetTop + element?.offsetHeight || undefined;
+    return this._getOffset(element, 'offsetTop') + this._getOffset(element, 'offsetHeight') || undefined;
+  }
+
+  _getOffset(element, name) {
+    return this._measure.getOffset(element, name, () => {
+      countOperation('layoutReads');
+      return element[name];
+    });
   }
 
   getElementTagName(element) {
@@ -270,10 +388,12 @@ export default class DocumentObjectModel {
     if (first === '.') {
       const cl = selector.substring(1);
       element.classList.add(cl);
+      this._invalidateLayoutFor(element);
       return
     } else if (first === '#') {
       const id = selector.substring(1);
       element.id = id;
+      this._invalidateLayoutFor(element);
       return
     } else if (first === '[') {
       this.strictAssert(
@@ -281,6 +401,7 @@ export default class DocumentObjectModel {
       );
       const attr = selector.substring(1, selector.length - 1);
       element.setAttribute(attr, (value ? value : ''));
+      this._invalidateLayoutFor(element);
       return
     }
     this.log('setAttribute', `you're really sure ${selector} is a selector?`)
@@ -312,6 +433,7 @@ export default class DocumentObjectModel {
     } else {
       element.style.setProperty(cssProp, String(value), priority);
     }
+    this._invalidateLayoutFor(element);
   }
 
   _toKebab = (key) => {
@@ -324,6 +446,7 @@ export default class DocumentObjectModel {
 
   addClasses(element, ...cls) {
     element.classList.add(...cls);
+    this._invalidateLayoutFor(element);
   }
 
   // REMOVE ATTRIBUTES
@@ -340,10 +463,12 @@ export default class DocumentObjectModel {
     if (first === '.') {
       const cl = selector.substring(1);
       element.classList.remove(cl);
+      this._invalidateLayoutFor(element);
       return
     } else if (first === '#') {
       const id = selector.substring(1);
       element.removeAttribute(id);
+      this._invalidateLayoutFor(element);
       return
     } else if (first === '[') {
       this.strictAssert(
@@ -351,6 +476,7 @@ export default class DocumentObjectModel {
       );
       const attr = selector.substring(1, selector.length - 1);
       element.removeAttribute(attr);
+      this._invalidateLayoutFor(element);
       return
     } else { // a-zA-Z
       // FIXME: invalid attribute variable. `attr` is undefined here and will throw.
@@ -363,18 +489,22 @@ export default class DocumentObjectModel {
     while (element.attributes.length > 0) {
       element.removeAttribute(element.attributes[0].name);
     }
+    this._invalidateLayoutFor(element);
   }
 
   removeClasses(element, ...cls) {
     element.classList.remove(...cls);
+    this._invalidateLayoutFor(element);
   }
 
   removeAllClasses(element) {
     element.classList = '';
+    this._invalidateLayoutFor(element);
   }
 
   removeAllStyles(element) {
     element.style = '';
+    this._invalidateLayoutFor(element);
   }
 
   // GET/SET ELEMENT CONTENT
@@ -401,6 +531,13 @@ export default class DocumentObjectModel {
       // return;
     }
     selector.innerHTML = html;
+    this.invalidateLayout();
+  }
+
+  // * Plain text: no HTML parsing, and no invalidation for detached elements.
+  setTextContent(element, text) {
+    this._invalidateTreeFor(element);
+    element.textContent = text;
   }
 
   // CHECK
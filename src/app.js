@@ -8,26 +8,162 @@ import Paper from './paper.js';
 import Preview from './preview.js';
 import Toc from './toc.js';
 import Validator from './validator.js';
+import Virtualizer from './virtualizer.js';
 import Preloader from './preloader.js';
 import Preprocess from './preprocess/index.js';
 import isTruthy from './utils/isTruthy.js';
 import buildAppConfig from './appConfig.js';
 import { normalizeLegacyConfigParams } from './config.js';
 import { forceLayoutParticipation } from './utils/forceLayoutParticipation.js';
+import { resetTimings, startPhase, endPhase, measureSpans, getTimings } from './utils/timings.js';
+import { resetCounters, stopCountingPages, getCounters } from './utils/counters.js';
 
 const CONSOLE_CSS_LABEL = `color:Gray;border:1px solid;`
 
+// * Public runtime API on window:
+// * window.html2pdf4doc.ready — a promise resolved with the result of the render,
+// * and the 'html2pdf4doc:done' event with the same result in event.detail;
+// * window.html2pdf4doc.timings — per-phase and per-splitter durations
+// * of the last render (see utils/timings.js);
+// * window.html2pdf4doc.counters — operation counters of the last render,
+// * if enabled with data-operation-counters="true" (see utils/counters.js);
+// * the 'html2pdf4doc:progress' event with { pages, elements } in event.detail,
+// * dispatched when the pages are calculated, and also between the time slices
+// * of the pagination with data-time-slicing="true".
+const WINDOW_API = 'html2pdf4doc';
+const DONE_EVENT = 'html2pdf4doc:done';
+const PROGRESS_EVENT = 'html2pdf4doc:progress';
+
 export default class App {
   constructor(params) {
-    this.params = normalizeLegacyConfigParams(params);
-    this.forcedDebugMode = isTruthy(params.forcedDebugMode);
-    this.debugMode = isTruthy(params.debugMode) || this.forcedDebugMode;
-    this.preloader = params.preloader;
+    this._setParams(params);
     this.selector = SELECTOR;
     this.config;
+
+    // * The state of the last render, used by destroy():
+    this._rendering = null;
+    this._preloader = null;
+    this._virtualizer = null;
+    this._DOM = null;
+    this._node = null;
+    this._layout = null;
+
+    // * Pending until the (manual) init is called.
+    this._ready = null;
+    this._exposeReady();
+  }
+
+  render() {
+    this._rendering = this._render().then((result) => {
+      window.dispatchEvent(new CustomEvent(DONE_EVENT, { detail: result }));
+      this._ready.resolve(result);
+      return result;
+    }, (error) => {
+      this._ready.reject(error);
+      throw error;
+    });
+    return this._rendering;
   }
 
-  async render() {
+  /**
+   * Reverts the page to the state before render():
+   * drops the html2pdf4doc-root layers and the inserted styles,
+   * restores the original printable content,
+   * and resets the markers and measurement caches.
+   * Waits for the current render, if any, to finish first.
+   *
+   * @param {Object} [options]
+   * @param {string|Node} [options.content] - Printable content to restore
+   *   instead of the original one (HTML string, node or fragment).
+   */
+  async destroy({ content } = {}) {
+    if (this._rendering) {
+      // * A failed render still has to be cleaned up.
+      await this._rendering.catch(() => {});
+      this._rendering = null;
+    }
+
+    this._preloader && this._preloader.destroy();
+    this._virtualizer && this._virtualizer.destroy();
+    this._layout && this._layout.destroy({ content });
+    this._node && this._node.resetState();
+    this._DOM && this._DOM.getAll('style[data-html2pdf-sanitize]')
+      .forEach((style) => this._DOM.removeNode(style));
+
+    this._preloader = null;
+    this._virtualizer = null;
+    this._DOM = null;
+    this._node = null;
+    this._layout = null;
+
+    // * The page is not rendered anymore.
+    this._exposeReady();
+  }
+
+  /**
+   * Paginates new content and/or with a new config
+   * in the same, already loaded page: no navigation, no bundle parsing.
+   *
+   * @param {Object} [options]
+   * @param {string|Node} [options.content] - New printable content
+   *   (HTML string, node or fragment); the current content if omitted.
+   * @param {Object} [options.config] - Config params to override,
+   *   in the same form as the data-* attributes (dataset keys), e.g. { paperWidth: '148.5mm' }.
+   */
+  async rerender({ content, config } = {}) {
+    await this.destroy({ content });
+    // * The lifecycle is in use: keep the content for the next destroy/rerender.
+    this._setParams({ ...this.params, ...config, keepInitialContent: true });
+    return this.render();
+  }
+
+  _exposeReady() {
+    const ready = {};
+    ready.promise = new Promise((resolve, reject) => {
+      ready.resolve = resolve;
+      ready.reject = reject;
+    });
+    // * Avoid unhandled rejection warnings when nobody waits for the promise.
+    ready.promise.catch(() => {});
+    this._ready = ready;
+
+    window[WINDOW_API] = window[WINDOW_API] || {};
+    window[WINDOW_API].ready = ready.promise;
+  }
+
+  // * Pagination progress: { pages, elements } (pages registered, elements parsed).
+  _reportProgress(progress) {
+    this._preloader && this._preloader.setProgress(progress);
+    window.dispatchEvent(new CustomEvent(PROGRESS_EVENT, { detail: progress }));
+  }
+
+  _result({ success, pageCount = 0, validations = null }) {
+    endPhase('total');
+    measureSpans();
+    const timings = getTimings();
+    const counters = getCounters();
+    window[WINDOW_API] = window[WINDOW_API] || {};
+    window[WINDOW_API].timings = timings;
+    window[WINDOW_API].counters = counters;
+    return {
+      success,
+      pageCount,
+      timings,
+      counters,
+      validations,
+    };
+  }
+
+  _setParams(params) {
+    this.params = normalizeLegacyConfigParams(params);
+    this.forcedDebugMode = isTruthy(this.params.forcedDebugMode);
+    this.debugMode = isTruthy(this.params.debugMode) || this.forcedDebugMode;
+    this.preloader = this.params.preloader;
+  }
+
+  async _render() {
+    resetTimings();
+    startPhase('total');
     console.time("[HTML2PDF4DOC] Total time");
 
     forceLayoutParticipation();
@@ -58,18 +194,22 @@ export default class App {
     if (this.preloader === 'true') {
       preloader.create();
     }
+    this._preloader = preloader;
     this.debugMode && console.timeEnd("⏱️ create Preloader time");
 
     // * process config
+    startPhase('config');
     this.debugMode && console.time("⏱️ Config time");
     this.debugMode && console.groupCollapsed('%c config ', CONSOLE_CSS_LABEL + 'color:LightGray');
     // ** Merging the user configuration (config) with the debugging settings (debugConfig).
     // ** This allows centralized management of logging and other debugging options,
     // ** passing them through the config object to all required classes.
     this.config = buildAppConfig(this.params);
+    resetCounters(this.config.operationCounters);
     this.debugMode && console.groupEnd();
     this.debugMode && console.info('⚙️ Current config with debugConfig:', this.config);
     this.debugMode && console.timeEnd("⏱️ Config time");
+    endPhase('config');
 
     // * `this.config.debugConfig.testSignals.forcedModeLog` is FALSE by default,
     // * and enables by forced debug mode.
@@ -84,6 +224,7 @@ export default class App {
       DOM: window.document,
       config: this.config,
     });
+    this._DOM = DOM;
     this.debugMode && console.timeEnd("⏱️ DOM helpers init time");
 
     this.debugMode && console.time("⏱️ node helpers init time");
@@ -92,6 +233,7 @@ export default class App {
       DOM: DOM,
       selector: this.selector,
     });
+    this._node = node;
     this.debugMode && console.timeEnd("⏱️ node helpers init time");
 
     // * ⏰ window.addEventListener("load")
@@ -111,6 +253,7 @@ export default class App {
 
     // * prepare layout (DOM manipulation)
 
+    startPhase('layout');
     this.debugMode && console.time("⏱️ Layout time");
     this.debugMode && console.groupCollapsed('%c Layout ', CONSOLE_CSS_LABEL);
     const layout = new Layout({
@@ -119,25 +262,32 @@ export default class App {
       selector: this.selector,
       node: node,
     });
+    this._layout = layout;
     layout.create();
     this.debugMode && console.groupEnd();
     this.debugMode && console.timeEnd("⏱️ Layout time");
+    endPhase('layout');
     if (!layout.success) {
       this.debugMode && console.error('Failed to create layout.\n\nWe have to interrupt the process of creating PDF preview.');
-      return
+      return this._result({ success: false });
     } else {
       // this.debugMode && console.log('🚩 layout.success:', layout.success);
     }
 
     // * ensure fonts and external resources are ready for stable layout
+    startPhase('preprocess');
     this.debugMode && console.time("⏱️ Preprocess time");
     this.debugMode && console.groupCollapsed('%c Preprocess ', CONSOLE_CSS_LABEL);
     await new Preprocess(this.config, DOM).run();
+    // * Fonts and images loaded in the meantime change the geometry.
+    DOM.invalidateLayout();
     this.debugMode && console.groupEnd();
     this.debugMode && console.timeEnd("⏱️ Preprocess time");
+    endPhase('preprocess');
 
     // * calculate and prepare 'paper'
     this.debugMode && console.info('%c calculate Paper params ', CONSOLE_CSS_LABEL);
+    startPhase('paper');
     this.debugMode && console.time("⏱️ Paper time");
     const paper = new Paper({
       config: this.config,
@@ -147,18 +297,20 @@ export default class App {
       layout: layout,
     });
     this.debugMode && console.timeEnd("⏱️ Paper time");
+    endPhase('paper');
     if (!paper || !paper.bodyHeight || !paper.bodyWidth) {
       this.debugMode && console.error('Failed to create paper calculations.\n\nWe have to interrupt the process of creating PDF preview.');
-      return
+      return this._result({ success: false });
     } else {
       // this.debugMode && console.log('🚩 paper.bodyHeight:', paper.bodyHeight);
     }
 
     // * calculate pages (DOM manipulation)
 
+    startPhase('pages');
     this.debugMode && console.time("⏱️ Pages time");
     this.debugMode && console.group('%c Pages ', CONSOLE_CSS_LABEL); // Collapsed
-    const pages = new Pages({
+    const pagesCalculator = new Pages({
       config: this.config,
       DOM: DOM,
       selector: this.selector,
@@ -166,12 +318,19 @@ export default class App {
       layout: layout,
       referenceHeight: paper.bodyHeight,
       referenceWidth: paper.bodyWidth,
-    }).calculate();
+    });
+    const onProgress = (progress) => this._reportProgress(progress);
+    const pages = this.config.timeSlicing
+      ? await pagesCalculator.calculateInSlices({ onProgress })
+      : pagesCalculator.calculate({ onProgress });
     this.debugMode && console.groupEnd();
     this.debugMode && console.timeEnd("⏱️ Pages time");
+    stopCountingPages();
+    endPhase('pages');
 
     // * render preview (DOM manipulation)
 
+    startPhase('preview');
     this.debugMode && console.time("⏱️ Preview time");
     this.debugMode && console.groupCollapsed('%c Preview ', CONSOLE_CSS_LABEL);
     const previewValidations = new Preview({
@@ -185,9 +344,11 @@ export default class App {
     }).create();
     this.debugMode && console.groupEnd();
     this.debugMode && console.timeEnd("⏱️ Preview time");
+    endPhase('preview');
 
     // * render TOC page numbers
 
+    startPhase('toc');
     this.debugMode && console.time("⏱️ Toc time");
     new Toc({
       config: this.config,
@@ -197,9 +358,11 @@ export default class App {
       layout: layout,
     }).render();
     this.debugMode && console.timeEnd("⏱️ Toc time");
+    endPhase('toc');
 
     // * perform validations
 
+    startPhase('validator');
     this.debugMode && console.time("⏱️ Validator time");
     // * Force a layout pass before validation by scrolling and waiting 2 frames
     // * so deferred rendering effects show up in measurements (if not neutralized).
@@ -213,7 +376,8 @@ export default class App {
         });
       });
     });
-    new Validator({
+    DOM.invalidateLayout();
+    const validations = new Validator({
       config: this.config,
       DOM: DOM,
       selector: this.selector,
@@ -223,6 +387,18 @@ export default class App {
       previewValidations,
     }).init();
     this.debugMode && console.timeEnd("⏱️ Validator time");
+    endPhase('validator');
+
+    // * virtualize the preview (after the validations, which need all pages)
+
+    if (this.config.previewVirtualization) {
+      this._virtualizer = new Virtualizer({
+        config: this.config,
+        DOM: DOM,
+        selector: this.selector,
+        layout: layout,
+      }).init();
+    }
 
     // * set the attribute that means that rendering is completed successfully
     DOM.setAttribute(layout.root, '[success]');
@@ -235,5 +411,11 @@ export default class App {
 
     console.info(`[HTML2PDF4DOC] Page count:`, pages.length);
     console.timeEnd("[HTML2PDF4DOC] Total time");
+
+    return this._result({
+      success: true,
+      pageCount: pages.length,
+      validations,
+    });
   }
 }
@@ -28,6 +28,40 @@ export default function createConfig(params) {
     // * Note: internal logic uses flag storage/registries; DOM attributes are for debug only.
     markupDebugMode: false,
 
+    // * Operation counters (layout reads, DOM writes, pagination steps)
+    // * per page and in total, exposed as window.html2pdf4doc.counters,
+    // * are enabled in user settings using the parameter
+    // * data-operation-counters="true".
+    // * Disabled by default.
+    operationCounters: false,
+
+    // * Time-sliced pagination for huge documents:
+    // * the pages are calculated in slices of timeSliceMs milliseconds,
+    // * yielding to the main thread between them,
+    // * and the progress is reported by the 'html2pdf4doc:progress' event
+    // * (and by the preloader, if any).
+    // * Enabled in user settings using the parameter
+    // * data-time-slicing="true" (and optionally data-time-slice-ms="16").
+    // * Disabled by default.
+    timeSlicing: false,
+    timeSliceMs: 16,
+
+    // * Virtualization of the preview: after pagination, only the virtual papers
+    // * and page chromes near the viewport are kept in the document,
+    // * and all of them are restored before printing (beforeprint).
+    // * Enabled in user settings using the parameter
+    // * data-preview-virtualization="true".
+    // * Disabled by default.
+    previewVirtualization: false,
+
+    // * Keep an untouched copy of the printable content,
+    // * so that destroy() and rerender() without new content can restore it.
+    // * The copy doubles the memory taken by the content,
+    // * so it is only made on request: data-keep-initial-content="true".
+    // * rerender() enables it for the renders it starts.
+    // * Disabled by default.
+    keepInitialContent: false,
+
     // * Resource waiting timeout in milliseconds.
     resourceTimeoutMs: 2000,
 
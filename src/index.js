@@ -25,3 +25,16 @@ if (!dataset) {
 export function init() {
   isManualInit && app && app.render();
 }
+
+// * Lifecycle of an already rendered page (e.g. a warm browser tab
+// * that serves many documents):
+// * HTML2PDF4DOC.destroy() reverts the page to its original state,
+// * HTML2PDF4DOC.rerender({ content, config }) paginates again,
+// * with new content and/or config.
+export function destroy(options) {
+  return app ? app.destroy(options) : Promise.resolve();
+}
+
+export function rerender(options) {
+  return app ? app.rerender(options) : Promise.resolve();
+}
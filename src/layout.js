@@ -27,8 +27,16 @@ export default class Layout {
     // * private
     this._initialRoot;
     this._contentRoot;
+    // * Untouched copy of the printable content, restored by destroy()
+    // * (only with config.keepInitialContent).
+    this._initialContent;
+    // * Changes in the environment of the root, reverted by destroy().
+    this._printIgnoredElements = [];
+    this._printHiddenElements = [];
+    this._printHiddenTextWrappers = [];
 
     this._config = config;
+    this._keepInitialContent = config.keepInitialContent ? true : false;
     this._debug = config.debugMode ? { ...config.debugConfig.layout } : {};
     this._assert = config.consoleAssert ? true : false;
     this._DOM = DOM;
@@ -71,6 +79,43 @@ export default class Layout {
 
   }
 
+  /**
+   * Reverts everything that create() did:
+   * removes the root with all its layers and the inserted styles,
+   * restores the unprintable environment and puts back the printable content.
+   *
+   * @param {Object} [options]
+   * @param {string|Node} [options.content] - New printable content
+   *   (HTML string, node or fragment) to insert instead of the original one.
+   */
+  destroy({ content } = {}) {
+    this.root && this._DOM.removeNode(this.root);
+
+    this._DOM.getAll(`style${this._selector.style}`)
+      .forEach((style) => this._DOM.removeNode(style));
+
+    this._restoreUnprintableEnvironment();
+
+    if (this._initialRoot) {
+      if (content === undefined) {
+        this._initialContent
+          ? this._DOM.insertAtEnd(this._initialRoot, this._initialContent)
+          : console.warn('The initial content was not kept, so it cannot be restored. Pass the content to destroy() or set data-keep-initial-content="true".');
+      } else if (typeof content === 'string') {
+        this._DOM.setInnerHTML(this._initialRoot, content);
+      } else {
+        this._DOM.insertAtEnd(this._initialRoot, content);
+      }
+    }
+
+    this.root = undefined;
+    this.paperFlow = undefined;
+    this.contentFlow = undefined;
+    this.overlayFlow = undefined;
+    this._initialContent = undefined;
+    this.success = false;
+  }
+
   _getTemplates() {
     this.strictAssert(this._selector.frontpageTemplate, 'frontpageTemplate selector is missing');
     this.strictAssert(this._selector.headerTemplate, 'headerTemplate selector is missing');
@@ -100,6 +145,12 @@ export default class Layout {
     this._createContentFlow();
     this._createOverlayFlow();
 
+    // * Keep an untouched copy of the printable content, if requested:
+    // * the content itself is split and modified during pagination.
+    if (this._keepInitialContent) {
+      this._initialContent = this._createContentSnapshot(this._initialRoot);
+    }
+
     // console.time("moveContent");
     this._DOM.moveContent(this._initialRoot, this.contentFlow);
     // console.timeEnd("moveContent");
@@ -114,6 +165,13 @@ export default class Layout {
     this._ignoreUnprintableEnvironment(this.root);
   }
 
+  _createContentSnapshot(source) {
+    const snapshot = this._DOM.createDocumentFragment();
+    this._DOM.getChildNodes(source)
+      .forEach((child) => this._DOM.insertAtEnd(snapshot, this._DOM.cloneNode(child)));
+    return snapshot;
+  }
+
   _insertContentFlowStartAndEnd(contentFlow) {
     // * add a safeguard elements to the start and end of content flow
     const contentFlowStart = this._node.create(this._selector.contentFlowStart);
@@ -179,18 +237,21 @@ export default class Layout {
     let parentNode = this._DOM.getParentNode(root);
 
     this._DOM.setAttribute(parentNode, this._selector.printIgnore);
+    this._printIgnoredElements.push(parentNode);
 
     this._DOM.getChildNodes(parentNode)
       .forEach((child) => {
 
         if (child !== root && this._DOM.isElementNode(child)) {
           this._DOM.setAttribute(child, this._selector.printHide);
+          this._printHiddenElements.push(child);
 
         } else if (this._node.isSignificantTextNode(child)) {
           // process text nodes
           const textNodeWrapper = this._node.createTextNodeWrapper();
           this._DOM.wrap(child, textNodeWrapper);
           this._DOM.setAttribute(textNodeWrapper, this._selector.printHide);
+          this._printHiddenTextWrappers.push(textNodeWrapper);
 
         } else {
           return
@@ -203,4 +264,17 @@ export default class Layout {
       this._ignoreUnprintableEnvironment(parentNode);
     };
   }
+
+  _restoreUnprintableEnvironment() {
+    this._printIgnoredElements
+      .forEach((element) => this._DOM.removeAttribute(element, this._selector.printIgnore));
+    this._printHiddenElements
+      .forEach((element) => this._DOM.removeAttribute(element, this._selector.printHide));
+    this._printHiddenTextWrappers
+      .forEach((wrapper) => this._DOM.insertInsteadOf(wrapper, ...this._DOM.getChildNodes(wrapper)));
+
+    this._printIgnoredElements = [];
+    this._printHiddenElements = [];
+    this._printHiddenTextWrappers = [];
+  }
 }
@@ -0,0 +1,132 @@
+// Per-render index of answers that need a walk up the ancestor chain.
+// * Structural answers (depth, first/last child chains) are valid within
+// * one structure generation: the owner (DocumentObjectModel) bumps it on
+// * every insertion, removal, wrap or move in the document,
+// * i.e. when slicing changes a subtree, but not on attribute or style writes.
+// * Cumulative offsets (the top of an element within a root) are valid
+// * within one layout generation, like the measure cache.
+// * An answer for an element is built from the answer for its parent,
+// * so each ancestor is walked once per generation, not once per candidate.
+// * Without generation sources, the values live until reset().
+
+export default class AncestorIndex {
+  constructor({ getStructureGeneration, getLayoutGeneration } = {}) {
+    this._getStructureGeneration = getStructureGeneration || null;
+    this._getLayoutGeneration = getLayoutGeneration || null;
+    this._structureGeneration = this._getStructureGeneration ? this._getStructureGeneration() : 0;
+    this._layoutGeneration = this._getLayoutGeneration ? this._getLayoutGeneration() : 0;
+    this._structure = new WeakMap();
+    this._offsets = new WeakMap();
+  }
+
+  // * Depth of the element in the tree (the document is at 0).
+  getDepth(element) {
+    if (!element) return -1;
+    this._syncStructureGeneration();
+    // * Climb to the nearest indexed ancestor, then index the chain below it.
+    const chain = [];
+    let depth = -1;
+    for (let node = element; node; node = node.parentNode) {
+      const bucket = this._structure.get(node);
+      if (bucket?.has('depth')) {
+        depth = bucket.get('depth');
+        break;
+      }
+      chain.push(node);
+    }
+    for (let i = chain.length - 1; i >= 0; i--) {
+      depth += 1;
+      this._getBucket(this._structure, chain[i]).set('depth', depth);
+    }
+    return depth;
+  }
+
+  // * The highest ancestor reached from the element by steps
+  // * "is the first element child of the parent" (the element itself if it is not).
+  getFirstChildChainTop(element) {
+    if (!element) return;
+    this._syncStructureGeneration();
+    const chain = [];
+    let top = element;
+    for (let node = element; node; node = node.parentElement) {
+      const bucket = this._structure.get(node);
+      if (bucket?.has('firstChildChainTop')) {
+        top = bucket.get('firstChildChainTop');
+        break;
+      }
+      chain.push(node);
+      top = node;
+      const parent = node.parentElement;
+      if (!parent || parent.firstElementChild !== node) {
+        break;
+      }
+    }
+    chain.forEach(node => this._getBucket(this._structure, node).set('firstChildChainTop', top));
+    return top;
+  }
+
+  // * Memoized answers of a named walk from the element up to the root.
+  hasAnswer(name, element, root) {
+    this._syncStructureGeneration();
+    return this._structure.get(element)?.get(name)?.has(root) || false;
+  }
+
+  getAnswer(name, element, root) {
+    this._syncStructureGeneration();
+    return this._structure.get(element)?.get(name)?.get(root);
+  }
+
+  setAnswer(name, element, root, value) {
+    this._syncStructureGeneration();
+    const bucket = this._getBucket(this._structure, element);
+    let answers = bucket.get(name);
+    if (!answers) {
+      answers = new Map();
+      bucket.set(name, answers);
+    }
+    answers.set(root, value);
+  }
+
+  // * Memoized cumulative offset of the element within the root.
+  getOffset(element, root, getter) {
+    if (!element) return;
+    this._syncLayoutGeneration();
+    const bucket = this._getBucket(this._offsets, element);
+    if (bucket.has(root)) {
+      return bucket.get(root);
+    }
+    const value = getter();
+    bucket.set(root, value);
+    return value;
+  }
+
+  reset() {
+    this._structure = new WeakMap();
+    this._offsets = new WeakMap();
+  }
+
+  _getBucket(store, element) {
+    let bucket = store.get(element);
+    if (!bucket) {
+      bucket = new Map();
+      store.set(element, bucket);
+    }
+    return bucket;
+  }
+
+  _syncStructureGeneration() {
+    if (!this._getStructureGeneration) return;
+    const generation = this._getStructureGeneration();
+    if (generation === this._structureGeneration) return;
+    this._structureGeneration = generation;
+    this._structure = new WeakMap();
+  }
+
+  _syncLayoutGeneration() {
+    if (!this._getLayoutGeneration) return;
+    const generation = this._getLayoutGeneration();
+    if (generation === this._layoutGeneration) return;
+    this._layoutGeneration = generation;
+    this._offsets = new WeakMap();
+  }
+}
@@ -1,11 +1,16 @@
 import MeasureCache from './measureCache.js';
+import AncestorIndex from './ancestorIndex.js';
 
 // Central per-Node cache state:
-// - measure: short-lived caches for layout reads (BCR/computed styles), reset manually
+// - measure: caches for layout reads (BCR/offsets/computed styles),
+//   shared with DocumentObjectModel and valid per layout generation (see DOM.js)
+// - ancestors: answers of the walks up the ancestor chain,
+//   valid per structure / layout generation (see ancestorIndex.js)
 
 export default class CacheState {
-  constructor() {
-    this.measure = new MeasureCache();
+  constructor({ measure, ancestors } = {}) {
+    this.measure = measure || new MeasureCache();
+    this.ancestors = ancestors || new AncestorIndex();
   }
 
   resetMeasureCache() {
@@ -1,17 +1,32 @@
 // Lightweight caches for expensive layout reads.
+// * The cached values are valid within one layout generation:
+// * the owner (DocumentObjectModel) bumps the generation on every DOM mutation,
+// * and the cache drops everything on the first read of a new generation.
+// * Without a generation source, the values live until reset().
+
+import { countOperation } from '../../utils/counters.js';
 
 const DEFAULT_KEY = 'default';
 
 export default class MeasureCache {
-  constructor() {
+  constructor({ getGeneration } = {}) {
+    this._getGeneration = getGeneration || null;
+    this._generation = this._getGeneration ? this._getGeneration() : 0;
     this._bcr = new WeakMap();
     this._styles = new WeakMap();
+    this._offsets = new WeakMap();
   }
 
   getBCR(element, key = DEFAULT_KEY, getter) {
     if (!element) return;
+    this._syncGeneration();
     const bucket = this._getBucket(this._bcr, element);
-    if (bucket.has(key)) return bucket.get(key);
+    if (bucket.has(key)) {
+      countOperation('measureCacheHits');
+      return bucket.get(key);
+    }
+    countOperation('measureCacheMisses');
+    !getter && countOperation('layoutReads');
     const value = getter ? getter() : element.getBoundingClientRect();
     bucket.set(key, value);
     return value;
@@ -19,22 +34,54 @@ export default class MeasureCache {
 
   getStyle(element, key = DEFAULT_KEY, getter) {
     if (!element) return;
+    this._syncGeneration();
     const bucket = this._getBucket(this._styles, element);
-    if (bucket.has(key)) return bucket.get(key);
+    if (bucket.has(key)) {
+      countOperation('measureCacheHits');
+      return bucket.get(key);
+    }
+    countOperation('measureCacheMisses');
+    !getter && countOperation('computedStyleReads');
     const value = getter ? getter() : window.getComputedStyle(element);
     bucket.set(key, value);
     return value;
   }
 
+  // * offsetTop, offsetHeight, offsetLeft, offsetWidth, offsetParent.
+  getOffset(element, name, getter) {
+    if (!element) return;
+    this._syncGeneration();
+    const bucket = this._getBucket(this._offsets, element);
+    if (bucket.has(name)) {
+      countOperation('measureCacheHits');
+      return bucket.get(name);
+    }
+    countOperation('measureCacheMisses');
+    !getter && countOperation('layoutReads');
+    const value = getter ? getter() : element[name];
+    bucket.set(name, value);
+    return value;
+  }
+
   delete(element) {
     if (!element) return;
     this._bcr.delete(element);
     this._styles.delete(element);
+    this._offsets.delete(element);
   }
 
   reset() {
     this._bcr = new WeakMap();
     this._styles = new WeakMap();
+    this._offsets = new WeakMap();
+  }
+
+  _syncGeneration() {
+    if (!this._getGeneration) return;
+    const generation = this._getGeneration();
+    if (generation === this._generation) return;
+    this._generation = generation;
+    this.reset();
   }
 
   _getBucket(store, element) {
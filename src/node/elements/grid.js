@@ -2,6 +2,7 @@ import * as Logging from '../../utils/logging.js';
 import * as Paginator from './structuredElementPaginator.js';
 import * as PartsRecorder from '../modules/parts.recorder.js';
 import { createLoopGuard } from '../../utils/loopGuard.js';
+import GridTrackIndex from '../utils/gridTrackIndex.js';
 
 const CONSOLE_CSS_END_LABEL = `background:#999;color:#FFF;padding: 0 4px;`;
 
@@ -30,7 +31,6 @@ export default class Grid {
     this._minBreakableGridRows = 1;
     this._minGridRowContentLines = 2; // minimum lines of content a slice must retain in a tail window
     this._gridCellLineHeightCache = new WeakMap();
-    this._gridComputedStyleCache = new WeakMap();
 
     // TODO make function
     // * From config:
@@ -61,7 +61,7 @@ export default class Grid {
     const gridCells = this._node.getPreparedChildren(gridNode);
     this._node.lockNodesWidths(gridCells);
 
-    const nodeComputedStyle = computedStyle ? computedStyle : this._getComputedStyleCached(gridNode);
+    const nodeComputedStyle = computedStyle ? computedStyle : this._DOM.getComputedStyle(gridNode);
     // * Use this._node.setInitStyle:
     // * In some layouts grid stays `position: static`; force a relative context so
     // * offset-based getters work (otherwise offsets are taken from body and rows
@@ -84,82 +84,20 @@ export default class Grid {
       return [];
     }
 
-    const ROW_TOP_STEP = 0.5; // tolerate sub-pixel jitter when detecting row breaks
-    const currentRows = [];
-    let hasRowSpan = false;
-    let hasColumnSpan = false;
-    const rowIndexSet = new Set();
-
-    // ***** Rely on vertical position only:
-    // ***** we support linear, monotonic grids for now.
-    // * We track a row’s vertical band (top/bottom) and only start a new row
-    // * when a cell falls outside that band;
-    // * explicit grid-row-start indices still short-circuit when present.
-    let currentRowTrack = null;
-    let currentRowTop = null;
-    let currentRowBottom = null;
-
-    gridCells.forEach((gridCell) => {
-      const cellStyle = this._getComputedStyleCached(gridCell);
-      const rowStart = parseInt(cellStyle.gridRowStart, 10);
-      const hasRowIndex = Number.isFinite(rowStart);
-      const top = this._node.getTop(gridCell, gridNode);
-      const bottom = this._node.getBottom(gridCell, gridNode);
-
-      let startNewRow = false;
-
-      if (!currentRows.length) {
-        // 🤖 first cell always seeds the row bucket
-        startNewRow = true;
-      } else if (hasRowIndex && currentRowTrack != null) {
-        // 🤖 when CSS explicitly names grid row tracks, rely on that index
-        startNewRow = rowStart !== currentRowTrack;
-      } else if (currentRowBottom != null) {
-        // 🤖 fallback: treat the row as a vertical band;
-        //    if the next cell sits below the band, start a new row
-        startNewRow = top >= (currentRowBottom - ROW_TOP_STEP);
-      } else if (currentRowTop != null) {
-        startNewRow = Math.abs(top - currentRowTop) > ROW_TOP_STEP;
-      } else {
-        startNewRow = true;
-      }
-
-      if (startNewRow) {
-        currentRows.push([gridCell]);
-        currentRowTrack = hasRowIndex ? rowStart : null;
-        currentRowTop = top;
-        currentRowBottom = bottom;
-      } else {
-        currentRows[currentRows.length - 1].push(gridCell);
-        if (hasRowIndex && currentRowTrack == null) {
-          currentRowTrack = rowStart;
-        }
-        if (currentRowTop == null || top < currentRowTop) {
-          currentRowTop = top;
-        }
-        if (currentRowBottom == null || bottom > currentRowBottom) {
-          currentRowBottom = bottom;
-        }
-      }
-
-      // ** Detect spans and collect row-start indices.
-      // ** If row-starts jump beyond known current rows (implicit tracks/gaps),
-      // ** or any cell spans rows/columns, skip splitting this grid.
-      const rowEnd = cellStyle.gridRowEnd || '';
-      const colEnd = cellStyle.gridColumnEnd || '';
-      hasRowSpan = hasRowSpan || rowEnd.includes('span');
-      hasColumnSpan = hasColumnSpan || colEnd.includes('span');
-
-      hasRowIndex && rowIndexSet.add(rowStart);
-      // todo: span w/o 'span' keyword
-      // todo: gridRowEnd/gridColumnEnd as Num/-1
-      // todo: gridRowStart asNaN (named lines)
-      // todo: improve "implicit row gaps"?
-      // - misses within a set of starts:
-      // - for example, if rowIndexSet contains {1,3,5}, and 2 and 4 are missing?
+    // * Rows, cell styles and row bounds come from one index per grid container.
+    this._currentGridIndex = new GridTrackIndex({
+      containerStyle: nodeComputedStyle,
+      cells: gridCells,
+      getStyle: (element) => this._DOM.getComputedStyle(element),
+      getTop: (element) => this._node.getTop(element, gridNode),
+      getBottom: (element) => this._node.getBottom(element, gridNode),
+      // * The cells share the grid as their offset parent (see setInitStyle).
+      getLeft: (element) => this._DOM.getElementOffsetLeft(element),
+      getGeneration: () => this._DOM.getLayoutGeneration(),
     });
+    const currentRows = this._currentGridIndex.rows;
+    const { hasRowSpan, hasColumnSpan, hasImplicitRowGaps } = this._currentGridIndex;
 
-    const hasImplicitRowGaps = rowIndexSet.size > 0 && Math.max(...rowIndexSet) > currentRows.length;
     if (hasImplicitRowGaps) {
       this._debug._ && console.warn('[grid.split]', 'Unsupported implicit row gap detected; keeping grid unsplit.', { hasImplicitRowGaps });
       this._node.setInitStyle(false, gridNode, nodeComputedStyle);
@@ -312,8 +250,9 @@ export default class Grid {
     this._currentGridSplitLog = undefined;
     this._currentGridRowFlags = undefined;
     this._currentGridShellCache = undefined;
+    this._currentGridPartShell = undefined;
+    this._currentGridIndex = undefined;
     this._gridCellLineHeightCache = new WeakMap();
-    this._gridComputedStyleCache = new WeakMap();
   }
 
   _getGridSplittableHandlers({ evaluation, splitStartRowIndexes }) {
@@ -709,8 +648,9 @@ export default class Grid {
 
   _createAndInsertGridSlice({ startId, endId, node, entries }) {
     // We do not wrap with createWithFlagNoBreak to avoid CSS breakage; clone wrapper instead.
-    const part = this._DOM.cloneNodeWrapper(node);
-    this._node.copyNodeWidth(part, node);
+    // * Every part is a shallow clone of the same width-locked shell:
+    // * the width is read once, before the first part is inserted.
+    const part = this._DOM.cloneNodeWrapper(this._getGridPartShell(node));
     this._node.markNoBreak(part);
 
     if (startId) {
@@ -723,9 +663,9 @@ export default class Grid {
     this._node.markBottomCut(part);
 
 
-    node.before(part);
+    this._DOM.insertBefore(node, part);
 
-    const currentRows = entries?.currentRows || fallbackCurrentRows || [];
+    const currentRows = entries?.currentRows || this._currentGridRows || [];
     // currentRows arrive via the shared entries container; fallback keeps older callers working.
 
     // Allow the DOM module to tell us what counts as an element.
@@ -761,10 +701,22 @@ export default class Grid {
       })
       .filter(Boolean);
 
-    this._DOM.insertAtEnd(part, ...partEntries);
+    // * The cells are moved into the part in one go, through a fragment.
+    const fragment = this._DOM.createDocumentFragment();
+    this._DOM.insertAtEnd(fragment, ...partEntries);
+    this._DOM.insertAtEnd(part, fragment);
     return part;
   }
 
+  _getGridPartShell(node) {
+    if (this._currentGridPartShell?.source !== node) {
+      const shell = this._DOM.cloneNodeWrapper(node);
+      this._node.copyNodeWidth(shell, node);
+      this._currentGridPartShell = { source: node, shell };
+    }
+    return this._currentGridPartShell.shell;
+  }
+
   _createAndInsertGridFinalSlice({ node, entries, startId }) {
     const finalPart = node;
 
@@ -845,7 +797,7 @@ export default class Grid {
 
       let style = styles ? styles[index] : null;
       if (!style) {
-        style = this._getComputedStyleCached(cell);
+        style = this._getCellStyle(cell);
         if (styles) {
           styles[index] = style;
         }
@@ -877,7 +829,7 @@ export default class Grid {
     // * style must be passed
     if (!style) {
       console.warn('[grid.metrics] style not passed for _resolveGridCellLineHeight', { cell });
-      style = this._getComputedStyleCached(cell);
+      style = this._getCellStyle(cell);
     }
 
     // * check in style
@@ -923,26 +875,13 @@ export default class Grid {
     return shells;
   }
 
-  // 🤖 Cache computed styles per cell during a split run to avoid repeated layout reads across helpers.
-  _getComputedStyleCached(element) {
-    if (!element) {
-      console.warn('[grid.split] the element was not passed to _getComputedStyleCached');
-      return null;
-    }
-    const cache = this._gridComputedStyleCache;
-    if (!cache) {
-      return this._DOM.getComputedStyle(element);
-    }
-    const cached = cache.get(element);
-    if (cached) {
-      return cached;
-    }
-    const style = this._DOM.getComputedStyle(element);
-    cache.set(element, style);
-    return style;
+  // * Computed styles of the cells are kept in the grid index during a split run.
+  _getCellStyle(element) {
+    return this._currentGridIndex
+      ? this._currentGridIndex.getStyle(element)
+      : this._DOM.getComputedStyle(element);
   }
 
-
   _computeGridCellShellHeights(cells, styles = null) {
     // Grid rows do not wrap cells in TR shells; estimate each cell's structural contribution
     // so slicers operate on content height only. Reuse cached computedStyle via WeakMap to avoid
@@ -957,11 +896,11 @@ export default class Grid {
         // 🤖 reuse entry-level cache when helper array provides slots
         style = styles[index];
         if (!style) {
-          style = this._getComputedStyleCached(cell);
+          style = this._getCellStyle(cell);
           styles[index] = style;
         }
       } else {
-        style = this._getComputedStyleCached(cell);
+        style = this._getCellStyle(cell);
       }
       const paddingTop = parseFloat(style?.paddingTop) || 0;
       const paddingBottom = parseFloat(style?.paddingBottom) || 0;
@@ -982,7 +921,14 @@ export default class Grid {
   }
 
   _getRowBounds(row, gridNode, want = 'both') {
-    // Delegate to shared helper so grid/table share one implementation.
+    // * Take the bounds from the grid tracks when they describe the rows;
+    const bounds = this._currentGridIndex?.getRowBounds(row, this._currentGridRows);
+    if (bounds) {
+      if (want === 'top') return { top: bounds.top, bottom: bounds.top };
+      if (want === 'bottom') return { top: bounds.bottom, bottom: bounds.bottom };
+      return bounds;
+    }
+    // * otherwise delegate to shared helper so grid/table share one implementation.
     return this._node.resolveRowBoundsGeneric(row, gridNode, want);
   }
 
@@ -28,6 +28,10 @@ export default class Paragraph {
     // calculate
     this._minParagraphBreakableLines = this._minParagraphLeftLines + this._minParagraphDanglingLines || 2;
 
+    // * Lines of text nodes are found with Range boxes (see _findLineStartOffsets),
+    // * with word spans as a fallback.
+    this._canMeasureTextRanges = typeof Range !== 'undefined' && 'getClientRects' in Range.prototype;
+
     Object.assign(this, Logging);
   }
 
@@ -317,6 +321,12 @@ export default class Paragraph {
     splittedItem.classList.add('🔠_breakItIntoLines');
     splittedItem.classList.add('🚫_must_be_removed');
 
+    const childNodes = this._DOM.getChildNodes(splittedItem);
+    if (this._canMeasureTextRanges && childNodes.length === 1 && this._DOM.isTextNode(childNodes[0])) {
+      return this._breakTextNodeIntoLinesByRanges(splittedItem, childNodes[0]);
+    }
+
+    // * Fallback: wrap every word and compare their offsets.
     const {
       wordArray,
       wrappedWordArray,
@@ -355,10 +365,98 @@ export default class Paragraph {
       }, []);
 
     // * and then delete the source element.
-    splittedItem.remove();
+    this._DOM.removeNode(splittedItem);
+    return newLines;
+  }
+
+  // * Finds the lines of the text node with Range boxes instead of word spans:
+  // * the text is not changed until the lines are known.
+  _breakTextNodeIntoLinesByRanges(splittedItem, textNode) {
+    const text = this._DOM.getNodeValue(textNode);
+
+    // * See the protective line height in _findNewLineStarts.
+    const cashInlineLineHeight = splittedItem.style.lineHeight;
+    this._DOM.setStyle(splittedItem, 'lineHeight', 2);
+    const lineStarts = this._findLineStartOffsets(textNode, text);
+    this._DOM.setStyle(splittedItem, 'lineHeight', cashInlineLineHeight);
+
+    this._debug._ && console.log('lineStarts', lineStarts);
+
+    // * Insert new lines before the source element,
+    const newLines = lineStarts.map((start, index) => {
+      const line = this._node.createTextLine();
+      this._DOM.insertAtEnd(line, this._DOM.createTextNode(text.slice(start, lineStarts[index + 1])));
+      this._DOM.insertBefore(splittedItem, line);
+      return line;
+    });
+
+    // * and then delete the source element.
+    this._DOM.removeNode(splittedItem);
     return newLines;
   }
 
+  // * Returns the offsets in the text where the lines start.
+  // * The tops of the graphemes grow with their offsets,
+  // * so each line break is found with a binary search:
+  // * O(log n) measurements per line instead of one per word.
+  _findLineStartOffsets(textNode, text) {
+    const offsets = this._node.getGraphemeOffsets(text);
+    const boxes = new Map();
+
+    const measure = (index) => {
+      if (!boxes.has(index)) {
+        const end = offsets[index + 1] ?? text.length;
+        const box = this._DOM.getTextRangeClientRects(textNode, offsets[index], end)[0];
+        // * Collapsed whitespace has no box (or an empty one).
+        boxes.set(index, (box && (box.width || box.height)) ? box : null);
+      }
+      return boxes.get(index);
+    };
+    // * A grapheme without a box belongs to the line of the previous one.
+    const getBoxBefore = (index) => {
+      for (let i = index; i >= 0; i--) {
+        const box = measure(i);
+        if (box) return box;
+      }
+      return null;
+    };
+    const getBoxAfter = (index) => {
+      for (let i = index; i < offsets.length; i++) {
+        const box = measure(i);
+        if (box) return box;
+      }
+      return null;
+    };
+    const isBelow = (box, lineBox) => box.top >= lineBox.top + lineBox.height / 2;
+
+    const lineStarts = [0];
+    let lineStart = 0;
+    let lineBox = getBoxAfter(0);
+
+    while (lineBox) {
+      // * The first grapheme below the current line.
+      let low = lineStart + 1;
+      let high = offsets.length;
+      while (low < high) {
+        const middle = (low + high) >>> 1;
+        const box = getBoxBefore(middle);
+        if (box && isBelow(box, lineBox)) {
+          high = middle;
+        } else {
+          low = middle + 1;
+        }
+      }
+      if (low === offsets.length) {
+        break;
+      }
+      lineStarts.push(offsets[low]);
+      lineStart = low;
+      lineBox = measure(low);
+    }
+
+    return lineStarts;
+  }
+
   _findNewLineStarts(wrappedWordsArray, wrapper) {
     // * The heuristics _findNewLineStarts stop working if the line height is small
     // * and the lines overlap each other. Therefore, we set a temporary protective line height,
@@ -366,16 +464,16 @@ export default class Paragraph {
     // * it does not affect the calculation result — we need the beginnings of lines,
     // * not their vertical parameters.
     const cashInlineLineHeight = wrapper.style.lineHeight;
-    wrapper.style.lineHeight = 2;
+    this._DOM.setStyle(wrapper, 'lineHeight', 2);
 
     // Split the splittedItem into lines.
     // Let's find the elements that start a new line.
 
     const newLineStartNumbers = wrappedWordsArray.reduce(
       (result, currentWord, currentIndex) => {
-        const prevTop = (currentIndex > 0) ? wrappedWordsArray[currentIndex - 1].offsetTop : undefined;
-        const prevHth = (currentIndex > 0) ? wrappedWordsArray[currentIndex - 1].offsetHeight : undefined;
-        const currTop = currentWord.offsetTop;
+        const prevTop = (currentIndex > 0) ? this._DOM.getElementOffsetTop(wrappedWordsArray[currentIndex - 1]) : undefined;
+        const prevHth = (currentIndex > 0) ? this._DOM.getElementOffsetHeight(wrappedWordsArray[currentIndex - 1]) : undefined;
+        const currTop = this._DOM.getElementOffsetTop(currentWord);
         if (currentIndex > 0 && (prevTop + prevHth) <= currTop) {
           result.push(currentIndex);
         }
@@ -384,7 +482,7 @@ export default class Paragraph {
     );
 
     // * return initial style
-    wrapper.style.lineHeight = cashInlineLineHeight;
+    this._DOM.setStyle(wrapper, 'lineHeight', cashInlineLineHeight);
     return newLineStartNumbers
   }
 }
@@ -2,6 +2,10 @@ import * as Logging from '../../utils/logging.js';
 
 const CONSOLE_CSS_END_LABEL = `background:#999;color:#FFF;padding: 0 4px;`;
 
+// * Long PRE blocks are split into chunks of this many lines.
+// * Only a chunk that does not fit on the page is split into lines.
+const CHUNK_LINES = 64;
+
 export default class Pre {
   constructor({
     config,
@@ -32,6 +36,8 @@ export default class Pre {
     // - if null is set - the element is not created in createSignpost().
     this._signpostHeight = parseFloat(config.splitLabelHeight) || 0;
 
+    // * The lines of every chunk (null once it is split).
+    this._chunkLines = new WeakMap();
   }
 
   _normalizeLinesInPlace(lines) {
@@ -106,6 +112,12 @@ export default class Pre {
       this._debug._ && console.groupEnd()
     }
 
+    if (this._chunkLines.has(node)) {
+      const lines = this._splitChunk(node);
+      endSplitGroup();
+      return lines
+    }
+
     const _children = this._DOM.getChildNodes(node); // * elements, text nodes, comments, etc.
     this._debug._ && console.log('_children:', _children.length, _children);
 
@@ -163,11 +175,9 @@ export default class Pre {
     this._normalizeLinesInPlace(_lines);
 
     // * Modifying DOM
-    const linesFromNode = _lines.map(string => {
-      const line = this._node.createWithFlagNoBreak();
-      this._DOM.setInnerHTML(line, string);
-      return line
-    });
+    const linesFromNode = (_lines.length > CHUNK_LINES)
+      ? this._createChunks(_lines)
+      : this._createLines(_lines);
     this._debug._ && console.log('linesFromNode', linesFromNode);
     this._DOM.replaceNodeContentsWith(node, ...linesFromNode);
 
@@ -175,6 +185,48 @@ export default class Pre {
     return linesFromNode
   }
 
+  _createLines(strings) {
+    return strings.map(string => {
+      const line = this._node.createWithFlagNoBreak();
+      this._DOM.setInnerHTML(line, string);
+      return line
+    });
+  }
+
+  // * Chunks are breakable blocks with the text of CHUNK_LINES lines:
+  // * the pagination measures a chunk as a whole,
+  // * and splits it (see _splitChunk) only if it does not fit.
+  _createChunks(strings) {
+    const chunks = [];
+    for (let start = 0; start < strings.length; start += CHUNK_LINES) {
+      const chunkStrings = strings.slice(start, start + CHUNK_LINES);
+      const chunk = this._node.create();
+      this._DOM.setInnerHTML(chunk, chunkStrings.join(''));
+      this._chunkLines.set(chunk, chunkStrings);
+      chunks.push(chunk);
+    }
+    this._debug._ && console.log('chunks:', chunks.length);
+    return chunks
+  }
+
+  // * The lines of the chunk are already normalized (see _normalizeLinesInPlace).
+  _splitChunk(chunk) {
+    const strings = this._chunkLines.get(chunk);
+    if (!strings) {
+      // * Already split: the lines are in place.
+      return [...this._DOM.getChildren(chunk)]
+    }
+    if (strings.length < 2) {
+      this._debug._ && console.log('%c END _splitPreNode (single line chunk)', CONSOLE_CSS_END_LABEL);
+      return []
+    }
+    const lines = this._createLines(strings);
+    this._chunkLines.set(chunk, null);
+    this._debug._ && console.log('lines of chunk', lines);
+    this._DOM.replaceNodeContentsWith(chunk, ...lines);
+    return lines
+  }
+
 
   // old slice method, which cuts the node into pieces, currently not in use
   slice(
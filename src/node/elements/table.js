@@ -1,6 +1,10 @@
 import * as Logging from '../../utils/logging.js';
 import * as Paginator from './structuredElementPaginator.js';
 import * as PartsRecorder from '../modules/parts.recorder.js';
+import OrderedOffsetIndex from '../utils/orderedOffsetIndex.js';
+
+// * Shorter runs of rows are evaluated one by one.
+const MIN_INDEXED_ROWS = 8;
 
 // TODO(table): Unsupported features planned later
 // - colSpan/rowSpan splitting across pages (complex layout heuristics)
@@ -84,6 +88,10 @@ export default class Table {
     // ** current per-run caches
     this._currentRowShellCache = undefined;
     this._currentOverflowHelpers = undefined;
+    // ** row geometry index, valid for one rows array and one layout generation
+    this._currentRowIndex = undefined;
+    // ** the shell the parts are cloned from (see _createTablePartShell)
+    this._currentTablePartShell = undefined;
 
     // ** analysis flags (guards) — set by _analyzeCurrentTableStructure()
     // Whether any row contains ROWSPAN>1; triggers conservative fallback (no slicing for that row)
@@ -229,6 +237,8 @@ export default class Table {
 
     // * Walk through table rows to find where to split.
     for (let index = 0; index < this._currentTableDistributedRows.length; index++) {
+      // * Rows that fit the current window need no evaluation.
+      index = this._skipFittingRows(index);
       // * _evaluateAndResolveRow() may roll back index to re-check newly inserted rows after splitting.
       index = this._evaluateAndResolveRow(index, splitStartRowIndexes);
     };
@@ -252,6 +262,48 @@ export default class Table {
     return splitStartRowIndexes;
   }
 
+  _skipFittingRows(rowIndex) {
+    // * Binary search for the first row that does not fit the current window,
+    // * against the same geometry as the row evaluation.
+    // * The last row is always evaluated (it may absorb the reclaimed tail).
+    const rows = this._currentTableDistributedRows;
+    if (rows.length - rowIndex < MIN_INDEXED_ROWS) return rowIndex;
+
+    const rowIndexer = this._getCurrentRowIndex();
+    const overflowIndex = rowIndexer.findFirstOverflow(rowIndex, rows.length - 1, this._currentTableSplitBottom);
+    if (overflowIndex === null) {
+      // * Rows are out of order or cannot be measured: evaluate them one by one.
+      return rowIndex;
+    }
+
+    this._debug._ && overflowIndex > rowIndex && console.log(`📐 rows ${rowIndex}–${overflowIndex - 1} fit, skip to # ${overflowIndex}`);
+    return overflowIndex;
+  }
+
+  _getCurrentRowIndex() {
+    // * Tops and bottoms of the rows, read lazily: O(log n) reads per search.
+    // * Rebuilt when rows are replaced by their slices or the layout changes
+    // * (splits, scaling), since the rows below the change have moved.
+    const rows = this._currentTableDistributedRows;
+    const generation = this._DOM.getLayoutGeneration();
+    if (
+      !this._currentRowIndex
+      || this._currentRowIndex.rows !== rows
+      || this._currentRowIndex.generation !== generation
+    ) {
+      this._currentRowIndex = {
+        rows,
+        generation,
+        index: new OrderedOffsetIndex({
+          elements: rows,
+          getTop: (row) => this._node.getTop(row, this._currentTable),
+          getBottom: (row) => this._node.getBottom(row, this._currentTable),
+        }),
+      };
+    }
+    return this._currentRowIndex.index;
+  }
+
   _evaluateAndResolveRow(rowIndex, splitStartRowIndexes) {
     // 🤖 Evaluate a single row against the current split window, then either keep it, reclaim short-tail space, or trigger overflow handling.
     // Input: rowIndex; mutates splitStartRowIndexes
@@ -820,8 +872,28 @@ export default class Table {
   // ===== Builders =====
   // 👪👪👪👪👪👪👪👪👪👪👪👪👪👪👪👪
 
+  // *️⃣ The part shell: prepared once per table, cloned for every part.
+  // * The widths are already locked on the table and its cells (see _lockCurrentTableWidths),
+  // * so the clones of the wrapper, caption, colgroup and thead keep them.
+  _createTablePartShell({ table, tableEntries }) {
+    const content = this._DOM.createDocumentFragment();
+    this._DOM.insertAtEnd(
+      content,
+      this._DOM.cloneNode(tableEntries.caption),
+      this._DOM.cloneNode(tableEntries.colgroup),
+      this._DOM.cloneNode(tableEntries.thead),
+    );
+    return {
+      table,
+      content,
+      tfoot: tableEntries.tfoot,
+      topSignpost: this._createTopSignpost(),
+      bottomSignpost: this._createBottomSignpost(),
+    };
+  }
+
   // *️⃣ Create a non-first table slice.
-  _createTableSlice({ startId, endId, table, tableEntries }) {
+  _createTableSlice({ startId, endId, tableEntries, shell }) {
     this._debug._ && console.group(`[CREATE Table Slice] range: [${startId}, ${endId})`);
 
     // * endId can be Infinity
@@ -833,36 +905,37 @@ export default class Table {
     this.strictAssert(startId > 0 && endId > 0 && startId < endId,
       `[createTableSlice] out-of-range slice [${startId}, ${endId}) for rowsLen=${rowsLen}`);
 
-    const partEntries = tableEntries.rows.slice(startId, endId);
-
-    const _tableWrapper = this._node.createSliceWrapper(table);
+    // * The rows are moved into the part in one go, through a fragment.
+    const partEntries = this._DOM.createDocumentFragment();
+    this._DOM.insertAtEnd(partEntries, ...tableEntries.rows.slice(startId, endId));
 
     const tableSlice = this._node.createTable({
-      wrapper: _tableWrapper,
-      colgroup: this._DOM.cloneNode(tableEntries.colgroup),
-      caption: this._DOM.cloneNode(tableEntries.caption),
-      thead: this._DOM.cloneNode(tableEntries.thead),
-      tfoot: endId === Infinity ? this._DOM.cloneNode(tableEntries.tfoot) : null,
-      tbody: partEntries,
+      wrapper: this._node.createSliceWrapper(shell.table),
+      tfoot: endId === Infinity ? this._DOM.cloneNode(shell.tfoot) : null,
+      tbody: [partEntries],
     });
+    // * caption, colgroup, thead
+    this._DOM.insertAtStart(tableSlice, this._DOM.cloneNode(shell.content));
 
     this.logGroupEnd('[CREATE Table Slice]');
     return tableSlice
   }
 
   _createTableSlices({ splitPoints, table, tableEntries }) {
+    this._currentTablePartShell = this._createTablePartShell({ table, tableEntries });
     return splitPoints.map((startId, index, array) => {
       return this._createTableSlice({
         startId,
         endId: (index === array.length - 1) ? (Infinity) : array[index + 1],
-        table,
         tableEntries,
+        shell: this._currentTablePartShell,
       });
     });
   }
 
   _extendTableSlices(slices) {
     // * Add continuation labels (this._signpostHeight > 0).
+    const shell = this._currentTablePartShell;
     return slices.reduce((acc, slice, index, array) => {
       const isFirst = index === 0;
       const isLast = index === array.length - 1;
@@ -870,20 +943,27 @@ export default class Table {
       // * Add a caption for the bottom cut of the very first part
       // * (it does not belong to this array, and its elements will be inserted
       // * after the first part—the original table).
-      isFirst && acc.push(this._createBottomSignpost());
+      isFirst && acc.push(this._cloneSignpost(shell.bottomSignpost));
 
       // * At the top cut point (has every slice made through a clone),
       // * we insert a forced page break to prevent topSignpost
       // * from going over to the previous page if the previews table part are short due to the content.
       acc.push(this._node.createForcedPageBreak());
-      acc.push(this._createTopSignpost());
+      acc.push(this._cloneSignpost(shell.topSignpost));
       acc.push(slice);
-      !isLast && acc.push(this._createBottomSignpost());
+      !isLast && acc.push(this._cloneSignpost(shell.bottomSignpost));
 
       return acc;
     }, []);
   }
 
+  _cloneSignpost(signpost) {
+    // * Marks are not cloned with the element.
+    const clone = this._DOM.cloneNode(signpost);
+    clone && this._node.markNoBreak(clone);
+    return clone;
+  }
+
   _createTopSignpost() {
     // 🤖 Build the continuation label shown above intermediate table parts.
     // TODO(config): move signpost text/height to external config
@@ -1,6 +1,7 @@
 // 🪴 work with children
 
 import { debugFor } from '../utils/debugFor.js';
+import { measureSpan } from '../../utils/timings.js';
 const _isDebug = debugFor('children');
 
 /**
@@ -215,12 +216,12 @@ export function getSplitChildren(node, firstPageBottom, fullPageHeight, root) {
 
   } else if (this.isComplexTextBlock(node)) {
     _isDebug(this) && console.info('💚 ComplexTextBlock', node);
-    return children = this._paragraph.split(node) || [];
+    return children = measureSpan('Paragraph.split', () => this._paragraph.split(node)) || [];
 
   } else if (this.isWrappedTextNode(node)) {
     _isDebug(this) && console.info('💚 TextNode', node);
 
-    return children = this._paragraph.split(node) || [];
+    return children = measureSpan('Paragraph.split', () => this._paragraph.split(node)) || [];
 
   }
 
@@ -238,33 +239,33 @@ export function getSplitChildren(node, firstPageBottom, fullPageHeight, root) {
   // FIXME the order of checks
   if (this.isTableNode(node, nodeComputedStyle)) {
     _isDebug(this) && console.info('💚 TABLE', node);
-    children = this._table.split(
+    children = measureSpan('Table.split', () => this._table.split(
       node,
       firstPageBottom,
       fullPageHeight,
       root,
       nodeComputedStyle,
-    ) || [];
+    )) || [];
 
   } else if (this.isTableLikeNode(node, nodeComputedStyle)) {
     _isDebug(this) && console.info('💚 TABLE like', node);
-    children = this._tableLike.split(
+    children = measureSpan('TableLike.split', () => this._tableLike.split(
       node,
       firstPageBottom,
       fullPageHeight,
       root,
       nodeComputedStyle,
-    ) || [];
+    )) || [];
 
   } else if (this.isPRE(node, nodeComputedStyle)) {
     _isDebug(this) && console.info('💚 PRE', node);
-    children = this._pre.split(
+    children = measureSpan('Pre.split', () => this._pre.split(
       node,
       firstPageBottom,
       fullPageHeight,
       root,
       nodeComputedStyle,
-    ) || [];
+    )) || [];
 
   } else if (this.isFlexRow(node, nodeComputedStyle)) {
     _isDebug(this) && console.info('🩷 Flex ROW', node);
@@ -280,12 +281,12 @@ export function getSplitChildren(node, firstPageBottom, fullPageHeight, root) {
     // ***** it is expected that the current element is either block or actually
     // ***** behaves as a block element in the flow thanks to its content.
     _isDebug(this) && console.info('💜 GRID');
-    children = this._grid.split(
+    children = measureSpan('Grid.split', () => this._grid.split(
       node,
       firstPageBottom,
       fullPageHeight,
       root,
-    ) || [];
+    )) || [];
 
 
     // TODO LI: если в LI есть UL, маркер может оставаться на прежней странице - см. скрин в телеге.
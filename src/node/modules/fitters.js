@@ -50,8 +50,10 @@ export function fitElementWithinHeight(element, targetHeight) {
 
   const scale = targetHeight / actualHeight;
 
-  element.style.transformOrigin = 'top left';
-  element.style.transform = `scale(${scale})`;
+  this._DOM.setStyles(element, {
+    transformOrigin: 'top left',
+    transform: `scale(${scale})`,
+  });
 
   // const scaler = this.create('div');
   const scaler = this.createNeutral();
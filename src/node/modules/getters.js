@@ -100,8 +100,9 @@ export function getNormalizedBottomWithMargin(element, root, rootComputedStyle)
  * `offsetParent` chain:
  * - `element` must be contained in `root`; otherwise the traversal aborts.
  * - Both arguments must be HTMLElements with standard offset behavior.
- * - The algorithm accumulates `offsetTop` while recursing through `offsetParent`
- *   until it hits either `root` itself or the first shared `offsetParent`.
+ * - The algorithm sums `offsetTop` along the `offsetParent` chain
+ *   until it hits either `root` itself or the first shared `offsetParent`;
+ *   the sums are memoized per layout generation (see cache/ancestorIndex.js).
  * - When the shared parent is `document.body`, the result is still computed but
  *   a warning is emitted (missing positioned ancestors).
  * - Encountering a node without `offsetParent` (hidden/fixed/detached) logs the
@@ -119,7 +120,7 @@ export function getNormalizedBottomWithMargin(element, root, rootComputedStyle)
  *
  * @this {Node}
  */
-export function getTop(element, root = null, topAcc = 0, paramSnapshot = null, traversalStack = [], rootContext = null) {
+export function getTop(element, root = null) {
   if (!element) {
     _isDebug(this) && console.warn(
       '[getTop] element must be provided, but was received:', element,
@@ -142,11 +143,11 @@ export function getTop(element, root = null, topAcc = 0, paramSnapshot = null, t
     return;
   }
 
-  paramSnapshot = paramSnapshot || { element, root };
+  const paramSnapshot = { element, root };
 
-  // On the very first call ensure the target element belongs to the provided root;
+  // Ensure the target element belongs to the provided root;
   // otherwise we can't build a meaningful offset chain between them.
-  if (topAcc === 0 && !root.contains(element)) {
+  if (!root.contains(element)) {
     this.strictAssert(0, '[getTop] the provided root does not contain the element.',
       { element, root, paramSnapshot },
       '\nThe function returned:', undefined);
@@ -156,52 +157,62 @@ export function getTop(element, root = null, topAcc = 0, paramSnapshot = null, t
   // Cache shared data about the root we are measuring against:
   // 1) which offsetParent acts as the common reference frame
   // 2) how far the root itself is from that reference frame.
-  rootContext = rootContext || _initRootContext.call(this, root, paramSnapshot);
+  const rootContext = _initRootContext.call(this, root, paramSnapshot);
   if (!rootContext) {
     _isDebug(this) && console.warn(
       'Root has no a usable offset reference; nothing else to measure against. \nThe function returned:', undefined,
-      { element, paramSnapshot, offsetParent, traversal: nextTraversalStack }
+      { element, paramSnapshot }
     );
     return;
   }
 
-  // If during recursion we bubbled up to the requested root, we have accumulated
-  // the full distance and can exit immediately.
+  return _getTopInRoot.call(this, element, root, rootContext, paramSnapshot, []);
+}
+
+// * The top of an element within the root is the top of its offsetParent
+// * plus its own offsetTop. The cumulative values are kept in the ancestor index
+// * for the current layout generation, so the elements sharing offset parents
+// * do not walk the same chain again.
+function _getTopInRoot(element, root, rootContext, paramSnapshot, traversalStack) {
+  // If we bubbled up to the requested root, there is no distance left.
   if (element === root) {
-    return topAcc;
+    return 0;
   }
 
-  const nextTraversalStack = [...traversalStack, element];
-  const offsetParent = this._DOM.getElementOffsetParent(element);
+  return this._cache.ancestors.getOffset(element, root, () => {
+    const nextTraversalStack = [...traversalStack, element];
+    const offsetParent = this._DOM.getElementOffsetParent(element);
 
-  if (!offsetParent) {
-    _isDebug(this) && console.warn(
-      'Element has no offset parent; offset chain is broken. \nThe function returned:', undefined,
-      { element, paramSnapshot, offsetParent, traversal: nextTraversalStack }
-    );
-    return
-  }
+    if (!offsetParent) {
+      _isDebug(this) && console.warn(
+        'Element has no offset parent; offset chain is broken. \nThe function returned:', undefined,
+        { element, paramSnapshot, offsetParent, traversal: nextTraversalStack }
+      );
+      return
+    }
 
-  const currTop = this._DOM.getElementOffsetTop(element);
+    const currTop = this._DOM.getElementOffsetTop(element);
 
-  if (offsetParent === root) {
-    return (currTop + topAcc);
-  }
+    if (offsetParent === root) {
+      return currTop;
+    }
 
-  // If we have reached the same offsetParent the root uses,
-  // compare the distance of the element to the distance of the root.
-  if (offsetParent === rootContext.sharedOffsetParent) {
-    if (rootContext.sharedOffsetParentIsBody && !rootContext.warnedAboutBody) {
-      rootContext.warnedAboutBody = true;
-      _isDebug(this) && console.warn(
-        'getTop(): reached document.body while measuring offsets. Layout likely lacks positioned ancestors.',
-        { element, root, paramSnapshot }
-      );
+    // If we have reached the same offsetParent the root uses,
+    // compare the distance of the element to the distance of the root.
+    if (offsetParent === rootContext.sharedOffsetParent) {
+      if (rootContext.sharedOffsetParentIsBody && !rootContext.warnedAboutBody) {
+        rootContext.warnedAboutBody = true;
+        _isDebug(this) && console.warn(
+          'getTop(): reached document.body while measuring offsets. Layout likely lacks positioned ancestors.',
+          { element, root, paramSnapshot }
+        );
+      }
+      return currTop - rootContext.rootOffsetFromSharedParent;
     }
-    return (currTop + topAcc) - rootContext.rootOffsetFromSharedParent;
-  }
 
-  return this.getTop(offsetParent, root, topAcc + currTop, paramSnapshot, nextTraversalStack, rootContext);
+    const offsetParentTop = _getTopInRoot.call(this, offsetParent, root, rootContext, paramSnapshot, nextTraversalStack);
+    return (offsetParentTop === undefined) ? undefined : currTop + offsetParentTop;
+  });
 }
 
 function _initRootContext(root, paramSnapshot) {
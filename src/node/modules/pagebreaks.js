@@ -2,6 +2,7 @@
 
 import { debugFor } from '../utils/debugFor.js';
 import { withLegacySelector } from '../../selector.js';
+import { countOperation } from '../../utils/counters.js';
 const _isDebug = debugFor('pageBreaks');
 
 // * CONTRACTS:  helper functions may return tri-state values
@@ -67,6 +68,7 @@ export function findBetterForcedPageStarter(element, root) {
  * @returns {Element} - A safe, normalized page-start element for the current page.
  */
 export function findBetterPageStart(pageStart, lastPageStart, root) {
+  countOperation('findBetterPageStart');
   _isDebug(this) && console.group('➗ findBetterPageStart');
   let interruptedWithUndefined = false;
   // ** undefined from helpers => we touched a hard limit (page start / top limit)
@@ -436,26 +438,7 @@ export function findPreviousNonHangingsFromPage(element, topLimit, root) {
  * @returns {Element|null} - Highest such parent, or null if none.
  */
 export function findFirstChildParent(element, rootElement) {
-  let parent = getFlowParent.call(this, element, 'findFirstChildParent:parent');
-  let firstSuitableParent = null;
-
-  while (parent && parent !== rootElement) {
-    const firstChild = getFlowFirstChild.call(this, parent, 'findFirstChildParent:firstChild');
-    if (!firstChild) {
-      parent = getFlowParent.call(this, parent, 'findFirstChildParent:parent');
-      continue;
-    }
-
-    if (element === firstChild) {
-      firstSuitableParent = parent;
-      element = parent;
-      parent = getFlowParent.call(this, element, 'findFirstChildParent:parent');
-    } else {
-      return firstSuitableParent;
-    }
-  }
-
-  return firstSuitableParent;
+  return findEdgeChildParent.call(this, element, rootElement, getFlowFirstChild, 'findFirstChildParent', 'findFirstChildParent:firstChild');
 }
 
 /**
@@ -481,26 +464,7 @@ export function findFirstChildParent(element, rootElement) {
  * @returns {Element|null} - Highest such parent, or null if none.
  */
 export function findLastChildParent(element, rootElement) {
-  let parent = getFlowParent.call(this, element, 'findLastChildParent:parent');
-  let lastSuitableParent = null;
-
-  while (parent && parent !== rootElement) {
-    const lastChild = getFlowLastChild.call(this, parent, 'findLastChildParent:lastChild');
-    if (!lastChild) {
-      parent = getFlowParent.call(this, parent, 'findLastChildParent:parent');
-      continue;
-    }
-
-    if (element === lastChild) {
-      lastSuitableParent = parent;
-      element = parent;
-      parent = getFlowParent.call(this, element, 'findLastChildParent:parent');
-    } else {
-      return lastSuitableParent;
-    }
-  }
-
-  return lastSuitableParent;
+  return findEdgeChildParent.call(this, element, rootElement, getFlowLastChild, 'findLastChildParent', 'findLastChildParent:lastChild');
 }
 
 // GET SERVICE ELEMENTS
@@ -525,6 +489,41 @@ export function findAllForcedPageBreakInside(element) {
   return this._DOM.getAll(withLegacySelector(this._selector.printForcedPageBreak), element);
 }
 
+// * Ascends while the element is the first (last) flow child of its flow parent,
+// * and returns the highest such parent, or null.
+// * The answer for an element is the answer for its parent or, if there is none,
+// * the parent itself: the answers are kept in the ancestor index
+// * until the tree changes, so each chain is walked once, not per candidate.
+function findEdgeChildParent(element, rootElement, getFlowEdgeChild, name, childContext) {
+  const index = this._cache.ancestors;
+  const chain = [];
+  let current = element;
+  let result;
+
+  while (true) {
+    if (index.hasAnswer(name, current, rootElement)) {
+      result = index.getAnswer(name, current, rootElement);
+      break;
+    }
+    const parent = getFlowParent.call(this, current, `${name}:parent`);
+    if (!parent || parent === rootElement || getFlowEdgeChild.call(this, parent, childContext) !== current) {
+      result = null;
+      index.setAnswer(name, current, rootElement, result);
+      break;
+    }
+    chain.push(current);
+    current = parent;
+  }
+
+  // * Back down the chain: chain[i] is the edge child of chain[i + 1] (or of `current`).
+  for (let i = chain.length - 1; i >= 0; i--) {
+    result = result ?? (chain[i + 1] || current);
+    index.setAnswer(name, chain[i], rootElement, result);
+  }
+
+  return result;
+}
+
 function getFlowParent(element, context) {
   let parent = this._DOM.getParentNode(element);
   while (parent && this.shouldSkipFlowElement(parent, { context })) {
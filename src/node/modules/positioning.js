@@ -11,19 +11,16 @@ export function isFirstChildOfFirstChild(element, rootElement) {
     return false;
   }
 
-  let currentElement = element;
-
-  while (this._DOM.getParentNode(currentElement) && currentElement !== rootElement) {
-    if (this._DOM.getFirstElementChild(this._DOM.getParentNode(currentElement)) !== currentElement) {
-      return false;
-    }
-
-    currentElement = this._DOM.getParentNode(currentElement);
+  if (!rootElement || !rootElement.contains(element)) {
+    return false;
   }
 
-  // * Making sure we get to the end,
-  // * and don't exit with "false" until the end of the check.
-  return currentElement === rootElement;
+  // * Each element between the element and the root must be a first child:
+  // * the root must be within the first-child chain of the element,
+  // * that is, not above its top (see cache/ancestorIndex.js).
+  const ancestors = this._cache.ancestors;
+  const chainTop = ancestors.getFirstChildChainTop(element);
+  return ancestors.getDepth(chainTop) <= ancestors.getDepth(rootElement);
 }
 
 /**
@@ -1,8 +1,19 @@
 // 🔪 slicers
 
 import { debugFor } from '../utils/debugFor.js';
+import OrderedOffsetIndex from '../utils/orderedOffsetIndex.js';
 const _isDebug = debugFor('slicers');
 
+// * Shorter runs of children are scanned linearly.
+const MIN_INDEXED_CHILDREN = 8;
+// * Displays whose block children are laid out top to bottom.
+const ORDERED_FLOW_DISPLAYS = ['block', 'flow-root', 'list-item', 'table-cell'];
+
+// * Steps of the getSplitPoints traversal.
+const CONTINUE = 'continue'; // * go to the next child
+const DESCEND = 'descend'; // * go into the children of the current child
+const ABORT = 'abort'; // * leave the level (go back to the parent level)
+
 /**
  * Find split points inside rootNode content.
  *
@@ -36,7 +47,7 @@ export function getSplitPoints({
   }
 
   // * We need to cache the firstChild of the root node,
-  // * because when we descend into the children and enter recursion,
+  // * because when we descend into the children and enter a new level,
   // * we cannot access the points.push(null) branch because the
   // * knowledge about the firstChild of the root is lost.
 
@@ -79,39 +90,84 @@ export function getSplitPoints({
     ? rootComputedStyle
     : this._DOM.getComputedStyle(rootNode);
 
-  // 🤖 Cache normalized metrics to avoid repeated DOM layout measurements while scanning children.
-  const metricsCache = new WeakMap();
-  const getMetricsBag = (element) => {
-    let bag = metricsCache.get(element);
-    if (!bag) {
-      bag = Object.create(null);
-      metricsCache.set(element, bag);
-    }
-    return bag;
-  };
-  const getNormalizedTopCached = (element) => {
-    if (!element) return NaN;
-    const bag = getMetricsBag(element);
-    if (!('top' in bag)) {
-      bag.top = this.getNormalizedTop(element, rootNode, _rootComputedStyle);
-    }
-    return bag.top;
-  };
-  const getNormalizedBottomWithMarginCached = (element) => {
-    if (!element) return NaN;
-    const bag = getMetricsBag(element);
-    if (!('bottomWithMargin' in bag)) {
-      bag.bottomWithMargin = this.getNormalizedBottomWithMargin(element, rootNode, _rootComputedStyle);
-    }
-    return bag.bottomWithMargin;
-  };
-  const getOffsetHeightCached = (element) => {
-    if (!element) return 0;
-    const bag = getMetricsBag(element);
-    if (!('offsetHeight' in bag)) {
-      bag.offsetHeight = this._DOM.getElementOffsetHeight(element);
-    }
-    return bag.offsetHeight;
+  // * Levels of the traversal: the children of rootNode, then the children
+  // * of the element being split, and so on. An explicit stack instead of recursion,
+  // * so that deeply nested content does not grow the call stack.
+  const createLevel = (children) => {
+    // 🤖 Cache normalized metrics to avoid repeated DOM layout measurements while scanning children.
+    const metricsCache = new WeakMap();
+    const getMetricsBag = (element) => {
+      let bag = metricsCache.get(element);
+      if (!bag) {
+        bag = Object.create(null);
+        metricsCache.set(element, bag);
+      }
+      return bag;
+    };
+    const getNormalizedTopCached = (element) => {
+      if (!element) return NaN;
+      const bag = getMetricsBag(element);
+      if (!('top' in bag)) {
+        bag.top = this.getNormalizedTop(element, rootNode, _rootComputedStyle);
+      }
+      return bag.top;
+    };
+    const getNormalizedBottomWithMarginCached = (element) => {
+      if (!element) return NaN;
+      const bag = getMetricsBag(element);
+      if (!('bottomWithMargin' in bag)) {
+        bag.bottomWithMargin = this.getNormalizedBottomWithMargin(element, rootNode, _rootComputedStyle);
+      }
+      return bag.bottomWithMargin;
+    };
+    const getOffsetHeightCached = (element) => {
+      if (!element) return 0;
+      const bag = getMetricsBag(element);
+      if (!('offsetHeight' in bag)) {
+        bag.offsetHeight = this._DOM.getElementOffsetHeight(element);
+      }
+      return bag.offsetHeight;
+    };
+
+    // 🤖 Lazily built ordered-offset index of the children (see OrderedOffsetIndex).
+    // *  Only for a long run of siblings in normal flow; undefined = not built yet.
+    let offsetIndex;
+    const getOffsetIndex = () => {
+      if (offsetIndex !== undefined) return offsetIndex;
+      offsetIndex = null;
+      const parent = children[0].parentElement;
+      if (
+        children.length >= MIN_INDEXED_CHILDREN
+        && parent
+        && parent === children.at(-1).parentElement
+        && ORDERED_FLOW_DISPLAYS.includes(this._DOM.getComputedStyle(parent)?.display)
+      ) {
+        offsetIndex = new OrderedOffsetIndex({
+          elements: children,
+          getTop: getNormalizedTopCached,
+          getBottom: getNormalizedBottomWithMarginCached,
+          // * Floated and out-of-flow children break the order
+          // * where the binary search may not look (checked lazily).
+          isInFlow: (child) => _isInNormalFlow.call(this, child),
+        });
+      }
+      return offsetIndex;
+    };
+
+    _isDebug(this) && console.group(`walking through ${children.length} children`, children); // Collapsed
+
+    return {
+      children,
+      index: 0,
+      getNormalizedTopCached,
+      getNormalizedBottomWithMarginCached,
+      getOffsetHeightCached,
+      getOffsetIndex,
+      // * Set when descending into the children of the current element:
+      currentElement: null,
+      nextElement: null,
+      currentElementChildren: null,
+    };
   };
 
   // * (1)
@@ -134,7 +190,6 @@ export function getSplitPoints({
       return points;
     }
     finalized = true;
-    _isDebug(this) && console.groupEnd(`walking through ${children.length} children`);
     // *** need to revert back to the original positioning & vertical align of the rootNode:
     this.setInitStyle (false, rootNode, rootComputedStyle);
     _isDebug(this) && console.groupEnd(`getSplitPoints`);
@@ -159,9 +214,9 @@ export function getSplitPoints({
   // To avoid this, we subtract padding-top from offsetTop.
   // This normalization is specific to this TD context.
 
-  _isDebug(this) && console.group(`walking through ${children.length} children`, children); // Collapsed
-
-  for (let i = 0; i < children.length; i++) {
+  const processChild = (level) => {
+    const { children, getNormalizedTopCached, getNormalizedBottomWithMarginCached } = level;
+    const i = level.index;
 
     let floater; // * floater: bottom boundary (in rootNode coordinates) for the current slice.
     let capacity; // * capacity: vertical height budget for the current slice’s content.
@@ -187,12 +242,33 @@ export function getSplitPoints({
           anchorTop,
           fullPageHeight,
         });
-        return finalize();
+        return ABORT;
       }
       floater = anchorTop + fullPageHeight;
       capacity = fullPageHeight;
     }
 
+    // * Skip the run of children that fit in the current slice
+    // * with a binary search instead of measuring each of them.
+    // * Forced page breaks in the run stop the skip.
+    const firstOverflow = (i < children.length - 1)
+      ? level.getOffsetIndex()?.findFirstOverflow(i, children.length - 1, floater)
+      : null;
+    if (firstOverflow != null && firstOverflow > i) {
+      let skipTo = firstOverflow;
+      for (let k = i; k < firstOverflow; k++) {
+        if (this.isForcedPageBreak(children[k])) {
+          skipTo = k;
+          break;
+        }
+      }
+      if (skipTo > i) {
+        _isDebug(this) && console.log('[getSplitPoints] children fit in the slice, skip', i, '->', skipTo, { floater });
+        level.index = skipTo - 1;
+        return CONTINUE;
+      }
+    }
+
     const currentElement = children[i];
     const previousElement = children[i - 1];
     const nextElement = children[i + 1];
@@ -225,9 +301,9 @@ export function getSplitPoints({
       // 🤖 Case: Forced Page Break — `pushedNull` here means the break sits on the very first child, so the tail slice would be empty.
       // 🤖 Geometrically: we must abandon the short window and switch to the full-page pass so the next page can start correctly.
       if (forcedBreakPushedNull) {
-        return finalize();
+        return ABORT;
       }
-      continue;
+      return CONTINUE;
     }
 
     let shouldSplitCurrent = false;
@@ -242,7 +318,7 @@ export function getSplitPoints({
           `current fits tail window: nextTop ${nextElementTop} <= ${floater}, currentBottom ${currentElementBottom} <= ${floater}`,
         );
         // * go to next index
-        continue;
+        return CONTINUE;
       }
 
       // 🤖 nextElement stays within the floater, but currentElement itself overflows — treat as split case.
@@ -283,10 +359,10 @@ export function getSplitPoints({
           // 🤖 Geometrically this means "start of next page" coincides with page top, so we abort and let the fallback recalc with full height.
           if (pushedNull) {
             _isDebug(this) && console.log('%cNULL CASE, return', 'color:red;text-weight:bold');
-            return finalize();
+            return ABORT;
           }
           // * go to next index
-          continue;
+          return CONTINUE;
         }
 
         // 🤖 Unable to measure the next element; keep scanning without splitting.
@@ -343,7 +419,7 @@ export function getSplitPoints({
           containerElement,
         });
         // 🤖 Последний ребёнок (вместе с оболочкой) помещается целиком: оставляем как есть.
-        continue;
+        return CONTINUE;
       }
 
       // * Try to split it. 🔪🥒.  🍉
@@ -354,114 +430,112 @@ export function getSplitPoints({
     // 🤖 Non-finite nextElementTop is already captured above; keep evaluating current overflow state here.
 
     if (!shouldSplitCurrent) {
-      continue;
+      return CONTINUE;
     }
 
     // * Try to split it. 🔪🥒.  🍉
 
-
-    let localPoints = [];
-
     // TODO: The code below requires further refinement.
 
     const currentElementChildren = this.getSplitChildren(currentElement, firstPartHeight, fullPageHeight, rootNode);
 
     // * Parse children:
     if (currentElementChildren.length) {
-
-      // * Process children if exist:
-      // 🤖 Intentional: we pass the SAME `points` array into recursion.
+      // * Process children if exist: descend into them,
+      // * and come back to afterChildren() when they are done.
+      // 🤖 Intentional: the children share the SAME `points` array.
       //     This accumulates split markers for the whole TD content and
-      //     allows checks like `localPoints.length === 0` to mean
+      //     allows checks like `points.length === 0` to mean
       //     "we are still in the first slice (tail window) of this TD".
       //     Do NOT replace with a new array — first-slice semantics would break.
-      localPoints = getSplitPoints.call(this, {
-        rootNode,
-        rootComputedStyle: _rootComputedStyle,
-        children: currentElementChildren,
-        firstPartHeight,
-        fullPageHeight,
-        firstChild,
-
-        points,
-      });
+      level.currentElement = currentElement;
+      level.nextElement = nextElement;
+      level.currentElementChildren = currentElementChildren;
+      return DESCEND;
+    }
 
-      // *** END of 'has children'
-
-      if (localPoints.length === 0) {
-        // 🤖 Case: current element (with children) did not produce inner split points
-        //     in the first slice. This is the "tail window" scenario.
-        //     We use `room = max(firstPartHeight, fullPageHeight)` here ON PURPOSE:
-        //       - The first part can be as large as, or even larger than, a full page
-        //         (e.g., no top signpost deducted for the first part), so `room` is the
-        //         maximum admissible height for a non‑breakable element in the first slice.
-        //       - The action (move to next page vs. scale) is STILL deferred to the
-        //         row/table layer to maintain strict geometry; slicers only classify.
-        const room = Math.max(firstPartHeight, fullPageHeight);
-
-        const currentElementHeight = getOffsetHeightCached(currentElement);
-        const isUnbreakableOversized =
-          currentElementHeight > room &&
-          (
-            !localPoints.length ||
-            (localPoints.length === 1 && localPoints[0] === null)
-          );
-
-        _isDebug(this) && console.log('room (Math.max)', room);
-
-        if (isUnbreakableOversized) {
-          _isDebug(this) && console.warn(
-            '%c⚠️ UNSPLITTABLE OVERSIZED ELEMENT — SCALE IT',
-            'color:white; background:red; font-weight:bold;',
-            currentElement,
-            `height: ${currentElementHeight}`
-          );
-          if (!points.length && currentElement === firstChild) {
-            _isDebug(this) && console.warn('🅾️ (1) points.push(null) in isUnbreakableOversized');
-            points.push(null);
-            // 🤖 Early abort after placing sentinel: let the second pass handle next window.
-            return finalize();
-          }
-          // 🤖 Early scaling here breaks strict geometry when the paginator
-          //     later re-computes the window (moves to full-page). Better approach:
-          //     - Register split (null/next) and let table.js decide scaling:
-          //       either scale tail (if really tail case) or scale in full-page.
-          //     - Leave this call disabled (see similar handling in the 'no children' branch).
-          // this.fitElementWithinHeight(currentElement, room)
-          if (nextElement) {
-            const pushedNull = registerPoint(nextElement);
-            // 🤖 Case: Unbreakable Oversized With Children — `pushedNull` means the next page must begin exactly at root's first child.
-            // 🤖 Geometrically we cannot fit any tail content, so we stop and delegate to the fallback (second pass / scaling decision).
-            if (pushedNull) return finalize();
-          }
-        } else {
-
-          // FIXME: быстрый фикс, но помог. Проверить тщательно логику.
-          // Element is unbreakable and fits a full page, but does not fit the tail.
-          // Start the next page from currentElement (first slice may be empty when it is the first).
-          // 🤖 If this starts the next page from currentElement, and it happens to be
-          //     the very first child (empty first slice), registerPoint will push null
-          //     and we should abort to let the second pass run immediately.
-          if (registerPoint(currentElement)) return finalize();
+    // !currentElementChildren.length
+    const localPoints = [];
+    _isDebug(this) && console.log('🍎 currentElementChildren.length == 0');
+
+    // 🤖 NOTE: scaling is intentionally disabled here (see commented code below).
+    //     Tail vs full-page decisions are handled in a higher layer (row/table),
+    //     which ensures consistent window geometry before any scaling occurs.
+
+    const currentElementHeight = getOffsetHeightCached(currentElement);
+    const isUnbreakableOversized =
+      currentElementHeight > capacity &&
+      (
+        !localPoints.length ||
+        (localPoints.length === 1 && localPoints[0] === null)
+      );
+    if (isUnbreakableOversized) {
+      _isDebug(this) && console.warn(
+        '%c⚠️ UNSPLITTABLE OVERSIZED ELEMENT — SCALE IT',
+        'color:white; background:red; font-weight:bold;',
+        currentElement,
+        `height: ${currentElementHeight}`
+      );
+      _isDebug(this) && console.warn('🅾️ (2) points.push(null) in isUnbreakableOversized');
+      if (!points.length && currentElement === firstChild) {
+        points.push(null);
+        // 🤖 Early abort after placing sentinel: proceed to second pass.
+        return ABORT;
+      }
+      // 🤖 Keep scaling disabled here for the same reason as above: avoid early
+      //     visual transform before the paginator repositions the window.
+      // this.fitElementWithinHeight(currentElement, capacity)
+      if (nextElement) {
+        _isDebug(this) && console.warn('🅾️🅾️🅾️🅾️🅾️🅾️🅾️🅾️ registerPoint(nextElement)');
+        const pushedNull = registerPoint(nextElement);
+        // 🤖 Case: Unbreakable Oversized Without Children — `pushedNull` bubbles up when even the next sibling would start at the first child.
+        // 🤖 Geometrically this declares the first page empty; we stop so the fallback logic can reschedule layout.
+        if (pushedNull) {
+          return ABORT;
         }
       }
-
     } else {
 
-      // !currentElementChildren.length
-      _isDebug(this) && console.log('🍎 currentElementChildren.length == 0');
 
-      // 🤖 NOTE: scaling is intentionally disabled here (see commented code below).
-      //     Tail vs full-page decisions are handled in a higher layer (row/table),
-      //     which ensures consistent window geometry before any scaling occurs.
+      // * If no children,
+      // * move element to the next page.
+      const pushedNull = registerPoint(currentElement);
+      // 🤖 Case: Move Current To Next Page — `pushedNull` here means even the first inline block must start on the next page, leaving the current slice blank.
+      // 🤖 Geometrically we cannot consume height in the tail, so we bail out to let the fallback choose scaling/full-page flow.
+      if (pushedNull) return ABORT;
+      // ** But,
+    }
+
+    return CONTINUE;
+  };
+
+  // * Back from the children of level.currentElement.
+  const afterChildren = (level) => {
+    const { currentElement, nextElement, getOffsetHeightCached } = level;
+    // * The children have added their points to the shared `points`.
+    const localPoints = points;
+
+    if (localPoints.length === 0) {
+      // 🤖 Case: current element (with children) did not produce inner split points
+      //     in the first slice. This is the "tail window" scenario.
+      //     We use `room = max(firstPartHeight, fullPageHeight)` here ON PURPOSE:
+      //       - The first part can be as large as, or even larger than, a full page
+      //         (e.g., no top signpost deducted for the first part), so `room` is the
+      //         maximum admissible height for a non‑breakable element in the first slice.
+      //       - The action (move to next page vs. scale) is STILL deferred to the
+      //         row/table layer to maintain strict geometry; slicers only classify.
+      const room = Math.max(firstPartHeight, fullPageHeight);
 
       const currentElementHeight = getOffsetHeightCached(currentElement);
       const isUnbreakableOversized =
-        currentElementHeight > capacity &&
+        currentElementHeight > room &&
         (
           !localPoints.length ||
           (localPoints.length === 1 && localPoints[0] === null)
         );
+
+      _isDebug(this) && console.log('room (Math.max)', room);
+
       if (isUnbreakableOversized) {
         _isDebug(this) && console.warn(
           '%c⚠️ UNSPLITTABLE OVERSIZED ELEMENT — SCALE IT',
@@ -469,39 +543,68 @@ export function getSplitPoints({
           currentElement,
           `height: ${currentElementHeight}`
         );
-        _isDebug(this) && console.warn('🅾️ (2) points.push(null) in isUnbreakableOversized');
         if (!points.length && currentElement === firstChild) {
+          _isDebug(this) && console.warn('🅾️ (1) points.push(null) in isUnbreakableOversized');
           points.push(null);
-          // 🤖 Early abort after placing sentinel: proceed to second pass.
-          return finalize();
+          // 🤖 Early abort after placing sentinel: let the second pass handle next window.
+          return ABORT;
         }
-        // 🤖 Keep scaling disabled here for the same reason as above: avoid early
-        //     visual transform before the paginator repositions the window.
-        // this.fitElementWithinHeight(currentElement, capacity)
+        // 🤖 Early scaling here breaks strict geometry when the paginator
+        //     later re-computes the window (moves to full-page). Better approach:
+        //     - Register split (null/next) and let table.js decide scaling:
+        //       either scale tail (if really tail case) or scale in full-page.
+        //     - Leave this call disabled (see similar handling in the 'no children' branch).
+        // this.fitElementWithinHeight(currentElement, room)
         if (nextElement) {
-          _isDebug(this) && console.warn('🅾️🅾️🅾️🅾️🅾️🅾️🅾️🅾️ registerPoint(nextElement)');
           const pushedNull = registerPoint(nextElement);
-          // 🤖 Case: Unbreakable Oversized Without Children — `pushedNull` bubbles up when even the next sibling would start at the first child.
-          // 🤖 Geometrically this declares the first page empty; we stop so the fallback logic can reschedule layout.
-          if (pushedNull) {
-            return finalize();
-          }
+          // 🤖 Case: Unbreakable Oversized With Children — `pushedNull` means the next page must begin exactly at root's first child.
+          // 🤖 Geometrically we cannot fit any tail content, so we stop and delegate to the fallback (second pass / scaling decision).
+          if (pushedNull) return ABORT;
         }
       } else {
 
+        // FIXME: быстрый фикс, но помог. Проверить тщательно логику.
+        // Element is unbreakable and fits a full page, but does not fit the tail.
+        // Start the next page from currentElement (first slice may be empty when it is the first).
+        // 🤖 If this starts the next page from currentElement, and it happens to be
+        //     the very first child (empty first slice), registerPoint will push null
+        //     and we should abort to let the second pass run immediately.
+        if (registerPoint(currentElement)) return ABORT;
+      }
+    }
+
+    return CONTINUE;
+  };
+
+  const stack = [createLevel(children)];
+  // * The level whose current element is being descended into
+  // * waits for afterChildren() with `level.currentElement` set.
+  while (stack.length) {
+    const level = stack.at(-1);
 
-        // * If no children,
-        // * move element to the next page.
-        const pushedNull = registerPoint(currentElement);
-        // 🤖 Case: Move Current To Next Page — `pushedNull` here means even the first inline block must start on the next page, leaving the current slice blank.
-        // 🤖 Geometrically we cannot consume height in the tail, so we bail out to let the fallback choose scaling/full-page flow.
-        if (pushedNull) return finalize();
-        // ** But,
+    const step = (level.index >= level.children.length)
+      ? ABORT
+      : level.currentElement
+        ? afterChildren(level)
+        : processChild(level);
 
+    if (step === DESCEND) {
+      stack.push(createLevel(level.currentElementChildren));
+      continue;
     }
 
-    } // *** END of 'no children'
+    level.currentElement = null;
+    level.nextElement = null;
+    level.currentElementChildren = null;
 
+    if (step === ABORT) {
+      // * Done with this level: back to afterChildren() of the parent level.
+      _isDebug(this) && console.groupEnd(`walking through ${level.children.length} children`);
+      stack.pop();
+      continue;
+    }
+
+    level.index += 1;
   }
 
   return finalize();
@@ -761,65 +864,102 @@ export function isFirstSliceEmpty(points) {
  * Removes all elements outside this range (before start, after end, including end).
  * Used for DOM slicing (e.g., splitting pages).
  *
+ * Only the range is copied: the ancestors of startElement and endElement
+ * (the spines) are cloned shallowly, and the nodes between them deeply.
+ * Elements before the start spine and after the end spine are skipped,
+ * while non-element nodes (text, comments) are kept at all levels.
+ *
  * @param {Node} root - Node to clone and trim.
  * @param {Element|null} startElement - First element of the range.
  * @param {Element|null} endElement - Last element of the range.
  * @returns {Node} - Trimmed clone.
  */
 export function cloneAndCleanOutsideRange(root, startElement, endElement) {
-  startElement && startElement.setAttribute('split', `start`);
-  endElement && endElement.setAttribute('split', `end`);
-  let clone = root.cloneNode(true);
-
-  // Delete elements before startPoint (if startPoint is not the first)
-  if (startElement) {
-    // * remove siblings to left
-    let startEl = clone.querySelector(`[split="start"]`);
-    let prev = startEl.previousElementSibling;
-    while (prev) {
-      let toRemove = prev;
-      prev = prev.previousElementSibling;
-      toRemove.remove();
-    }
-    // * remove ancestors outside range
-    let ancestor = startEl.parentElement;
-    while (ancestor && ancestor !== root) {
-      let sibling = ancestor.previousElementSibling;
-      while (sibling) {
-        let toRemove = sibling;
-        sibling = sibling.previousElementSibling;
-        toRemove.remove();
-      }
-      ancestor = ancestor.parentElement;
-    }
-    startEl.removeAttribute('split'); // * Clear attribute
+  const startChain = startElement ? _getChainFromRoot.call(this, root, startElement) : null;
+  const endChain = endElement ? _getChainFromRoot.call(this, root, endElement) : null;
+  return _cloneRange.call(this, root, startChain, endChain, 0);
+}
+
+/**
+ * The ancestors of the element below root, from the top down, and the element itself.
+ *
+ * @this {Node}
+ */
+function _getChainFromRoot(root, element) {
+  const chain = [];
+  let current = element;
+  while (current && current !== root) {
+    chain.push(current);
+    current = this._DOM.getParentNode(current);
+  }
+  this.strictAssert(current === root, 'cloneAndCleanOutsideRange: the boundary is not within root', { root, element });
+  return chain.reverse();
+}
+
+/**
+ * Clones node with the children in range, where startChain[depth] and endChain[depth]
+ * are the children of node on the way to the boundaries (if any).
+ *
+ * @this {Node}
+ */
+function _cloneRange(node, startChain, endChain, depth) {
+  const startChild = startChain?.[depth];
+  const endChild = endChain?.[depth];
+
+  // * Entirely in range.
+  if (!startChild && !endChild) {
+    return this._DOM.cloneNode(node);
   }
 
-  // Delete elements after and including endPoint (if endPoint is not the last)
-  if (endElement) {
-    // * remove siblings to right and element
-    let endEl = clone.querySelector(`[split="end"]`);
-    let next = endEl.nextElementSibling;
-    while (next) {
-      let toRemove = next;
-      next = next.nextElementSibling;
-      toRemove.remove();
+  const clone = this._DOM.cloneNodeWrapper(node);
+  const isEndElement = endChild && depth === endChain.length - 1;
+  let isBeforeStart = !!startChild;
+  let isAfterEnd = false;
+
+  for (let child = node.firstChild; child; child = child.nextSibling) {
+    const isOnStart = child === startChild;
+    const isOnEnd = child === endChild;
+
+    if (isOnStart) {
+      isBeforeStart = false;
     }
-    // * remove ancestors outside range
-    let ancestor = endEl.parentElement;
-    while (ancestor && ancestor !== root) {
-      let sibling = ancestor.nextElementSibling;
-      while (sibling) {
-        let toRemove = sibling;
-        sibling = sibling.nextElementSibling;
-        toRemove.remove();
-      }
-      ancestor = ancestor.parentElement;
+
+    if (isOnEnd) {
+      isAfterEnd = true;
+      // * The end element itself is out of range.
+      if (isEndElement) continue;
+    }
+
+    if (isOnStart || isOnEnd) {
+      clone.appendChild(_cloneRange.call(
+        this,
+        child,
+        isOnStart ? startChain : null,
+        isOnEnd ? endChain : null,
+        depth + 1,
+      ));
+      continue;
     }
-    endEl.remove(); // * remove end element
+
+    if (this._DOM.isElementNode(child) && (isBeforeStart || isAfterEnd)) continue;
+
+    clone.appendChild(this._DOM.cloneNode(child));
   }
-  // * Clear attributes
-  startElement && startElement.removeAttribute('split');
-  endElement && endElement.removeAttribute('split');
+
   return clone;
 }
+
+/**
+ * Whether the element takes part in the normal flow of its parent:
+ * not floated, not absolutely or fixed positioned.
+ *
+ * @this {Node}
+ */
+function _isInNormalFlow(element) {
+  if (!this._DOM.isElementNode(element)) return false;
+  const style = this._DOM.getComputedStyle(element);
+  return !!style
+    && (!style.float || style.float === 'none')
+    && style.position !== 'absolute'
+    && style.position !== 'fixed';
+}
@@ -26,6 +26,33 @@ export function splitTextByWordsGreedy(node) { // ? in prepareSplittedNode
   return arr
 }
 
+// * Created once: constructing a segmenter loads the locale data.
+let _graphemeSegmenter;
+
+/**
+ * Returns the start offsets of the grapheme clusters of the text:
+ * the positions where a line can start, also in scripts written
+ * without spaces (CJK, Thai), for which splitTextByWordsGreedy
+ * returns the whole text as one word.
+ * Intl.Segmenter keeps clusters (emoji, combining marks) whole;
+ * without it, code points are used.
+ *
+ * @this {Node}
+ */
+export function getGraphemeOffsets(text) {
+  if (typeof Intl !== 'undefined' && Intl.Segmenter) {
+    _graphemeSegmenter = _graphemeSegmenter || new Intl.Segmenter(undefined, { granularity: 'grapheme' });
+    return Array.from(_graphemeSegmenter.segment(text), segment => segment.index);
+  }
+  const offsets = [];
+  let offset = 0;
+  for (const char of text) {
+    offsets.push(offset);
+    offset += char.length;
+  }
+  return offsets;
+}
+
 /**
 * @this {Node}
 */
@@ -26,6 +26,7 @@ import * as PaginationShortTail from './modules/pagination/shortTail.js';
 import * as PaginationEvaluation from './modules/pagination/evaluation.js';
 import * as PaginationResolution from './modules/pagination/resolution.js';
 import CacheState from './cache/index.js';
+import AncestorIndex from './cache/ancestorIndex.js';
 import { MarkersState } from './markers/index.js';
 import Paragraph from './elements/paragraph.js';
 import Table from './elements/table.js';
@@ -47,14 +48,15 @@ export default class Node {
     this._debug = config.debugMode ? { ...config.debugConfig.node } : {};
     this._assert = config.consoleAssert ? true : false;
     this._markupDebugMode = this._config.markupDebugMode;
-    this._markers = new MarkersState({
-      debugMode: this._config.debugMode,
-      markupDebugMode: this._config.markupDebugMode,
-      setAttribute: this._DOM.setAttribute.bind(this._DOM),
-      removeAttribute: this._DOM.removeAttribute.bind(this._DOM),
-    });
+    this._markers = this._createMarkersState();
     this._marks = this._markers.marks;
-    this._cache = new CacheState();
+    this._cache = new CacheState({
+      measure: this._DOM.getMeasureCache(),
+      ancestors: new AncestorIndex({
+        getStructureGeneration: () => this._DOM.getStructureGeneration(),
+        getLayoutGeneration: () => this._DOM.getLayoutGeneration(),
+      }),
+    });
 
     Object.assign(this, Logging);
 
@@ -117,6 +119,26 @@ export default class Node {
     });
   }
 
+  /**
+   * Drops all marks, the structural registries (page starts, page ends,
+   * page numbers, page dividers) and the measurement caches,
+   * so that nothing from a previous render leaks into the next one.
+   */
+  resetState() {
+    this._markers = this._createMarkersState();
+    this._marks = this._markers.marks;
+    this._cache.resetMeasureCache();
+  }
+
+  _createMarkersState() {
+    return new MarkersState({
+      debugMode: this._config.debugMode,
+      markupDebugMode: this._config.markupDebugMode,
+      setAttribute: this._DOM.setAttribute.bind(this._DOM),
+      removeAttribute: this._DOM.removeAttribute.bind(this._DOM),
+    });
+  }
+
   clearTemplates(root) {
     // Remove all <template>s, if there are any in the Root.
     const templates = this._DOM.getAll('template', root);
@@ -0,0 +1,265 @@
+// 📐 Grid track index
+
+// * Tolerate sub-pixel jitter when detecting row breaks and comparing track offsets.
+const ROW_TOP_STEP = 0.5;
+const TRACK_TOLERANCE = 1;
+
+/**
+ * Geometry index of one grid container: its cells grouped into rows,
+ * and the top and bottom of every row.
+ *
+ * The rows are built in one pass over the cells' computed styles.
+ * Auto-placed cells (no explicit lines, spans or `order`) are grouped
+ * by the number of resolved column tracks; the grouping is checked
+ * with the left edges of the first and the last cell of every row.
+ * Otherwise the cells are measured once and grouped by vertical position.
+ *
+ * Row bounds are the cumulative offsets of the resolved `grid-template-rows`
+ * (the used track sizes) and `row-gap`. They are anchored with the measured
+ * top of the first row and checked against the measured bottom of the last one,
+ * i.e. four cell measurements at most per layout generation.
+ * If the tracks are not resolved into pixels, do not match the rows,
+ * or the check fails, getRowBounds() returns null
+ * and the caller should measure the cells of the row.
+ */
+export default class GridTrackIndex {
+  constructor({ containerStyle, cells, getStyle, getTop, getBottom, getLeft, getGeneration }) {
+    this._containerStyle = containerStyle;
+    this._getStyleFn = getStyle;
+    this._getTop = getTop;
+    this._getBottom = getBottom;
+    this._getLeft = getLeft;
+    this._getGeneration = getGeneration || null;
+
+    this._styles = new WeakMap();
+    this._rowIndexes = new Map();
+    this._tracks = undefined;
+    this._tracksGeneration = undefined;
+
+    this.hasRowSpan = false;
+    this.hasColumnSpan = false;
+    this.hasImplicitRowGaps = false;
+    this.rows = this._buildRows(cells);
+  }
+
+  // * Computed styles of the cells, read once; the declarations are live.
+  getStyle(element) {
+    if (!element) return null;
+    let style = this._styles.get(element);
+    if (!style) {
+      style = this._getStyleFn(element);
+      this._styles.set(element, style);
+    }
+    return style;
+  }
+
+  /**
+   * @param {Array} row - a row of cells, as stored in `rows`
+   * @param {Array} rows - the current rows (they are updated when rows are sliced)
+   * @returns {{top: number, bottom: number}|null}
+   */
+  getRowBounds(row, rows) {
+    const index = this._getRowIndex(row, rows);
+    if (index < 0) return null;
+    const tracks = this._getTracks(rows);
+    if (!tracks) return null;
+    return { top: tracks.tops[index], bottom: tracks.bottoms[index] };
+  }
+
+  _buildRows(cells) {
+    const rowIndexSet = new Set();
+    let isAutoPlaced = true;
+
+    cells.forEach((cell) => {
+      const style = this.getStyle(cell);
+      const rowStart = parseInt(style.gridRowStart, 10);
+
+      // ** Detect spans and collect row-start indices.
+      // ** If row-starts jump beyond known current rows (implicit tracks/gaps),
+      // ** or any cell spans rows/columns, the grid should not be split.
+      const rowEnd = style.gridRowEnd || '';
+      const colEnd = style.gridColumnEnd || '';
+      this.hasRowSpan = this.hasRowSpan || rowEnd.includes('span');
+      this.hasColumnSpan = this.hasColumnSpan || colEnd.includes('span');
+      Number.isFinite(rowStart) && rowIndexSet.add(rowStart);
+      // todo: span w/o 'span' keyword
+      // todo: gridRowEnd/gridColumnEnd as Num/-1
+      // todo: gridRowStart asNaN (named lines)
+      // todo: improve "implicit row gaps"?
+      // - misses within a set of starts:
+      // - for example, if rowIndexSet contains {1,3,5}, and 2 and 4 are missing?
+
+      isAutoPlaced = isAutoPlaced && _isAutoPlaced(style);
+    });
+
+    const columnCount = _parseTrackSizes(this._containerStyle?.gridTemplateColumns)?.length;
+    const groups = (isAutoPlaced && columnCount > 0)
+      ? _groupByColumnCount(cells, columnCount)
+      : null;
+    const rows = (groups && this._isGroupingAligned(groups))
+      ? groups
+      : this._groupByPosition(cells);
+
+    this.hasImplicitRowGaps = rowIndexSet.size > 0 && Math.max(...rowIndexSet) > rows.length;
+    return rows;
+  }
+
+  // * Other grid items, not among the cells (e.g. a generated ::before
+  // * of the container), take slots too and shift the cells of every row:
+  // * then the rows no longer start in the same column
+  // * or wrap to the next line before their last cell.
+  _isGroupingAligned(groups) {
+    if (!this._getLeft) return false;
+    const firstLeft = this._getLeft(groups[0][0]);
+    if (!Number.isFinite(firstLeft)) return false;
+    return groups.every((group) => {
+      const left = this._getLeft(group[0]);
+      if (!Number.isFinite(left) || Math.abs(left - firstLeft) > ROW_TOP_STEP) return false;
+      return group.length < 2 || this._getLeft(group.at(-1)) > left;
+    });
+  }
+
+  // ***** Rely on vertical position only:
+  // ***** we support linear, monotonic grids for now.
+  // * We track a row’s vertical band (top/bottom) and only start a new row
+  // * when a cell falls outside that band;
+  // * explicit grid-row-start indices still short-circuit when present.
+  _groupByPosition(cells) {
+    const rows = [];
+    let currentRowTrack = null;
+    let currentRowTop = null;
+    let currentRowBottom = null;
+
+    cells.forEach((cell) => {
+      const rowStart = parseInt(this.getStyle(cell).gridRowStart, 10);
+      const hasRowIndex = Number.isFinite(rowStart);
+      const top = this._getTop(cell);
+      const bottom = this._getBottom(cell);
+
+      let startNewRow = false;
+
+      if (!rows.length) {
+        // * the first cell always seeds the row bucket
+        startNewRow = true;
+      } else if (hasRowIndex && currentRowTrack != null) {
+        // * when CSS explicitly names grid row tracks, rely on that index
+        startNewRow = rowStart !== currentRowTrack;
+      } else if (currentRowBottom != null) {
+        // * fallback: treat the row as a vertical band;
+        // * if the next cell sits below the band, start a new row
+        startNewRow = top >= (currentRowBottom - ROW_TOP_STEP);
+      } else if (currentRowTop != null) {
+        startNewRow = Math.abs(top - currentRowTop) > ROW_TOP_STEP;
+      } else {
+        startNewRow = true;
+      }
+
+      if (startNewRow) {
+        rows.push([cell]);
+        currentRowTrack = hasRowIndex ? rowStart : null;
+        currentRowTop = top;
+        currentRowBottom = bottom;
+      } else {
+        rows[rows.length - 1].push(cell);
+        if (hasRowIndex && currentRowTrack == null) {
+          currentRowTrack = rowStart;
+        }
+        if (currentRowTop == null || top < currentRowTop) {
+          currentRowTop = top;
+        }
+        if (currentRowBottom == null || bottom > currentRowBottom) {
+          currentRowBottom = bottom;
+        }
+      }
+    });
+
+    return rows;
+  }
+
+  _getRowIndex(row, rows) {
+    if (!Array.isArray(row) || !Array.isArray(rows)) return -1;
+    let index = this._rowIndexes.get(row);
+    if (index === undefined || rows[index] !== row) {
+      // * The rows were replaced with their slices: re-index them.
+      this._rowIndexes = new Map(rows.map((item, i) => [item, i]));
+      index = this._rowIndexes.get(row);
+    }
+    return index === undefined ? -1 : index;
+  }
+
+  _getTracks(rows) {
+    const generation = this._getGeneration ? this._getGeneration() : 0;
+    if (this._tracks === undefined || this._tracksGeneration !== generation) {
+      this._tracks = this._resolveTracks(rows);
+      this._tracksGeneration = generation;
+    }
+    return this._tracks;
+  }
+
+  _resolveTracks(rows) {
+    const sizes = _parseTrackSizes(this._containerStyle?.gridTemplateRows);
+    if (!sizes || !sizes.length || sizes.length !== rows.length) return null;
+
+    const gap = parseFloat(this._containerStyle.rowGap) || 0; // * 'normal' is 0 in grids
+    const origin = _measureRow.call(this, rows[0], 'top');
+    if (!Number.isFinite(origin)) return null;
+
+    const tops = new Array(sizes.length);
+    const bottoms = new Array(sizes.length);
+    let top = origin;
+    sizes.forEach((size, index) => {
+      tops[index] = top;
+      bottoms[index] = top + size;
+      top += size + gap;
+    });
+
+    // * Margins, alignment or distributed space put the rows elsewhere:
+    // * the tracks do not describe the cells, measure them instead.
+    const lastBottom = _measureRow.call(this, rows[rows.length - 1], 'bottom');
+    if (!Number.isFinite(lastBottom) || Math.abs(lastBottom - bottoms[bottoms.length - 1]) > TRACK_TOLERANCE) {
+      return null;
+    }
+
+    return { tops, bottoms };
+  }
+}
+
+function _isAutoPlaced(style) {
+  return style.gridRowStart === 'auto'
+    && style.gridRowEnd === 'auto'
+    && style.gridColumnStart === 'auto'
+    && style.gridColumnEnd === 'auto'
+    && (style.order === '0' || !style.order)
+    && style.display !== 'none'
+    && style.position !== 'absolute'
+    && style.position !== 'fixed';
+}
+
+// * Auto-placement in row flow (not dense) fills the rows one by one.
+function _groupByColumnCount(cells, columnCount) {
+  const rows = [];
+  for (let i = 0; i < cells.length; i += columnCount) {
+    rows.push(cells.slice(i, i + columnCount));
+  }
+  return rows;
+}
+
+// * The resolved value lists the used size of every track in pixels,
+// * e.g. '120px 80.5px 200px'; anything else cannot be used.
+function _parseTrackSizes(value) {
+  if (!value || value === 'none') return null;
+  const tokens = value.trim().split(/\s+/);
+  const sizes = tokens.map(token => /^-?[\d.]+(e[+-]?\d+)?px$/i.test(token) ? parseFloat(token) : NaN);
+  return sizes.every(Number.isFinite) ? sizes : null;
+}
+
+/**
+ * @this {GridTrackIndex}
+ */
+function _measureRow(row, edge) {
+  const values = (Array.isArray(row) ? row : [])
+    .map(cell => edge === 'top' ? this._getTop(cell) : this._getBottom(cell))
+    .filter(Number.isFinite);
+  if (!values.length) return undefined;
+  return edge === 'top' ? Math.min(...values) : Math.max(...values);
+}
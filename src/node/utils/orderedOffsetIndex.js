@@ -0,0 +1,113 @@
+// 📐 Ordered offset index
+
+/**
+ * Lazily filled index of the tops and bottoms of sibling elements.
+ *
+ * Block children in normal flow are ordered: both their tops and
+ * their bottoms (with margins) grow with the index. This lets us find
+ * the first child crossing a boundary with a binary search,
+ * i.e. with O(log n) measurements instead of measuring every child.
+ *
+ * The values are read on demand through the provided getters and kept
+ * for the lifetime of the index, so it must not outlive the layout
+ * it was built for.
+ *
+ * The binary search samples only some of the elements, so a disorder
+ * between the samples goes unnoticed: a floated or positioned element
+ * whose bottom crosses the limit would be taken as fitting.
+ * With `isInFlow`, the sampled elements and the whole run that the search
+ * would skip are checked, each element once, lazily:
+ * a run with an element out of flow is not skipped.
+ */
+export default class OrderedOffsetIndex {
+  constructor({ elements, getTop, getBottom, isInFlow = null }) {
+    this._elements = elements;
+    this._getTop = getTop;
+    this._getBottom = getBottom;
+    this._isInFlow = isInFlow;
+    this._tops = new Array(elements.length);
+    this._bottoms = new Array(elements.length);
+    this._inFlow = new Array(elements.length);
+  }
+
+  get length() {
+    return this._elements.length;
+  }
+
+  getTop(index) {
+    if (this._tops[index] === undefined) {
+      this._tops[index] = this._getTop(this._elements[index]);
+    }
+    return this._tops[index];
+  }
+
+  getBottom(index) {
+    if (this._bottoms[index] === undefined) {
+      this._bottoms[index] = this._getBottom(this._elements[index]);
+    }
+    return this._bottoms[index];
+  }
+
+  isInFlow(index) {
+    if (!this._isInFlow) return true;
+    if (this._inFlow[index] === undefined) {
+      this._inFlow[index] = this._isInFlow(this._elements[index]) ? true : false;
+    }
+    return this._inFlow[index];
+  }
+
+  /**
+   * Finds the first element in [from, to) that does not fit above `limit`.
+   * An element fits when both its bottom and the top of the next element
+   * are not below `limit`, so `to` must be less than `length`.
+   *
+   * @param {number} from
+   * @param {number} to
+   * @param {number} limit
+   * @returns {number|null} The index (`to` if all of them fit),
+   * or null if the elements turn out not to be ordered, not to be in flow,
+   * or cannot be measured: the caller should fall back to a linear scan.
+   */
+  findFirstOverflow(from, to, limit) {
+    let low = from;
+    let high = to;
+    let lastFit = -1;
+
+    while (low < high) {
+      const middle = (low + high) >>> 1;
+      const top = this.getTop(middle);
+      const nextTop = this.getTop(middle + 1);
+      const bottom = this.getBottom(middle);
+
+      if (!Number.isFinite(top) || !Number.isFinite(nextTop) || !Number.isFinite(bottom)) {
+        return null;
+      }
+      if (!this.isInFlow(middle) || !this.isInFlow(middle + 1)) {
+        return null;
+      }
+      // * Out of order: floats, positioned or overlapping children.
+      if (
+        nextTop < top
+        || (lastFit >= 0 && (top < this.getTop(lastFit) || bottom < this.getBottom(lastFit)))
+      ) {
+        return null;
+      }
+
+      if (bottom <= limit && nextTop <= limit) {
+        lastFit = middle;
+        low = middle + 1;
+      } else {
+        high = middle;
+      }
+    }
+
+    // * The skipped elements between the samples.
+    for (let index = from; index < low; index++) {
+      if (!this.isInFlow(index)) {
+        return null;
+      }
+    }
+
+    return low;
+  }
+}
@@ -1,5 +1,7 @@
 import arrayFromString from './arrayFromString.js';
 import * as Logging from '../utils/logging.js';
+import { countOperation, startCountingPage } from '../utils/counters.js';
+import { yieldToMain, createTimeSlice } from '../utils/yieldToMain.js';
 
 const CONSOLE_CSS_COLOR_PAGES = '#66CC00';
 const CONSOLE_CSS_PRIMARY_PAGES = `color: ${CONSOLE_CSS_COLOR_PAGES};font-weight:bold`;
@@ -9,6 +11,9 @@ const CONSOLE_CSS_LABEL_PAGES = `border:1px solid ${CONSOLE_CSS_COLOR_PAGES};`
 
 const CONSOLE_CSS_END_LABEL = `background:#999;color:#FFF;padding: 0 4px;`;
 
+// * Default time budget (ms) of one slice of the time-sliced pagination.
+const DEFAULT_TIME_SLICE_MS = 16;
+
 export default class Pages {
 
   constructor({
@@ -26,6 +31,8 @@ export default class Pages {
     // * From config:
     this._debug = config.debugMode ? { ...config.debugConfig.pages } : {};
     this._assert = config.consoleAssert ? true : false;
+    // * Time-sliced pagination (see calculateInSlices):
+    this._timeSliceMs = parseFloat(config.timeSliceMs) || DEFAULT_TIME_SLICE_MS;
 
     // * Private
     this._selector = selector;
@@ -81,22 +88,67 @@ export default class Pages {
     // * ***
     this._contentFlowEnd;
     this._contentFlowLastChild;
+    // * Progress:
+    this._onProgress = null;
+    this._processedElements = 0;
     // * Public
 
     this.pages = [];
   }
 
-  calculate() {
+  /**
+   * Paginates the content flow in one go.
+   *
+   * @param {Object} [options]
+   * @param {Function} [options.onProgress] - called with { pages, elements } when done
+   * @returns {Array} pages
+   */
+  calculate({ onProgress } = {}) {
+    this._onProgress = onProgress || null;
     this._removeGarbageElements();
     this._prepareConfigSelectorConstraints();
-    this._calculatePageStarts();
+    const content = this._calculatePageStarts();
+    content && this._parseNodes({ array: content });
+    return this._completeCalculation();
+  }
+
+  /**
+   * Paginates the content flow in slices of about config.timeSliceMs,
+   * yielding to the main thread between them, so that the page
+   * stays responsive on huge documents.
+   * Each slice ends between two _parseNode calls: a single split
+   * (of a long table, for example) is not interrupted.
+   *
+   * @param {Object} [options]
+   * @param {Function} [options.onProgress] - called with { pages, elements }
+   * after each slice and when done
+   * @returns {Promise<Array>} pages
+   */
+  async calculateInSlices({ onProgress } = {}) {
+    this._onProgress = onProgress || null;
+    this._removeGarbageElements();
+    this._prepareConfigSelectorConstraints();
+    const content = this._calculatePageStarts();
+    content && await this._parseNodesInSlices({ array: content });
+    return this._completeCalculation();
+  }
+
+  _completeCalculation() {
     this._resolvePageEnds();
+    this._reportProgress();
 
     this._debug._ && console.log('%c ✔ Pages.calculate()', CONSOLE_CSS_LABEL_PAGES, this.pages);
 
     return this.pages;
   }
 
+  _reportProgress() {
+    this._onProgress && this._onProgress({
+      pages: this.pages.length,
+      elements: this._processedElements,
+    });
+  }
+
   _removeGarbageElements() {
     const _garbageSelectors = arrayFromString(this._configSelectors.garbage);
     if (_garbageSelectors.length) {
@@ -240,6 +292,8 @@ export default class Pages {
     );
   }
 
+  // * Registers the page starts that do not depend on the content,
+  // * and returns the contentFlow children to parse (if any).
   _calculatePageStarts() {
 
     // ✳️ register a FIRST page
@@ -251,7 +305,7 @@ export default class Pages {
       // Check for forced page breaks, and if they are, we register these pages.
       // If not - we'll have a single page.
       this._resolveForcedPBInsideContentFlow();
-      return;
+      return null;
     }
 
     // ✳️ continue to analyze contentFlow children
@@ -266,9 +320,7 @@ export default class Pages {
     this._debug._ && console.log(content);
     this._debug._ && console.groupEnd('%c🚸 children(contentFlow)', CONSOLE_CSS_LABEL_PAGES);
 
-    this._parseNodes({
-      array: content
-    });
+    return content;
   }
 
   _resolvePageEnds() {
@@ -341,6 +393,7 @@ export default class Pages {
       pageTopAnchor: pageStartTopInfo?.anchor || null,
       prevPageEnd: prevPageEnd,
     });
+    startCountingPage();
     this._node.markPageStart(pageStart, this.pages.length);
     this._debug._registerPageStart && console.log(
       `%c📍register page ${this.pages.length}`, "background:yellow;font-weight:bold",
@@ -359,30 +412,117 @@ export default class Pages {
     arrayTopParent,
     arrayBottomParent,
   }) {
-    this._debug._parseNodes && console.log('🔵 _parseNodes', {array, arrayTopParent, arrayBottomParent});
+    // * _parseNode does not recurse into the children it cannot fit:
+    // * it returns them, and the walker descends into them.
+    const walker = this._walkNodes({ previous, next, array, arrayTopParent, arrayBottomParent });
+    let step = walker.next();
+    while (!step.done) {
+      const children = this._parseNode(step.value);
+      this._processedElements += 1;
+      step = walker.next(children);
+    }
+  }
+
+  // * The same traversal as _parseNodes, interrupted when the time slice is over.
+  // * While the main thread is yielded, the layout can change without DOM:
+  // * late images and fonts load, the window is resized.
+  // * So each slice starts a new layout generation,
+  // * and the measurements cached for the previous one are not reused
+  // * (the tree itself is only changed through DOM).
+  async _parseNodesInSlices({
+    previous,
+    next,
+    array,
+    arrayTopParent,
+    arrayBottomParent,
+  }) {
+    const walker = this._walkNodes({ previous, next, array, arrayTopParent, arrayBottomParent });
+    const slice = createTimeSlice(this._timeSliceMs);
+    let step = walker.next();
+    while (!step.done) {
+      const children = this._parseNode(step.value);
+      this._processedElements += 1;
+      if (slice.isOver()) {
+        this._reportProgress();
+        await yieldToMain();
+        this._DOM.invalidateGeometry();
+        slice.restart();
+      }
+      step = walker.next(children);
+    }
+  }
+
+  // * Explicit-stack traversal: yields the elements to parse in document order,
+  // * with their neighbours and boundary flags, and takes back the children
+  // * to descend into. Deeply nested content does not grow the call stack.
+  *_walkNodes(params) {
+    const stack = [this._createWalkFrame(params)];
 
-    for (let i = 0; i < array.length; i++) {
+    while (stack.length) {
+      const frame = stack.at(-1);
+
+      if (frame.index >= frame.array.length) {
+        stack.pop();
+        frame.parent && this._endParseNodeChildren(frame.parent);
+        continue;
+      }
+
+      const i = frame.index++;
+      const array = frame.array;
       const currentElement = array[i];
+
       const isFirstChild = i === 0;
       const isLastChild = i === array.length - 1;
 
       // * First and last children inherit the parent as the page anchor when possible
       // *** Here we throw from above or reset for non-edge ones.
-      const _topParent = isFirstChild ? arrayTopParent : undefined;
-      const _bottomParent = (isLastChild && arrayBottomParent) ? arrayBottomParent : undefined;
+      const _topParent = isFirstChild ? frame.arrayTopParent : undefined;
+      const _bottomParent = (isLastChild && frame.arrayBottomParent) ? frame.arrayBottomParent : undefined;
 
-      this._parseNode({
-        previousElement: array[i - 1] || previous,
+      const children = yield {
+        previousElement: array[i - 1] || frame.previous,
         currentElement,
-        nextElement: array[i + 1] || next,
+        nextElement: array[i + 1] || frame.next,
         isFirstChild,
         isLastChild,
         arrayTopParent: _topParent, // provided only for boundary children where the wrapper matters
         arrayBottomParent: _bottomParent, // provided only for boundary children where the wrapper matters
-      });
+      };
+
+      if (children) {
+        stack.push(this._createWalkFrame(children));
+      }
     }
   }
 
+  _createWalkFrame({
+    previous,
+    next,
+    array,
+    arrayTopParent,
+    arrayBottomParent,
+    parent,
+  }) {
+    this._debug._parseNodes && console.log('🔵 _parseNodes', {array, arrayTopParent, arrayBottomParent});
+
+    return {
+      previous,
+      next,
+      array,
+      arrayTopParent,
+      arrayBottomParent,
+      parent, // * the element whose children these are
+      index: 0,
+    };
+  }
+
+  // * Completes the _parseNode call that returned the children of the element.
+  _endParseNodeChildren(currentElement) {
+    this._node.markProcessed(currentElement, `getSplitChildren and _parseNodes`);
+    this._debug._parseNode && console.log(`%c END _parseNode [•••]`, CONSOLE_CSS_END_LABEL, { currentElement });
+    this._debug._parseNode && console.groupEnd();
+  }
+
   // 📍
   _parseNode({
     isFirstChild,
@@ -393,6 +533,7 @@ export default class Pages {
     arrayTopParent,
     arrayBottomParent,
   }) {
+    countOperation('parseNode');
     const consoleMark = ['%c[_parseNode]\n', 'color:white;',]
 
     this._debug._parseNode && console.groupCollapsed(
@@ -1088,14 +1229,16 @@ export default class Pages {
         const isSlicedParent = this._node.isSliced(currentElement) || this._node.isSlough(currentElement);
 
         this._debug._parseNode && console.log({isSlicedParent, arrayTopParent,})
-        this._parseNodes({
+        // * The children are parsed by the walker (see _walkNodes),
+        // * which then completes this call with _endParseNodeChildren.
+        return {
           array: children,
           previous: previousElement,
           next: nextElement,
           arrayTopParent: isSlicedParent ? undefined : _arrayTopParent,
           arrayBottomParent: isSlicedParent ? undefined : _arrayBottomParent,
-        });
-        this._node.markProcessed(currentElement, `getSplitChildren and _parseNodes`);
+          parent: currentElement,
+        };
       } else {
         // * If no children,
         // * move element to the next page.
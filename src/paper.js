@@ -60,27 +60,33 @@ export default class Paper {
   }
 
   createPageChrome({ pageNumber, pageCount }) {
-    const wrapper = this._node.create(this._pageChromeSelector);
+    // * The chrome is compiled once and cloned for every page:
+    // * the header and footer templates are parsed only once.
+    this._pageChromeTemplate = this._pageChromeTemplate || this._compilePageChrome();
+    const { element, bodyPath, pageNumberSlots } = this._pageChromeTemplate;
+
+    const wrapper = this._DOM.cloneNode(element);
     this._node.markPageNumber(wrapper, pageNumber);
-    const pageElements = this._composePageElements({ pageNumber, pageCount });
-    this._DOM.insertAtEnd(
-      wrapper,
-      pageElements
-    );
+    this._node.markPageNumber(this._getByChildPath(wrapper, bodyPath), pageNumber);
+
+    if (pageNumber && pageCount) {
+      pageNumberSlots.forEach(({ currentPath, totalPath }) => {
+        this._setPageNumberSlot(wrapper, currentPath, pageNumber);
+        this._setPageNumberSlot(wrapper, totalPath, pageCount);
+      });
+    }
 
     return wrapper;
   }
 
-  _composePageElements({ pageNumber, pageCount }) {
-    const fragment = this._DOM.createDocumentFragment();
-
+  _compilePageChrome() {
+    const wrapper = this._node.create(this._pageChromeSelector);
     const body = this._createPageBodySpacer(this.bodyHeight);
-    this._node.markPageNumber(body, pageNumber);
     const header = this._createPageHeader(this._headerTemplate);
     const footer = this._createPageFooter(this._footerTemplate);
 
     this._DOM.insertAtEnd(
-      fragment,
+      wrapper,
       this.createVirtualTopMargin(),
       header,
       body,
@@ -88,12 +94,21 @@ export default class Paper {
       this.createVirtualBottomMargin(),
     );
 
-    if (pageNumber && pageCount) {
-      this._setPageNumber(header, pageNumber, pageCount);
-      this._setPageNumber(footer, pageNumber, pageCount);
-    }
-
-    return fragment;
+    // * Slots: the page number elements are addressed by their paths
+    // * of child indexes, which are the same in every clone.
+    const pageNumberSlots = [header, footer]
+      .map(target => this._findPageNumberElements(target))
+      .filter(Boolean)
+      .map(({ currentNum, totalNum }) => ({
+        currentPath: this._getChildPath(wrapper, currentNum),
+        totalPath: this._getChildPath(wrapper, totalNum),
+      }));
+
+    return {
+      element: wrapper,
+      bodyPath: this._getChildPath(wrapper, body),
+      pageNumberSlots,
+    };
   }
 
   createFrontpage() {
@@ -139,7 +154,11 @@ export default class Paper {
 
   createVirtualPaper(pageElements) {
 
-    const paper = this._node.create(this._virtualPaperSelector);
+    // * A blank paper is cloned from the one created first.
+    this._virtualPaperTemplate = this._virtualPaperTemplate || this._node.create(this._virtualPaperSelector);
+    const paper = pageElements
+      ? this._node.create(this._virtualPaperSelector)
+      : this._DOM.cloneNode(this._virtualPaperTemplate);
 
     pageElements && this._DOM.insertAtEnd(
       paper,
@@ -191,7 +210,7 @@ export default class Paper {
     return _node;
   }
 
-  _setPageNumber(target, current, total) {
+  _findPageNumberElements(target) {
     const container = this._pageNumberRootSelector
       ? this._DOM.getElement(this._pageNumberRootSelector, target)
       : this._pageNumberRootSelector;
@@ -199,9 +218,26 @@ export default class Paper {
     if (container) {
       const currentNum = this._DOM.getElement(this._pageNumberCurrentSelector, container);
       const totalNum = this._DOM.getElement(this._pageNumberTotalSelector, container);
-      this._DOM.setInnerHTML(currentNum, current);
-      this._DOM.setInnerHTML(totalNum, total);
+      return { currentNum, totalNum };
+    }
+  }
+
+  _setPageNumberSlot(wrapper, path, value) {
+    const element = path && this._getByChildPath(wrapper, path);
+    element && this._DOM.setTextContent(element, value);
+  }
+
+  _getChildPath(root, element) {
+    if (!element) return null;
+    const path = [];
+    for (let current = element; current !== root; current = this._DOM.getParentNode(current)) {
+      path.unshift([...this._DOM.getChildren(this._DOM.getParentNode(current))].indexOf(current));
     }
+    return path;
+  }
+
+  _getByChildPath(root, path) {
+    return path.reduce((element, index) => this._DOM.getChildren(element)[index], root);
   }
 
   _calculatePaperParams() {
@@ -7,6 +7,8 @@ export default class Preloader {
   constructor(customConfig) {
     this._debugMode = customConfig.debugMode; // Only enabled via user configuration
     this._preloader;
+    this._progress;
+    this._style;
     this._preloaderTarget = this._resolveTarget(customConfig) || document.body;
     this._preloaderBackground = customConfig.preloaderBackground || 'white';
   }
@@ -23,29 +25,52 @@ export default class Preloader {
     this._debugMode && console.groupEnd('%c Preloader ', CONSOLE_CSS_LABEL_PRELOADER);
   }
 
+  // * Shows the pagination progress: { pages, elements }.
+  setProgress({ pages, elements }) {
+    if (!this._preloader) { return }
+
+    if (!this._progress) {
+      this._progress = document.createElement('div');
+      this._progress.classList.add('lds-dual-ring-progress');
+      this._preloader.append(this._progress);
+    }
+    this._progress.textContent = `${pages} pages · ${elements} elements`;
+  }
+
   remove() {
     if (!this._preloader) { return }
 
+    const preloader = this._preloader;
     let op = 1;  // initial opacity
 
     const fadeTimer = setInterval(() => {
         if (op <= 0.1){
             clearInterval(fadeTimer);
-            this._preloader.remove();
+            preloader.remove();
         }
-        this._preloader.style.opacity = op;
+        preloader.style.opacity = op;
         op -= op * 0.1;
     }, 50);
 
     this._debugMode && console.log("%c Preloader removed ", CONSOLE_CSS_LABEL_PRELOADER);
   }
 
+  // * Removes the preloader and its style at once, without fading out.
+  destroy() {
+    this._preloader && this._preloader.remove();
+    this._style && this._style.remove();
+    this._preloader = undefined;
+    this._progress = undefined;
+    this._style = undefined;
+  }
+
   _insertStyle() {
     const head = document.querySelector('head');
     const style = document.createElement('style');
     style.append(document.createTextNode(this._css()));
     style.setAttribute("data-preloader-style", '');
     head.append(style);
+    this._style = style;
   }
 
   _css() {
@@ -60,6 +85,10 @@ export default class Preloader {
       justify-content: center;
       align-items: center;
     }
+    .lds-dual-ring-progress {
+      font: 14px/1.5 sans-serif;
+      color: #999999;
+    }
     /*
     .lds-dual-ring:after {
       content: " ";
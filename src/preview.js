@@ -167,35 +167,45 @@ export default class Preview {
   }
 
   _processPages() {
-    for (let index = 0; index < this._pages.length; index++) {
+    // * The papers and page chromes are built into fragments,
+    // * and each flow is committed with a single insertion.
+    const paperFlow = this._DOM.createDocumentFragment();
+    const overlayFlow = this._DOM.createDocumentFragment();
 
+    const separators = this._pages.map((page, index) => ({
       // insert paper and get separator for balancing
-      const paperSeparator = this._insertIntoPaperFlow(index);
-
+      paperSeparator: this._insertIntoPaperFlow(index, paperFlow),
       // insert page and get separator for balancing
-      const pageSeparator = this._insertIntoOverlayFlow(index);
+      pageSeparator: this._insertIntoOverlayFlow(index, overlayFlow),
+    }));
+
+    this._DOM.insertAtEnd(this._paperFlow, paperFlow);
+    this._DOM.insertAtEnd(this._overlayFlow, overlayFlow);
 
+    // * The footers are balanced against the separators in the flows,
+    // * so the content flow is processed when both flows are in the DOM.
+    separators.forEach(({ pageSeparator, paperSeparator }, index) => {
       // ADD FOOTER and HEADER spacers into Content Flow (as page break)
       // and balance footer
       this._insertIntoContentFlow(index, pageSeparator, paperSeparator);
-    }
+    });
   }
 
-  _insertIntoPaperFlow(index) {
+  _insertIntoPaperFlow(index, paperFlow) {
     // ADD VIRTUAL PAGE into Paper Flow,
     // with corresponding page number and pre-filled or blank,
     // with or without pre-separator.
     const paper = this._paper.createVirtualPaper();
     const paperSeparator = index ? this._createVirtualPaperGap() : undefined;
     this._insertPaper(
-      this._paperFlow,
+      paperFlow,
       paper,
       paperSeparator,
     );
     return paperSeparator
   }
 
-  _insertIntoOverlayFlow(index) {
+  _insertIntoOverlayFlow(index, overlayFlow) {
     // ADD VIRTUAL PAGE into Paper Flow,
     // with corresponding page number and pre-filled or blank,
     // with or without pre-separator.
@@ -205,7 +215,7 @@ export default class Preview {
     });
     const pageSeparator = index ? this._createVirtualPaperGap() : undefined;
     this._insertPaper(
-      this._overlayFlow,
+      overlayFlow,
       page,
       pageSeparator,
     );
@@ -41,80 +41,53 @@ tocPageNumberSelector:
       return
     }
 
-    // 1) collect a dictionary of 'Page markers'
-    //    to which their 'pageTop' positions are mapped as keys
-    // 2) collect a dictionary of 'Boxes for numbers',
-    //    which have their 'targetTop' positions as keys
-    // 3) merge the dictionaries.
+    // * Page numbers are resolved by document order, without layout reads:
+    // * a target is on the page of the last page divider preceding it.
+    // * (Elements marked with a page number, such as the page chrome,
+    // * are resolved by the registry directly.)
 
     // Use registry as the source of truth; DOM [page] is for visibility/tests only.
     const pageDividerRegistry = this._node.getRegisteredPageDividers?.();
     const pageDividerEntries = pageDividerRegistry && pageDividerRegistry.size
-      ? [...pageDividerRegistry.entries()]
+      ? [...pageDividerRegistry.entries()].sort(([a], [b]) => a - b)
       : this._DOM.getAll(this._pageDividerSelector, this._contentFlow).map((marker, index) => ([index + 1, marker]));
+    this._debug._ && console.log('📑 pageDividerEntries', pageDividerEntries);
 
-    const dataFromPagesMarkers = pageDividerEntries
-    .reduce((acc, [pageNum, marker]) => {
-      // * The conditions for the following code snippet are as follows:
-      // - It should be executed after the preview is rendered.
-      // - The presence of a Table of Contents (TOC) on the first pages ensures
-      //   that no target element with targetTop=0 is considered.
-      // * Consequently, we can:
-      // - Decrease all 'pageTop' values for Page markers by a few pixels.
-      //   This avoids an exact match with the 'targetTop' of targets when merging
-      //   two dictionaries with keys => 'pageTop|targetTop'.
-      //   *** By pushing the beginning of the page upwards, we ensure that
-      //   *** this marker will not match any content element of the pages.
-      // - Ignore the first value where pageTop==0 since we don't expect
-      //   to see target elements with such a top (due to the presence of a TOC).
-
-      // * That's how we get the {-1 : 1} object,
-      // * which means page 1 has a negative top.
-      // * We ignore it, as described above.
-      const pageTop = this._node.getTop(marker, this._root) - 1;
-
-      const pageNumStr = String(pageNum);
-      acc[pageTop] = pageNumStr;
-      return acc;
-    }, {});
-    this._debug._ && console.log('📑 dataFromPagesMarkers', dataFromPagesMarkers);
-
-    const dataFromTOC = tocPageNumberBoxes.reduce((acc, box) => {
+    this._debug._ && console.groupCollapsed('Processing TOC boxes');
+    tocPageNumberBoxes.forEach(box => {
       const id = this._DOM.getDataId(box);
       const target = this._DOM.getElementById(id);
-      const targetTop = this._node.getTop(target, this._root);
-      acc[targetTop] = {
-        box: box,
-        id: id,
-        targetTop: targetTop,
-      };
-      return acc;
-    }, {});
-    this._debug._ && console.log('📑 dataFromTOC', dataFromTOC);
-
-    const tocObject = {
-      ...dataFromPagesMarkers,
-      ...dataFromTOC
-    };
-
-    let pageAcc = 0;
+      if (!target) {
+        this._debug._ && console.warn(`📑 no target #${id}`, box);
+        return;
+      }
+      const page = this._node.getRegisteredPageNumberForElement(target)
+        ?? this._findPageByDocumentOrder(pageDividerEntries, target);
+      this._debug._ && console.log(`Processing #${id}: ${page}`);
+      this._DOM.setTextContent(box, String(page));
+    });
+    this._debug._ && console.groupEnd('Processing TOC boxes');
 
-    this._debug._ && console.groupCollapsed('Processing obj');
-    for (const key in tocObject) {
-      const value = tocObject[key];
-      this._debug._ && console.log(`Processing ${key}: ${value}`);
+    this._globalDebugMode && console.timeEnd("Processing TOC");
+  }
 
-      if (typeof value === 'string') {
-        pageAcc = value;
+  // * Binary search over the page dividers, which are in document order:
+  // * O(log pages) comparisons per target.
+  _findPageByDocumentOrder(pageDividerEntries, target) {
+    let low = 0;
+    let high = pageDividerEntries.length - 1;
+    // * Content before the first divider is on the first page.
+    let page = pageDividerEntries[0]?.[0] ?? 1;
+    while (low <= high) {
+      const middle = (low + high) >>> 1;
+      const [pageNum, marker] = pageDividerEntries[middle];
+      if (this._DOM.isInDocumentOrder(marker, target)) {
+        page = pageNum;
+        low = middle + 1;
       } else {
-        value.page = pageAcc;
-        this._DOM.setInnerHTML(value.box, pageAcc)
+        high = middle - 1;
       }
     }
-    this._debug._ && console.groupEnd('Processing obj');
-
-    this._debug._ && console.log('📑 tocObject', tocObject);
-
-    this._globalDebugMode && console.timeEnd("Processing TOC");
+    return page;
   }
 }
@@ -0,0 +1,83 @@
+// 🧮 Operation counters: layout reads, DOM writes and pagination steps.
+// * Opt-in (config.operationCounters, data-operation-counters="true"),
+// * so that a disabled counter costs a single boolean check.
+// * Counts are attributed to the page being paginated (see Pages._registerPageStart),
+// * and summed up in `total`. Operations outside of pagination
+// * (layout, preview, toc...) only go to `total`.
+// Usage:
+//   import { countOperation } from '../utils/counters.js';
+//   countOperation('layoutReads');
+
+export const OPERATIONS = [
+  'layoutReads',          // getBoundingClientRect and offset* reads
+  'computedStyleReads',   // getComputedStyle calls
+  'insertions',           // DOM insertions, wraps and moves
+  'clones',               // node clones
+  'parseNode',            // Pages._parseNode invocations
+  'findBetterPageStart',  // Node.findBetterPageStart walks
+  'measureCacheHits',
+  'measureCacheMisses',
+];
+
+let _enabled = false;
+let _total = {};
+let _pages = [];
+let _currentPage = null;
+
+/**
+ * Start counting from scratch.
+ * @param {boolean} enabled - if false, countOperation() does nothing.
+ */
+export function resetCounters(enabled = false) {
+  _enabled = !!enabled;
+  _total = _createBucket();
+  _pages = [];
+  _currentPage = null;
+}
+
+export function isCountingOperations() {
+  return _enabled;
+}
+
+export function countOperation(name, amount = 1) {
+  if (!_enabled) return;
+  _total[name] = (_total[name] || 0) + amount;
+  if (_currentPage) {
+    _currentPage[name] = (_currentPage[name] || 0) + amount;
+  }
+}
+
+/**
+ * The following operations are counted for the next page.
+ */
+export function startCountingPage() {
+  if (!_enabled) return;
+  _currentPage = _createBucket();
+  _pages.push(_currentPage);
+}
+
+/**
+ * The following operations are no longer attributed to a page.
+ */
+export function stopCountingPages() {
+  _currentPage = null;
+}
+
+/**
+ * Returns a plain copy of the counters, or null if they are disabled:
+ * { total: { layoutReads, ... }, pages: [ { layoutReads, ... }, ... ] }
+ */
+export function getCounters() {
+  if (!_enabled) return null;
+  return {
+    total: { ..._total },
+    pages: _pages.map((page) => ({ ...page })),
+  };
+}
+
+function _createBucket() {
+  return OPERATIONS.reduce((bucket, name) => {
+    bucket[name] = 0;
+    return bucket;
+  }, {});
+}
@@ -0,0 +1,119 @@
+// ⏱️ Render timings based on the User Timing API.
+// * Always enabled and cheap: each phase becomes a `performance.measure` entry
+// * (visible in DevTools performance traces). The splitter calls are aggregated
+// * per name and become one measure each at the end of the render (measureSpans),
+// * so that large documents do not fill the performance timeline.
+// * The durations are collected into a JSON-friendly object
+// * exposed by App as `window.html2pdf4doc.timings`.
+// Usage:
+//   import { startPhase, endPhase, measureSpan } from '../utils/timings.js';
+//   startPhase('pages');
+//   ...
+//   endPhase('pages');
+//   const parts = measureSpan('Table.split', () => this._table.split(...));
+
+const PREFIX = 'html2pdf4doc';
+
+const _hasUserTiming = typeof performance !== 'undefined'
+  && typeof performance.mark === 'function'
+  && typeof performance.measure === 'function';
+
+let _phaseStarts = {};
+let _phases = {};
+let _spans = {};
+
+/**
+ * Drop the timings and the User Timing entries of a previous render.
+ */
+export function resetTimings() {
+  _phaseStarts = {};
+  _phases = {};
+  _spans = {};
+  if (!_hasUserTiming) return;
+  ['mark', 'measure'].forEach((type) => {
+    performance.getEntriesByType(type)
+      .filter((entry) => entry.name.startsWith(PREFIX))
+      .forEach((entry) => (type === 'mark'
+        ? performance.clearMarks(entry.name)
+        : performance.clearMeasures(entry.name)));
+  });
+}
+
+export function startPhase(name) {
+  _phaseStarts[name] = _now();
+  _hasUserTiming && performance.mark(`${PREFIX}:${name}:start`);
+}
+
+export function endPhase(name) {
+  const start = _phaseStarts[name];
+  if (start === undefined) return;
+  const end = _now();
+  _phases[name] = end - start;
+  if (!_hasUserTiming) return;
+  performance.mark(`${PREFIX}:${name}:end`);
+  performance.measure(`${PREFIX}:${name}`, `${PREFIX}:${name}:start`, `${PREFIX}:${name}:end`);
+}
+
+/**
+ * Run `fn` as a named span and return its result.
+ * Spans with the same name are aggregated (count, total, max).
+ * Nested spans are counted in the totals of their parents.
+ */
+export function measureSpan(name, fn) {
+  const start = _now();
+  try {
+    return fn();
+  } finally {
+    const end = _now();
+    const duration = end - start;
+    const span = (_spans[name] ??= { start, count: 0, total: 0, max: 0 });
+    span.count += 1;
+    span.total += duration;
+    span.max = Math.max(span.max, duration);
+  }
+}
+
+/**
+ * Record one User Timing measure per span name:
+ * it starts with the first call and lasts the total duration of the calls;
+ * `detail` holds the count and the longest call.
+ */
+export function measureSpans() {
+  if (!_hasUserTiming) return;
+  for (const [name, span] of Object.entries(_spans)) {
+    performance.measure(`${PREFIX}:${name}`, {
+      start: span.start,
+      duration: span.total,
+      detail: { count: span.count, max: span.max },
+    });
+  }
+}
+
+/**
+ * Returns a plain copy of the collected timings, in milliseconds:
+ * { total, phases: { config, layout, ... }, spans: { 'Table.split': { count, total, max }, ... } }
+ */
+export function getTimings() {
+  const round = (value) => Math.round(value * 100) / 100;
+  const phases = {};
+  for (const [name, duration] of Object.entries(_phases)) {
+    phases[name] = round(duration);
+  }
+  const spans = {};
+  for (const [name, span] of Object.entries(_spans)) {
+    spans[name] = {
+      count: span.count,
+      total: round(span.total),
+      max: round(span.max),
+    };
+  }
+  return {
+    total: phases.total,
+    phases,
+    spans,
+  };
+}
+
+function _now() {
+  return typeof performance !== 'undefined' ? performance.now() : Date.now();
+}
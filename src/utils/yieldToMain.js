@@ -0,0 +1,34 @@
+// 🧵 Cooperative multitasking: give the main thread back to the browser
+// * between the slices of a long task, so input and paint are not blocked.
+// * scheduler.yield() resumes the task ahead of other queued tasks;
+// * where it is not supported, setTimeout(0) is used instead.
+// Usage:
+//   import { yieldToMain, createTimeSlice } from '../utils/yieldToMain.js';
+//   const slice = createTimeSlice(16);
+//   for (...) {
+//     ...
+//     if (slice.isOver()) { await yieldToMain(); slice.restart(); }
+//   }
+
+export function yieldToMain() {
+  if (typeof scheduler !== 'undefined' && typeof scheduler.yield === 'function') {
+    return scheduler.yield();
+  }
+  return new Promise(resolve => setTimeout(resolve, 0));
+}
+
+/**
+ * A time budget in milliseconds for one slice of work.
+ * @param {number} budget
+ */
+export function createTimeSlice(budget) {
+  let start = _now();
+  return {
+    isOver: () => _now() - start >= budget,
+    restart: () => { start = _now(); },
+  };
+}
+
+function _now() {
+  return typeof performance !== 'undefined' ? performance.now() : Date.now();
+}
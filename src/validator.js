@@ -27,6 +27,18 @@ export default class Validator {
   init() {
     this._config.debugMode && console.log('🐙 i am Validator!');
     this._validateLayout();
+    return this._getResults();
+  }
+
+  // * Serializable summary of the validations, reported by App.
+  _getResults() {
+    const overflowPages = Object.keys(this._accumulatedAssertions)
+      .map(Number)
+      .sort((a, b) => a - b);
+    return {
+      valid: overflowPages.length === 0,
+      overflowPages,
+    };
   }
 
   _validateLayout() {
@@ -0,0 +1,168 @@
+// * How many pages are kept rendered above and below the viewport.
+const OVERSCAN_PAGES = 2;
+
+export default class Virtualizer {
+
+  // * Post-pagination virtualization of the paper and overlay flows:
+  // * once the preview is rendered and validated, only the virtual papers
+  // * and page chromes near the viewport stay in the document.
+  // * The pagination itself is not affected: the content flow is untouched,
+  // * and the papers keep the positions measured in the complete preview.
+  // * Before printing, all of them are put back.
+
+  constructor({
+    config,
+    DOM,
+    selector,
+    layout,
+  }) {
+
+    // * From config:
+    this._debug = config.debugMode ? { ...config.debugConfig.preview } : {};
+
+    this._DOM = DOM;
+    this._virtualPaperGapSelector = selector.virtualPaperGap;
+
+    // data
+    this._flows = [layout.paperFlow, layout.overlayFlow].map(element => ({
+      element,
+      pages: [], // * [[gap, paper], ...]: the nodes of every page
+      tops: [], // * the top of every page within the flow
+    }));
+    this._from = -1;
+    this._to = -1;
+    this._isPrinting = false;
+    this._frame = null;
+
+    this._onScroll = this._onScroll.bind(this);
+    this._onBeforePrint = this._onBeforePrint.bind(this);
+    this._onAfterPrint = this._onAfterPrint.bind(this);
+    this._onPrintMediaChange = (event) => event.matches ? this._onBeforePrint() : this._onAfterPrint();
+    this._printMedia = window.matchMedia ? window.matchMedia('print') : null;
+  }
+
+  init() {
+    // * Must be run on the complete preview: all tops are read in one go.
+    this._DOM.invalidateLayout();
+    this._flows.forEach(flow => this._collectPages(flow));
+    // * All pages are rendered at this point.
+    this._from = 0;
+    this._to = this._flows[0].pages.length - 1;
+    this._update();
+
+    document.addEventListener('scroll', this._onScroll, { capture: true, passive: true });
+    window.addEventListener('resize', this._onScroll, { passive: true });
+    window.addEventListener('beforeprint', this._onBeforePrint);
+    window.addEventListener('afterprint', this._onAfterPrint);
+    this._printMedia && this._printMedia.addEventListener('change', this._onPrintMediaChange);
+
+    this._debug._ && console.log('🪟 Virtualizer: pages', this._flows[0].pages.length);
+    return this;
+  }
+
+  destroy() {
+    this._frame && cancelAnimationFrame(this._frame);
+    this._frame = null;
+    document.removeEventListener('scroll', this._onScroll, { capture: true });
+    window.removeEventListener('resize', this._onScroll);
+    window.removeEventListener('beforeprint', this._onBeforePrint);
+    window.removeEventListener('afterprint', this._onAfterPrint);
+    this._printMedia && this._printMedia.removeEventListener('change', this._onPrintMediaChange);
+  }
+
+  // * Materializes every page (the complete flows, as rendered by Preview).
+  materialize() {
+    const count = this._flows[0].pages.length;
+    count && this._render(0, count - 1);
+  }
+
+  _collectPages(flow) {
+    const flowTop = this._DOM.getElementBCR(flow.element).top;
+    let nodes = [];
+    [...this._DOM.getChildren(flow.element)].forEach(child => {
+      nodes.push(child);
+      // * A page is its paper, preceded by a gap (except for the first one).
+      if (child.matches(this._virtualPaperGapSelector)) return;
+      flow.pages.push(nodes);
+      flow.tops.push(this._DOM.getElementBCR(nodes[0]).top - flowTop);
+      nodes = [];
+    });
+  }
+
+  _onScroll() {
+    if (this._frame || this._isPrinting) return;
+    this._frame = requestAnimationFrame(() => {
+      this._frame = null;
+      !this._isPrinting && this._update();
+    });
+  }
+
+  _onBeforePrint() {
+    if (this._isPrinting) return;
+    this._isPrinting = true;
+    this.materialize();
+  }
+
+  _onAfterPrint() {
+    if (!this._isPrinting) return;
+    this._isPrinting = false;
+    this._update();
+  }
+
+  _update() {
+    const flow = this._flows[0];
+    const count = flow.pages.length;
+    if (!count) return;
+
+    // * Scrolling changes the client rects without a write through DOM.
+    this._DOM.invalidateLayout();
+    const viewTop = - this._DOM.getElementBCR(flow.element).top;
+    const viewBottom = viewTop + window.innerHeight;
+
+    const first = this._findPage(flow.tops, viewTop);
+    const last = this._findPage(flow.tops, viewBottom);
+
+    this._render(
+      Math.max(0, first - OVERSCAN_PAGES),
+      Math.min(count - 1, last + OVERSCAN_PAGES),
+    );
+  }
+
+  // * The last page that starts at or above `position` (binary search).
+  _findPage(tops, position) {
+    let low = 0;
+    let high = tops.length - 1;
+    while (low < high) {
+      const middle = (low + high + 1) >>> 1;
+      if (tops[middle] <= position) {
+        low = middle;
+      } else {
+        high = middle - 1;
+      }
+    }
+    return low;
+  }
+
+  _render(from, to) {
+    if (from === this._from && to === this._to) return;
+
+    this._flows.forEach(flow => {
+      // * Take out the rendered pages...
+      for (let index = this._from; index >= 0 && index <= this._to; index++) {
+        flow.pages[index].forEach(node => this._DOM.removeNode(node));
+      }
+      // * ...and put in the requested ones, in one insertion,
+      // * shifted down by the height of the pages left out above.
+      const fragment = this._DOM.createDocumentFragment();
+      for (let index = from; index <= to; index++) {
+        this._DOM.insertAtEnd(fragment, ...flow.pages[index]);
+      }
+      this._DOM.setStyles(flow.element, { paddingTop: flow.tops[from] + 'px' });
+      this._DOM.insertAtEnd(flow.element, fragment);
+    });
+
+    this._from = from;
+    this._to = to;
+    this._debug._ && console.log(`🪟 Virtualizer: pages ${from + 1}–${to + 1}`);
+  }
+}
@@ -69,6 +69,80 @@ def server(context):
     run_invoke(context, "npm run test_server")
 
 
+@task
+def convert(context, input_dir, output_dir=None, jobs=None, config=None):
+    """
+    Convert a directory of HTML documents to PDF with parallel Chrome workers.
+    Example: invoke convert examples/strictdoc --output-dir output --jobs 4
+    """
+    output_dir_argument = (
+        f"--output-dir {output_dir}" if output_dir is not None else ""
+    )
+    jobs_argument = f"--jobs {jobs}" if jobs is not None else ""
+    config_argument = (
+        " ".join(f"--config {item}" for item in config.split(","))
+        if config is not None
+        else ""
+    )
+    run_invoke(context, f"""
+        python -m html2pdf4doc
+            {input_dir}
+            {output_dir_argument}
+            {jobs_argument}
+            {config_argument}
+    """)
+
+
+@task(build)
+def bench(
+    context,
+    repetitions=5,
+    focus=None,
+    threshold=0.1,
+    baseline=None,
+    update_baseline=False,
+):
+    """
+    Run the benchmark corpus and compare the timings with the baseline.
+    Fails when the median total time of a document regresses by more than
+    the threshold (0.1 is 10%).
+    Example: invoke bench --repetitions 10 --focus table
+    """
+    focus_argument = f"--focus {focus}" if focus is not None else ""
+    baseline_argument = f"--baseline {baseline}" if baseline is not None else ""
+    update_baseline_argument = "--update-baseline" if update_baseline else ""
+    run_invoke(context, f"""
+        PYTHONPATH=.
+        python test/benchmark/benchmark.py
+            --repetitions {repetitions}
+            --threshold {threshold}
+            {focus_argument}
+            {baseline_argument}
+            {update_baseline_argument}
+    """)
+
+
+@task(build)
+def bench_scaling(context, families=None, sizes=None, max_exponent=None):
+    """
+    Render each document family at growing page counts and fail when
+    the render time grows super-linearly with the number of pages.
+    Example: invoke bench-scaling --families tables,grids --sizes 10,100,500
+    """
+    families_argument = f"--families {families}" if families is not None else ""
+    sizes_argument = f"--sizes {sizes}" if sizes is not None else ""
+    max_exponent_argument = (
+        f"--max-exponent {max_exponent}" if max_exponent is not None else ""
+    )
+    run_invoke(context, f"""
+        PYTHONPATH=.
+        python test/benchmark/scaling.py
+            {families_argument}
+            {sizes_argument}
+            {max_exponent_argument}
+    """)
+
+
 @task
 def test_unit(context):
     run_invoke(context, "npm run test")
@@ -0,0 +1,204 @@
+import argparse
+import json
+import math
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from html2pdf4doc.cache import read_bundle_version
+from html2pdf4doc.document import DEFAULT_BUNDLE_PATH, prepared_document
+from html2pdf4doc.pool import ChromePool
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from corpus import generate_corpus  # noqa: E402
+
+PATH_TO_THIS_FOLDER = Path(__file__).resolve().parent
+PATH_TO_OUTPUT_FOLDER = PATH_TO_THIS_FOLDER / "output"
+PATH_TO_BASELINE = PATH_TO_THIS_FOLDER / "baseline.json"
+
+# * The samples enable the debug output, which must not be measured.
+BENCH_CONFIG = {
+    "debugMode": False,
+    "forcedDebugMode": False,
+    "consoleAssert": False,
+    "markupDebugMode": False,
+    "preloader": False,
+}
+
+# * The metric compared with the baseline.
+BASELINE_METRIC = "total"
+
+
+def percentile(values: List[float], percent: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(percent / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(values: List[float]) -> Dict[str, float]:
+    return {
+        "median": round(statistics.median(values), 2),
+        "p95": round(percentile(values, 95), 2),
+        "min": round(min(values), 2),
+        "max": round(max(values), 2),
+    }
+
+
+def run_document(
+    pool: ChromePool,
+    path: Path,
+    bundle_path: Path,
+    repetitions: int,
+    warmup: int,
+    timeout: float,
+) -> Dict:
+    wall: List[float] = []
+    totals: List[float] = []
+    phases: Dict[str, List[float]] = {}
+    spans: Dict[str, List[float]] = {}
+    page_count = 0
+
+    with prepared_document(path, BENCH_CONFIG, bundle_path) as url:
+        for iteration in range(warmup + repetitions):
+            with pool.worker(timeout) as worker:
+                started = time.perf_counter()
+                worker.driver.get(url)
+                result = worker.wait_for_ready(timeout)
+                elapsed = (time.perf_counter() - started) * 1000
+            if iteration < warmup:
+                continue
+
+            timings = result.get("timings") or {}
+            wall.append(elapsed)
+            totals.append(timings.get("total") or 0)
+            for name, duration in (timings.get("phases") or {}).items():
+                phases.setdefault(name, []).append(duration)
+            for name, span in (timings.get("spans") or {}).items():
+                spans.setdefault(name, []).append(span["total"])
+            page_count = result.get("pageCount", 0)
+
+    return {
+        "pages": page_count,
+        "wall": summarize(wall),
+        "total": summarize(totals),
+        "phases": {name: summarize(values) for name, values in phases.items()},
+        "spans": {name: summarize(values) for name, values in spans.items()},
+    }
+
+
+def compare_with_baseline(
+    report: Dict,
+    baseline: Dict,
+    threshold: float,
+) -> List[str]:
+    """Return the list of regressions: documents whose median total time
+    exceeds the baseline by more than threshold (0.1 is 10%)."""
+    regressions = []
+    for name, current in report["documents"].items():
+        previous = baseline.get("documents", {}).get(name)
+        if previous is None:
+            continue
+        before = previous[BASELINE_METRIC]["median"]
+        after = current[BASELINE_METRIC]["median"]
+        current["baseline"] = {
+            "median": before,
+            "change": round((after - before) / before, 4) if before else None,
+        }
+        if before and after > before * (1 + threshold):
+            regressions.append(
+                f"{name}: {before:.1f}ms -> {after:.1f}ms "
+                f"(+{(after - before) / before:.1%}, threshold {threshold:.0%})"
+            )
+    return regressions
+
+
+def print_report(report: Dict) -> None:
+    print("")  # noqa: T201
+    print(  # noqa: T201
+        f"{'Document':<24} {'Pages':>6} {'Median, ms':>11} {'p95, ms':>9} "
+        f"{'Wall, ms':>9} {'Baseline':>9}"
+    )
+    for name, document in report["documents"].items():
+        change = document.get("baseline", {}).get("change")
+        change_label = f"{change:+.1%}" if change is not None else "-"
+        print(  # noqa: T201
+            f"{name:<24} {document['pages']:>6} "
+            f"{document['total']['median']:>11.1f} {document['total']['p95']:>9.1f} "
+            f"{document['wall']['median']:>9.1f} {change_label:>9}"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="HTML2PDF4DOC benchmark")
+    parser.add_argument("--bundle", type=Path, default=DEFAULT_BUNDLE_PATH)
+    parser.add_argument("--repetitions", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--timeout", type=float, default=300)
+    parser.add_argument(
+        "--focus", default=None,
+        help="run only the documents whose name contains this string",
+    )
+    parser.add_argument(
+        "--output", type=Path,
+        default=PATH_TO_OUTPUT_FOLDER / "report.json",
+    )
+    parser.add_argument("--baseline", type=Path, default=PATH_TO_BASELINE)
+    parser.add_argument(
+        "--threshold", type=float, default=0.1,
+        help="allowed regression of the median total time (default: 0.1, 10%%)",
+    )
+    parser.add_argument(
+        "--update-baseline", action="store_true",
+        help="store the report as the new baseline",
+    )
+    args = parser.parse_args(argv)
+
+    assert args.bundle.is_file(), f"bundle does not exist: {args.bundle}"
+    assert args.repetitions > 0, args.repetitions
+
+    documents = generate_corpus(PATH_TO_OUTPUT_FOLDER / "corpus", args.bundle)
+    if args.focus is not None:
+        documents = [path for path in documents if args.focus in path.stem]
+
+    report: Dict = {
+        "version": read_bundle_version(),
+        "repetitions": args.repetitions,
+        "documents": {},
+    }
+    with ChromePool(1, idle_timeout=0) as pool:
+        for path in documents:
+            print(f"-> {path.stem}")  # noqa: T201
+            report["documents"][path.stem] = run_document(
+                pool, path, args.bundle, args.repetitions, args.warmup, args.timeout
+            )
+
+    regressions: List[str] = []
+    if args.baseline.is_file() and not args.update_baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = compare_with_baseline(report, baseline, args.threshold)
+    report["regressions"] = regressions
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print_report(report)
+    print(f"\nReport: {args.output}")  # noqa: T201
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"Baseline updated: {args.baseline}")  # noqa: T201
+        return 0
+
+    if regressions:
+        print("\nPerformance regressions:", file=sys.stderr)  # noqa: T201
+        for regression in regressions:
+            print(f"  {regression}", file=sys.stderr)  # noqa: T201
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
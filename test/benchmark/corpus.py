@@ -0,0 +1,172 @@
+import re
+import shutil
+from pathlib import Path
+from typing import Dict, List
+
+from html2pdf4doc.document import REPO_ROOT
+
+PATH_TO_EXAMPLES = REPO_ROOT / "examples"
+PATH_TO_CONTENT = REPO_ROOT / "src" / "content"
+
+# * The StrictDoc samples load the bundle as src="bundle.js"
+# * from the folder served by the dev server (see webpack.dev.js).
+_BUNDLE_SRC_RE = re.compile(r"src\s*=\s*([\"'])bundle\.js\1")
+_TEMPLATE_LITERAL_RE = re.compile(r"=\s*`(.*)`\s*;", re.DOTALL)
+
+_STRICTDOC_STYLES = [
+    "base.css",
+    "layout.css",
+    "content.css",
+    "node.css",
+    "node_content.css",
+    "element.css",
+    "form.css",
+    "requirement__temporary.css",
+    "autogen.css",
+    "tree.css",
+]
+
+_IMAGES = [
+    PATH_TO_EXAMPLES / "assets" / "img-large.jpg",
+    PATH_TO_EXAMPLES / "assets" / "img-small.jpg",
+    PATH_TO_EXAMPLES / "assets" / "bg-large.jpg",
+    PATH_TO_EXAMPLES / "assets" / "file.svg",
+    PATH_TO_CONTENT / "img1200.png",
+    PATH_TO_CONTENT / "img600.png",
+    PATH_TO_CONTENT / "img898.png",
+]
+
+
+def page(title: str, body: str, head: str = "") -> str:
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="UTF-8">
+  <title>{title}</title>
+  {head}
+</head>
+<body>
+<div html2pdf4doc>
+{body}
+</div>
+</body>
+</html>
+"""
+
+
+def strictdoc_from_content() -> str:
+    """The StrictDoc sample of the dev content (src/content/strictDoc.js)."""
+    source = (PATH_TO_CONTENT / "strictDoc.js").read_text(encoding="utf-8")
+    match = _TEMPLATE_LITERAL_RE.search(source)
+    assert match is not None, "src/content/strictDoc.js: no template literal"
+    # * The content is a JS template literal: unescape it.
+    markup = match.group(1).replace("\\`", "`").replace("\\\\", "\\")
+    styles = "\n".join(
+        f'<link rel="stylesheet" href="{(PATH_TO_EXAMPLES / "strictdoc" / "css" / name).as_uri()}">'
+        for name in _STRICTDOC_STYLES
+    )
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="UTF-8">
+  <title>StrictDoc (src/content)</title>
+  {styles}
+</head>
+<body>
+{markup}
+</body>
+</html>
+"""
+
+
+def strictdoc_example(name: str, bundle_path: Path) -> str:
+    """A StrictDoc sample of examples/strictdoc, as served by the dev server."""
+    markup = (PATH_TO_EXAMPLES / "strictdoc" / name).read_text(encoding="utf-8")
+    markup = _BUNDLE_SRC_RE.sub(f'src="{bundle_path.resolve().as_uri()}"', markup)
+    # * The styles are linked relative to examples/.
+    base = f'<base href="{PATH_TO_EXAMPLES.as_uri()}/">'
+    return re.sub(r"<head\b[^>]*>", lambda match: match.group(0) + base, markup, count=1)
+
+
+def large_table(rows: int = 2000, columns: int = 6) -> str:
+    header = "".join(f"<th>Column {column}</th>" for column in range(columns))
+    body = "\n".join(
+        "<tr>" + "".join(
+            f"<td>Row {row}, cell {column}"
+            + (" with a longer text that wraps" * (row % 3) if column == 1 else "")
+            + "</td>"
+            for column in range(columns)
+        ) + "</tr>"
+        for row in range(rows)
+    )
+    return page(
+        f"Table, {rows} rows",
+        f"""<table border="1" style="border-collapse:collapse;width:100%">
+<caption>Large table</caption>
+<thead><tr>{header}</tr></thead>
+<tbody>
+{body}
+</tbody>
+<tfoot><tr>{header}</tr></tfoot>
+</table>""",
+    )
+
+
+def large_grid(items: int = 1500, columns: int = 3) -> str:
+    cells = "\n".join(
+        f"<div style=\"padding:4px;border:1px solid gray\">Item {item}"
+        + ("<br>second line" if item % 4 == 0 else "")
+        + "</div>"
+        for item in range(items)
+    )
+    return page(
+        f"Grid, {items} items",
+        f"""<div style="display:grid;grid-template-columns:repeat({columns}, 1fr);gap:4px">
+{cells}
+</div>""",
+    )
+
+
+def long_pre(lines: int = 5000) -> str:
+    code = "\n".join(
+        f"{line:>5}  def function_{line}(argument): return argument * {line}"
+        for line in range(lines)
+    )
+    return page(f"PRE, {lines} lines", f"<pre>{code}</pre>")
+
+
+def image_heavy(images: int = 200) -> str:
+    body = "\n".join(
+        f"<p>Figure {index}</p>\n"
+        f'<img src="{_IMAGES[index % len(_IMAGES)].as_uri()}"'
+        f' style="max-width:{40 + (index % 5) * 15}%">'
+        for index in range(images)
+    )
+    return page(f"Images, {images}", body)
+
+
+def generate_corpus(output_dir: Path, bundle_path: Path) -> List[Path]:
+    """Write the benchmark documents to output_dir and return their paths.
+
+    The corpus is fixed (no randomness), so that the timings
+    of different runs can be compared.
+    """
+    shutil.rmtree(output_dir, ignore_errors=True)
+    output_dir.mkdir(parents=True)
+
+    documents: Dict[str, str] = {
+        "strictdoc_content": strictdoc_from_content(),
+        "strictdoc_index": strictdoc_example("index.html", bundle_path),
+        "strictdoc_cur": strictdoc_example("cur.html", bundle_path),
+        "table_2000_rows": large_table(),
+        "grid_1500_items": large_grid(),
+        "pre_5000_lines": long_pre(),
+        "images_200": image_heavy(),
+    }
+
+    paths = []
+    for name, markup in documents.items():
+        path = output_dir / f"{name}.html"
+        path.write_text(markup, encoding="utf-8")
+        paths.append(path)
+    return paths
@@ -0,0 +1,263 @@
+import argparse
+import json
+import math
+import shutil
+import sys
+import time
+from enum import Enum
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import dominate
+from dominate.tags import div, p, pre, table, tbody, td, th, thead, tr
+
+from html2pdf4doc.document import DEFAULT_BUNDLE_PATH, prepared_document
+from html2pdf4doc.pool import ChromePool
+
+PATH_TO_THIS_FOLDER = Path(__file__).resolve().parent
+PATH_TO_OUTPUT_FOLDER = PATH_TO_THIS_FOLDER / "output" / "scaling"
+
+DEFAULT_SIZES = [10, 100, 500, 2000]
+
+# * Pagination time is expected to grow linearly with the number of pages:
+# * the fitted exponent k of `time ~ pages^k` is ~1 for a linear engine
+# * and ~2 for a quadratic one. The gate uses the time of the pages phase:
+# * the total time includes the fixed setup cost, which flattens the fit
+# * at small sizes and hides a super-linear pagination.
+DEFAULT_MAX_EXPONENT = 1.3
+
+BENCH_CONFIG = {
+    "debugMode": False,
+    "consoleAssert": False,
+    "preloader": False,
+}
+
+LOREM = (
+    "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod "
+    "tempor incididunt ut labore et dolore magna aliqua. Ut enim ad minim "
+    "veniam, quis nostrud exercitation ullamco laboris nisi ut aliquip ex ea "
+    "commodo consequat."
+)
+
+
+class Family(Enum):
+    PARAGRAPHS = "paragraphs"
+    TABLES = "tables"
+    GRIDS = "grids"
+    NESTED_DIVS = "nested_divs"
+
+
+# * How many units of each family fill roughly one A4 page.
+UNITS_PER_PAGE = {
+    Family.PARAGRAPHS: 8,
+    Family.TABLES: 40,
+    Family.GRIDS: 60,
+    Family.NESTED_DIVS: 12,
+}
+
+
+def create_paragraphs(units: int):
+    container = div()
+    for index in range(units):
+        container.add(p(f"{index}. {LOREM}"))
+    return container
+
+
+def create_tables(units: int):
+    # * One long table, with rows of different heights.
+    container = div()
+    with container:
+        with table(border="1", style="border-collapse:collapse;width:100%"):
+            with thead():
+                with tr():
+                    for column in range(4):
+                        th(f"Column {column}")
+            with tbody():
+                for row in range(units):
+                    with tr():
+                        td(str(row))
+                        td(LOREM[: 20 + (row % 5) * 30])
+                        td("cell")
+                        td("cell")
+    return container
+
+
+def create_grids(units: int):
+    container = div(style="display:grid;grid-template-columns:repeat(3, 1fr);gap:4px")
+    for index in range(units * 3):
+        container.add(div(
+            f"Item {index}",
+            style="padding:4px;border:1px solid gray",
+        ))
+    return container
+
+
+def create_nested_divs(units: int):
+    # * Sections nested three levels deep, ending with text and a PRE.
+    container = div()
+    for index in range(units):
+        section = div(style="padding:2px 0 2px 8px;border-left:1px solid gray")
+        inner = section.add(div(style="padding-left:8px"))
+        innermost = inner.add(div(style="padding-left:8px"))
+        innermost.add(p(f"Section {index}. {LOREM[:120]}"))
+        if index % 4 == 0:
+            innermost.add(pre("\n".join(f"line {line}" for line in range(6))))
+        container.add(section)
+    return container
+
+
+_GENERATORS = {
+    Family.PARAGRAPHS: create_paragraphs,
+    Family.TABLES: create_tables,
+    Family.GRIDS: create_grids,
+    Family.NESTED_DIVS: create_nested_divs,
+}
+
+
+def create_html(family: Family, pages: int) -> str:
+    doc = dominate.document(title=f"{family.value}, ~{pages} pages")
+    with doc:
+        root = div(html2pdf4doc="")
+        root.add(_GENERATORS[family](pages * UNITS_PER_PAGE[family]))
+    return str(doc)
+
+
+def fit_exponent(points: List[Tuple[int, float]]) -> Optional[float]:
+    """Least-squares slope of log(time) against log(pages)."""
+    points = [(x, y) for x, y in points if x > 0 and y > 0]
+    if len(points) < 2:
+        return None
+    xs = [math.log(x) for x, _ in points]
+    ys = [math.log(y) for _, y in points]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    if variance == 0:
+        return None
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    return covariance / variance
+
+
+def run_family(
+    pool: ChromePool,
+    family: Family,
+    sizes: List[int],
+    bundle_path: Path,
+    timeout: float,
+) -> Dict:
+    output_dir = PATH_TO_OUTPUT_FOLDER / family.value
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    measurements = []
+    for size in sizes:
+        path = output_dir / f"{family.value}_{size}.html"
+        path.write_text(create_html(family, size), encoding="utf-8")
+        with prepared_document(path, BENCH_CONFIG, bundle_path) as url:
+            with pool.worker(timeout) as worker:
+                started = time.perf_counter()
+                worker.driver.get(url)
+                result = worker.wait_for_ready(timeout)
+                elapsed = (time.perf_counter() - started) * 1000
+                # * Each size gets a fresh tab, so that the previous
+                # * (bigger) document does not affect the next one.
+                worker.recycle_tab()
+        timings = result.get("timings") or {}
+        measurement = {
+            "size": size,
+            "pages": result.get("pageCount", 0),
+            "total": timings.get("total"),
+            "pagesPhase": (timings.get("phases") or {}).get("pages"),
+            "wall": round(elapsed, 2),
+        }
+        print(  # noqa: T201
+            f"   {size:>5} -> {measurement['pages']:>5} pages, "
+            f"{measurement['total']} ms"
+        )
+        measurements.append(measurement)
+
+    return {
+        "measurements": measurements,
+        "exponent": _round(fit_exponent([
+            (measurement["pages"], measurement["total"] or 0)
+            for measurement in measurements
+        ])),
+        "pagesPhaseExponent": _round(fit_exponent([
+            (measurement["pages"], measurement["pagesPhase"] or 0)
+            for measurement in measurements
+        ])),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="HTML2PDF4DOC scaling benchmark: render time against page count"
+    )
+    parser.add_argument("--bundle", type=Path, default=DEFAULT_BUNDLE_PATH)
+    parser.add_argument(
+        "--families", default=",".join(family.value for family in Family),
+        help="comma-separated: " + ", ".join(family.value for family in Family),
+    )
+    parser.add_argument(
+        "--sizes", default=",".join(str(size) for size in DEFAULT_SIZES),
+        help="comma-separated approximate page counts",
+    )
+    parser.add_argument(
+        "--max-exponent", type=float, default=DEFAULT_MAX_EXPONENT,
+        help="fail when the pages phase grows faster than pages^max_exponent "
+             f"(default: {DEFAULT_MAX_EXPONENT})",
+    )
+    parser.add_argument("--timeout", type=float, default=1800)
+    parser.add_argument(
+        "--output", type=Path, default=PATH_TO_OUTPUT_FOLDER / "report.json",
+    )
+    args = parser.parse_args(argv)
+
+    assert args.bundle.is_file(), f"bundle does not exist: {args.bundle}"
+    families = [Family(value.strip()) for value in args.families.split(",")]
+    sizes = sorted(int(value) for value in args.sizes.split(","))
+
+    shutil.rmtree(PATH_TO_OUTPUT_FOLDER, ignore_errors=True)
+
+    report: Dict = {"maxExponent": args.max_exponent, "families": {}}
+    super_linear = []
+    with ChromePool(1, idle_timeout=0, max_documents_per_tab=0) as pool:
+        for family in families:
+            print(f"-> {family.value}")  # noqa: T201
+            result = run_family(pool, family, sizes, args.bundle, args.timeout)
+            report["families"][family.value] = result
+            exponent = result["pagesPhaseExponent"]
+            if exponent is not None and exponent > args.max_exponent:
+                super_linear.append(
+                    f"{family.value}: pages phase ~ pages^{exponent:.2f} "
+                    f"(total time: ^{result['exponent']})"
+                )
+    report["superLinear"] = super_linear
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    print("")  # noqa: T201
+    for name, result in report["families"].items():
+        print(  # noqa: T201
+            f"{name:<14} pages phase exponent: {result['pagesPhaseExponent']}, "
+            f"total time exponent: {result['exponent']}"
+        )
+    print(f"\nReport: {args.output}")  # noqa: T201
+
+    if super_linear:
+        print(  # noqa: T201
+            f"\nSuper-linear pagination (max exponent {args.max_exponent}):",
+            file=sys.stderr,
+        )
+        for line in super_linear:
+            print(f"  {line}", file=sys.stderr)  # noqa: T201
+        return 1
+    return 0
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return None if value is None else round(value, 3)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+import io
+import os
+
+from pypdf import PdfReader
+
+import html2pdf4doc
+
+path_to_this_test_file_folder = os.path.dirname(os.path.abspath(__file__))
+fixture = os.path.join(path_to_this_test_file_folder, "index.html")
+
+
+class Test:
+    def test_001_convert_file(self):
+        with html2pdf4doc.ChromePool(1, idle_timeout=0) as pool:
+            pdf = html2pdf4doc.convert(fixture, pool=pool)
+
+        reader = PdfReader(io.BytesIO(pdf))
+        assert len(reader.pages) == 1
+
+        page0_text = reader.pages[0].extract_text()
+        assert page0_text == "Hello world!", page0_text
+
+    def test_002_convert_markup_with_config(self):
+        with html2pdf4doc.ChromePool(1, idle_timeout=0) as pool:
+            pdf = html2pdf4doc.convert(
+                "<!doctype html><html><head></head>"
+                "<body><p>Hello A5!</p></body></html>",
+                {"printPaperSize": "A5"},
+                pool=pool,
+            )
+
+        reader = PdfReader(io.BytesIO(pdf))
+        assert len(reader.pages) == 1
+
+        # A5 portrait: 148.5mm ≈ 421pt wide.
+        assert round(float(reader.pages[0].mediabox.width)) == 421
+
+    def test_003_tab_recycling(self):
+        with html2pdf4doc.ChromePool(
+            1, max_documents_per_tab=2, idle_timeout=0
+        ) as pool:
+            for _ in range(5):
+                pdf = html2pdf4doc.convert(fixture, pool=pool)
+                assert len(PdfReader(io.BytesIO(pdf)).pages) == 1
+
+    def test_004_convert_to_file_and_stream(self, tmp_path):
+        with html2pdf4doc.ChromePool(1, idle_timeout=0) as pool:
+            output = tmp_path / "index.pdf"
+            size = html2pdf4doc.convert_to(fixture, output, pool=pool)
+            assert output.stat().st_size == size
+
+            buffer = io.BytesIO()
+            size = html2pdf4doc.convert_to(fixture, buffer, pool=pool)
+            assert len(buffer.getvalue()) == size
+
+        reader = PdfReader(output)
+        page0_text = reader.pages[0].extract_text()
+        assert page0_text == "Hello world!", page0_text
+        assert len(PdfReader(buffer).pages) == 1
+
+    def test_005_render_cache(self, tmp_path):
+        cache = html2pdf4doc.RenderCache(tmp_path / "cache")
+
+        with html2pdf4doc.ChromePool(1, idle_timeout=0) as pool:
+            pdf = html2pdf4doc.convert(fixture, pool=pool, cache=cache)
+
+        # The pool is closed: a hit must not need a browser.
+        cached_pdf = html2pdf4doc.convert(fixture, pool=pool, cache=cache)
+        assert cached_pdf == pdf
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1, stats
+        assert stats["misses"] == 1, stats
+        assert stats["entries"] == 1, stats
+
+    def test_006_render_cache_key(self, tmp_path):
+        cache = html2pdf4doc.RenderCache(tmp_path / "cache")
+
+        document = tmp_path / "index.html"
+        document.write_text(
+            '<html><head><link rel="stylesheet" href="style.css"></head>'
+            "<body><p>Hello world!</p></body></html>"
+        )
+        (tmp_path / "style.css").write_text("p { color: red; }")
+        key = cache.key_for(document)
+
+        assert cache.key_for(document) == key
+        assert cache.key_for(document, {"printPaperSize": "A5"}) != key
+
+        (tmp_path / "style.css").write_text("p { color: blue; }")
+        assert cache.key_for(document) != key
@@ -0,0 +1,37 @@
+import os
+import tempfile
+from pathlib import Path
+
+from pypdf import PdfReader
+
+from html2pdf4doc.cli import main
+
+path_to_this_test_file_folder = os.path.dirname(os.path.abspath(__file__))
+documents = os.path.join(path_to_this_test_file_folder, "documents")
+
+
+class Test:
+    def test_001_convert_directory(self, capsys):
+        with tempfile.TemporaryDirectory() as output_dir:
+            exit_code = main([documents, "--output-dir", output_dir, "--jobs", "2"])
+            assert exit_code == 0
+
+            pdf = Path(output_dir) / "index.pdf"
+            nested_pdf = Path(output_dir) / "nested" / "index.pdf"
+
+            page0_text = PdfReader(pdf).pages[0].extract_text()
+            assert page0_text == "Hello world!", page0_text
+
+            page0_text = PdfReader(nested_pdf).pages[0].extract_text()
+            assert page0_text == "Hello nested!", page0_text
+
+            # No temporary files are left next to the results.
+            assert sorted(
+                str(path.relative_to(output_dir))
+                for path in Path(output_dir).rglob("*")
+                if path.is_file()
+            ) == ["index.pdf", "nested/index.pdf"]
+
+        summary = capsys.readouterr().out
+        assert "Converted 2/2 documents" in summary
+        assert "nested/index.html" in summary
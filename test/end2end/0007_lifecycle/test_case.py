@@ -0,0 +1,123 @@
+import os
+
+from seleniumbase import BaseCase
+
+from test.end2end.helpers.helper import Helper
+
+path_to_this_test_file_folder = os.path.dirname(os.path.abspath(__file__))
+
+_original_ = '//*[@id="original"]'
+_second_ = '//*[@id="second"]'
+
+
+class Test(BaseCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.helper = Helper(self)
+
+    def _run_async(self, script: str) -> None:
+        self.execute_async_script(f"""
+            const done = arguments[arguments.length - 1];
+            {script}.then(() => done());
+        """)
+
+    def test_destroy(self):
+        self.helper.open_case(path_to_this_test_file_folder, 'lifecycle')
+        self.helper.assert_html2pdf4doc_success()
+        self.helper.assert_element('//html2pdf4doc-content-flow' + _original_)
+
+        self._run_async("HTML2PDF4DOC.destroy()")
+
+        self.helper.assert_no_html2pdf4doc_elements()
+        self.helper.assert_element('//div[@html2pdf4doc]/p[@id="original"]')
+        self.helper.assert_element_attribute_absent_direct(
+            '//*[@id="outside"]', 'html2pdf4doc-print-hide'
+        )
+        self.assert_element_not_present('//style[@html2pdf4doc-style]', by="xpath")
+
+    def test_destroy_without_kept_content(self):
+        # * By default, the render keeps no copy of the content:
+        # * destroy() restores the content passed to it.
+        self.helper.open_case(path_to_this_test_file_folder, 'no_copy')
+        self.helper.assert_html2pdf4doc_success()
+
+        self._run_async(
+            "HTML2PDF4DOC.destroy({ content: '<p id=\"second\">Second document</p>' })"
+        )
+
+        self.helper.assert_no_html2pdf4doc_elements()
+        self.helper.assert_element('//div[@html2pdf4doc]/p[@id="second"]')
+        self.assert_element_not_present(_original_, by="xpath")
+
+    def test_rerender(self):
+        self.helper.open_case(path_to_this_test_file_folder, 'lifecycle')
+        self.helper.assert_html2pdf4doc_success()
+
+        self._run_async("""
+            HTML2PDF4DOC.rerender({
+              content: '<p id="second">Second document</p>',
+              config: { printPaperSize: 'A5' },
+            })
+        """)
+
+        self.helper.assert_html2pdf4doc_elements()
+        self.helper.assert_html2pdf4doc_success()
+        self.helper.assert_element('//html2pdf4doc-content-flow' + _second_)
+        self.assert_element_not_present(_original_, by="xpath")
+        self.helper.assert_document_has_pages(1)
+
+        # * Without new content, the current content is paginated again.
+        self._run_async("HTML2PDF4DOC.rerender({ config: { printPaperSize: 'A4' } })")
+
+        self.helper.assert_html2pdf4doc_success()
+        self.helper.assert_element('//html2pdf4doc-content-flow' + _second_)
+        self.assert_element_not_present(_original_, by="xpath")
+        self.helper.assert_document_has_pages(1)
+
+    def test_ready_promise_and_done_event(self):
+        self.helper.open_case(path_to_this_test_file_folder, 'lifecycle')
+
+        result = self.execute_async_script("""
+            const done = arguments[arguments.length - 1];
+            window.html2pdf4doc.ready.then((result) => done(result));
+        """)
+        assert result["success"] is True, result
+        assert result["pageCount"] == 1, result
+        assert result["validations"]["valid"] is True, result
+        assert result["timings"]["total"] > 0, result
+        self.helper.assert_html2pdf4doc_success()
+
+        # * The event carries the same result, also for re-renders.
+        detail = self.execute_async_script("""
+            const done = arguments[arguments.length - 1];
+            window.addEventListener(
+              'html2pdf4doc:done',
+              (event) => done(event.detail),
+              { once: true },
+            );
+            HTML2PDF4DOC.rerender({ content: '<p id="second">Second document</p>' });
+        """)
+        assert detail["success"] is True, detail
+        assert detail["pageCount"] == 1, detail
+
+    def test_timings(self):
+        self.helper.open_case(path_to_this_test_file_folder, 'lifecycle')
+        self.helper.assert_html2pdf4doc_success()
+
+        timings = self.execute_script("return window.html2pdf4doc.timings;")
+        for phase in (
+            "total", "config", "layout", "preprocess",
+            "paper", "pages", "preview", "toc", "validator",
+        ):
+            assert phase in timings["phases"], timings
+        assert timings["total"] == timings["phases"]["total"], timings
+        assert isinstance(timings["spans"], dict), timings
+
+        # * The same durations are available as User Timing measures.
+        measures = self.execute_script("""
+            return performance.getEntriesByType('measure')
+              .map((entry) => entry.name)
+              .filter((name) => name.startsWith('html2pdf4doc:'));
+        """)
+        assert "html2pdf4doc:pages" in measures, measures
+        assert "html2pdf4doc:total" in measures, measures
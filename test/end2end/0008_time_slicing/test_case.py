@@ -0,0 +1,61 @@
+import os
+
+from seleniumbase import BaseCase
+
+from test.end2end.helpers.helper import Helper
+
+path_to_this_test_file_folder = os.path.dirname(os.path.abspath(__file__))
+
+
+class Test(BaseCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.helper = Helper(self)
+
+    def _get_page_starts(self):
+        return self.execute_script("""
+            return [...document.querySelectorAll(
+              'html2pdf4doc-content-flow [html2pdf4doc-page-start]'
+            )].map((element) => [
+              element.getAttribute('html2pdf4doc-page-start'),
+              element.textContent.trim().slice(0, 40),
+            ]);
+        """)
+
+    def test_time_slicing_gives_the_same_pages(self):
+        self.helper.open_case(path_to_this_test_file_folder, 'time_slicing')
+        self.helper.assert_html2pdf4doc_success()
+
+        page_count = self.execute_script(
+            "return window.html2pdf4doc.ready.then((result) => result.pageCount);"
+        )
+        page_starts = self._get_page_starts()
+        assert page_count > 2, page_count
+        assert len(page_starts) == page_count, page_starts
+
+        # * The same document, paginated in slices of 1 ms.
+        progress = self.execute_async_script("""
+            const done = arguments[arguments.length - 1];
+            const progress = [];
+            window.addEventListener(
+              'html2pdf4doc:progress',
+              (event) => progress.push(event.detail),
+            );
+            HTML2PDF4DOC.rerender({
+              config: { timeSlicing: 'true', timeSliceMs: '1' },
+            }).then(() => done(progress));
+        """)
+
+        self.helper.assert_html2pdf4doc_success()
+        self.helper.assert_document_has_pages(page_count)
+        assert self._get_page_starts() == page_starts
+
+        # * Reported after each slice and at the end.
+        assert len(progress) > 1, progress
+        for detail in progress:
+            assert set(detail) == {"pages", "elements"}, detail
+        assert [detail["elements"] for detail in progress] == sorted(
+            detail["elements"] for detail in progress
+        ), progress
+        assert progress[-1]["pages"] == page_count, progress
+        assert progress[-1]["elements"] > 0, progress
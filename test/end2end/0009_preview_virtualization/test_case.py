@@ -0,0 +1,104 @@
+import os
+
+from seleniumbase import BaseCase
+
+from test.end2end.helpers.helper import Helper
+
+path_to_this_test_file_folder = os.path.dirname(os.path.abspath(__file__))
+
+
+class Test(BaseCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.helper = Helper(self)
+
+    def _run_async(self, script: str) -> None:
+        self.execute_async_script(f"""
+            const done = arguments[arguments.length - 1];
+            {script}.then(() => done());
+        """)
+
+    def _count_pages(self):
+        return self.execute_script("""
+            return {
+              papers: document.querySelectorAll(
+                'html2pdf4doc-paper-flow > html2pdf4doc-virtual-paper'
+              ).length,
+              chromes: document.querySelectorAll(
+                'html2pdf4doc-overlay-flow > html2pdf4doc-page-chrome'
+              ).length,
+            };
+        """)
+
+    def _count_listeners(self) -> int:
+        return self.execute_script("return window.__listeners.length;")
+
+    def _scroll_to(self, fraction: float) -> None:
+        # * The virtualizer updates on the next animation frame.
+        self.execute_async_script(f"""
+            const done = arguments[arguments.length - 1];
+            const flow = document.querySelector('html2pdf4doc-paper-flow');
+            window.scrollTo(0, flow.offsetHeight * {fraction});
+            requestAnimationFrame(() => requestAnimationFrame(() => done()));
+        """)
+
+    def _has_paper_in_viewport(self) -> bool:
+        return self.execute_script("""
+            return [...document.querySelectorAll(
+              'html2pdf4doc-paper-flow > html2pdf4doc-virtual-paper'
+            )].some((paper) => {
+              const rect = paper.getBoundingClientRect();
+              return rect.bottom > 0 && rect.top < window.innerHeight;
+            });
+        """)
+
+    def test_virtualization(self):
+        self.helper.open_case(path_to_this_test_file_folder, 'virtualization')
+        self.helper.assert_html2pdf4doc_success()
+
+        page_count = self.execute_script(
+            "return window.html2pdf4doc.ready.then((result) => result.pageCount);"
+        )
+        assert page_count > 10, page_count
+
+        # * Only the pages near the viewport are in the paper and overlay flows.
+        counts = self._count_pages()
+        assert 0 < counts["papers"] < page_count, counts
+        assert counts["chromes"] == counts["papers"], counts
+        assert self._count_listeners() == 4
+
+        self._scroll_to(0.5)
+        counts = self._count_pages()
+        assert 0 < counts["papers"] < page_count, counts
+        assert counts["chromes"] == counts["papers"], counts
+        assert self._has_paper_in_viewport()
+
+        # * All of them are put back for printing.
+        self.execute_script("window.dispatchEvent(new Event('beforeprint'));")
+        assert self._count_pages() == {"papers": page_count, "chromes": page_count}
+
+        self.execute_script("window.dispatchEvent(new Event('afterprint'));")
+        counts = self._count_pages()
+        assert 0 < counts["papers"] < page_count, counts
+        assert self._has_paper_in_viewport()
+
+    def test_destroy_and_rerender_remove_the_listeners(self):
+        self.helper.open_case(path_to_this_test_file_folder, 'virtualization')
+        self.helper.assert_html2pdf4doc_success()
+        assert self._count_listeners() == 4
+
+        self._run_async("HTML2PDF4DOC.destroy()")
+        assert self._count_listeners() == 0
+
+        self._run_async("""
+            HTML2PDF4DOC.rerender({ config: { previewVirtualization: 'false' } })
+        """)
+        self.helper.assert_html2pdf4doc_success()
+        assert self._count_listeners() == 0
+
+        # * Without virtualization, every page stays in the flows.
+        page_count = self.execute_script(
+            "return window.html2pdf4doc.ready.then((result) => result.pageCount);"
+        )
+        self._scroll_to(0.5)
+        assert self._count_pages() == {"papers": page_count, "chromes": page_count}
@@ -40,6 +40,12 @@ pre = "//pre"
 admonition = "//*[contains(@class, 'admonition')]"
 
 
+def pre_line(number: int) -> str:
+    # * The innermost element with the line as its own text:
+    # * a chunk of lines, a line, or the block of the first/last lines.
+    return f"//pre//*[contains(text(), 'line {number:03}:')]"
+
+
 class Test(BaseCase):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -94,3 +100,26 @@ class Test(BaseCase):
         helper = Helper(self)
         self.helper.open_case(path_to_this_test_file_folder, '010')
         self.helper.assert_document_has_pages(3)
+
+    def test_011(self):
+        # * A PRE of 300 lines (over the chunk size) on several pages.
+        # * The lines are 20px high, so a page takes as many lines as fit.
+        self.helper.open_case(path_to_this_test_file_folder, '011')
+        self.helper.assert_html2pdf4doc_success()
+
+        lines_per_page = self.helper.get_print_area_height() // 20
+        pages = -(-300 // lines_per_page)
+        assert pages > 2, lines_per_page
+        self.helper.assert_document_has_pages(pages)
+
+        # * Page breaks: the pages are filled line by line.
+        self.helper.assert_element_on_the_page(pre_line(lines_per_page), 1)
+        self.helper.assert_element_on_the_page(pre_line(lines_per_page + 1), 2)
+        self.helper.assert_element_on_the_page(pre_line(2 * lines_per_page), 2)
+        self.helper.assert_element_on_the_page(pre_line(2 * lines_per_page + 1), 3)
+
+        # * The first and the last lines are kept together.
+        for number in (1, 2, 3):
+            self.helper.assert_element_on_the_page(pre_line(number), 1)
+        for number in (298, 299, 300):
+            self.helper.assert_element_on_the_page(pre_line(number), pages)
@@ -1,10 +1,11 @@
-import base64
 import os
 from typing import List, Dict
 
 from selenium.webdriver.common.by import By
 from seleniumbase import BaseCase
 
+from html2pdf4doc.pool import print_to_pdf
+
 # Elements should appear in the DOM on success:
 # only once
 _root_ = '//html2pdf4doc-root'
@@ -123,18 +124,14 @@ class Helper:
         if "chrome" not in driver.capabilities["browserName"].lower():
             raise RuntimeError("PDF printing only works in Chrome")
 
-        # Send command to Chrome
-        result = driver.execute_cdp_cmd("Page.printToPDF", {
-            "printBackground": True,  # Include background graphics
-            "landscape": False,  # Portrait mode
-            "paperWidth": 8.27,  # A4 width in inches
-            "paperHeight": 11.69,  # A4 height in inches
-        })
-
-        # Save PDF
-        pdf_data = base64.b64decode(result["data"])
+        # Send command to Chrome and save the PDF streamed in chunks
         with open(path_to_output_pdf, "wb") as f:
-            f.write(pdf_data)
+            print_to_pdf(driver, f, {
+                "printBackground": True,  # Include background graphics
+                "landscape": False,  # Portrait mode
+                "paperWidth": 8.27,  # A4 width in inches
+                "paperHeight": 11.69,  # A4 height in inches
+            })
         print(f"PDF saved to {path_to_output_pdf}")
 
     def open_case_num(self, base_folder: str, n: int, prefix: str = "case", ext: str = "html") -> None:
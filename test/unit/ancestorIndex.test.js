@@ -0,0 +1,61 @@
+import { expect } from 'chai';
+import AncestorIndex from '../../src/node/cache/ancestorIndex.js';
+
+// * A minimal element tree: { children: [...] } → element-like objects.
+function createTree(spec, parent = null) {
+  const element = { parentNode: parent, parentElement: parent, children: [] };
+  element.children = (spec.children || []).map(child => createTree(child, element));
+  element.firstElementChild = element.children[0] || null;
+  return element;
+}
+
+describe('AncestorIndex', () => {
+
+  it('should compute depth from the nearest indexed ancestor', () => {
+    const root = createTree({ children: [{ children: [{}] }] });
+    const leaf = root.children[0].children[0];
+    const index = new AncestorIndex();
+    expect(index.getDepth(root)).to.equal(0);
+    expect(index.getDepth(leaf)).to.equal(2);
+  });
+
+  it('should find the top of the first-child chain', () => {
+    const root = createTree({ children: [{ children: [{}, {}] }, {}] });
+    const first = root.children[0].children[0];
+    const second = root.children[0].children[1];
+    const index = new AncestorIndex();
+    expect(index.getFirstChildChainTop(first)).to.equal(root);
+    expect(index.getFirstChildChainTop(second)).to.equal(second);
+    expect(index.getFirstChildChainTop(root.children[1])).to.equal(root.children[1]);
+  });
+
+  it('should keep answers within one structure generation', () => {
+    let structure = 0;
+    const index = new AncestorIndex({ getStructureGeneration: () => structure });
+    const element = {};
+    const root = {};
+
+    index.setAnswer('test', element, root, null);
+    expect(index.hasAnswer('test', element, root)).to.be.true;
+    expect(index.getAnswer('test', element, root)).to.be.null;
+    expect(index.hasAnswer('other', element, root)).to.be.false;
+
+    // * A structural mutation bumps the generation.
+    structure += 1;
+    expect(index.hasAnswer('test', element, root)).to.be.false;
+  });
+
+  it('should keep offsets within one layout generation', () => {
+    let layout = 0;
+    let reads = 0;
+    const index = new AncestorIndex({ getLayoutGeneration: () => layout });
+    const element = {};
+    const root = {};
+    const getter = () => ++reads;
+
+    expect(index.getOffset(element, root, getter)).to.equal(1);
+    expect(index.getOffset(element, root, getter)).to.equal(1);
+    layout += 1;
+    expect(index.getOffset(element, root, getter)).to.equal(2);
+  });
+});
@@ -0,0 +1,143 @@
+import { expect } from 'chai';
+import GridTrackIndex from '../../src/node/utils/gridTrackIndex.js';
+
+const AUTO = {
+  gridRowStart: 'auto',
+  gridRowEnd: 'auto',
+  gridColumnStart: 'auto',
+  gridColumnEnd: 'auto',
+  order: '0',
+  display: 'block',
+  position: 'static',
+};
+
+// * Auto-placed cells laid out in rows of the given heights, `columns` cells per row.
+function createGrid({ heights, columns, gap = 0, cellStyle = AUTO, templateRows }) {
+  let reads = 0;
+  let generation = 0;
+  const cells = [];
+  let top = 0;
+  heights.forEach((height) => {
+    for (let column = 0; column < columns; column++) {
+      cells.push({ top, bottom: top + height, left: column * 100, style: { ...cellStyle } });
+    }
+    top += height + gap;
+  });
+  const index = new GridTrackIndex({
+    containerStyle: {
+      gridTemplateRows: templateRows || heights.map(height => `${height}px`).join(' '),
+      gridTemplateColumns: new Array(columns).fill('100px').join(' '),
+      rowGap: gap ? `${gap}px` : 'normal',
+    },
+    cells,
+    getStyle: (cell) => cell.style,
+    getTop: (cell) => { reads += 1; return cell.top },
+    getBottom: (cell) => { reads += 1; return cell.bottom },
+    getLeft: (cell) => cell.left,
+    getGeneration: () => generation,
+  });
+  return {
+    index,
+    cells,
+    reads: () => reads,
+    bump: () => { generation += 1 },
+  };
+}
+
+describe('GridTrackIndex', () => {
+
+  it('should group auto-placed cells by the column count without measuring the rows', () => {
+    const { index, reads } = createGrid({ heights: [10, 20, 30], columns: 3 });
+    expect(index.rows.map(row => row.length)).to.deep.equal([3, 3, 3]);
+    expect(reads()).to.equal(0);
+  });
+
+  it('should group by position when another grid item shifts the cells', () => {
+    // * A generated ::before of the container takes the first slot:
+    // * 5 cells in 3 columns are placed as [_, 0, 1], [2, 3, 4].
+    const slots = [[0, 100], [0, 200], [20, 0], [20, 100], [20, 200]];
+    const cells = slots.map(([top, left]) => ({ top, bottom: top + 20, left, style: { ...AUTO } }));
+    const index = new GridTrackIndex({
+      containerStyle: { gridTemplateRows: '20px 20px', gridTemplateColumns: '100px 100px 100px' },
+      cells,
+      getStyle: (cell) => cell.style,
+      getTop: (cell) => cell.top,
+      getBottom: (cell) => cell.bottom,
+      getLeft: (cell) => cell.left,
+    });
+    expect(index.rows).to.deep.equal([cells.slice(0, 2), cells.slice(2)]);
+  });
+
+  it('should take the row bounds from the tracks', () => {
+    const { index, reads } = createGrid({ heights: new Array(1000).fill(10), columns: 4, gap: 2 });
+    const rows = index.rows;
+    expect(index.getRowBounds(rows[0], rows)).to.deep.equal({ top: 0, bottom: 10 });
+    expect(index.getRowBounds(rows[500], rows)).to.deep.equal({ top: 6000, bottom: 6010 });
+    expect(index.getRowBounds(rows[999], rows)).to.deep.equal({ top: 11988, bottom: 11998 });
+    // * The first row anchors the tracks, the last one checks them.
+    expect(reads()).to.equal(8);
+  });
+
+  it('should resolve the tracks again in a new layout generation', () => {
+    const { index, reads, bump } = createGrid({ heights: [10, 20], columns: 2 });
+    const rows = index.rows;
+    index.getRowBounds(rows[1], rows);
+    index.getRowBounds(rows[0], rows);
+    expect(reads()).to.equal(4);
+    bump();
+    index.getRowBounds(rows[1], rows);
+    expect(reads()).to.equal(8);
+  });
+
+  it('should follow the rows replaced with their slices', () => {
+    const { index } = createGrid({ heights: [10, 20, 30], columns: 1 });
+    const rows = [...index.rows];
+    const slices = [[{ top: 10, bottom: 20 }], [{ top: 20, bottom: 30 }]];
+    rows.splice(1, 1, ...slices);
+    expect(index.getRowBounds(slices[1], rows)).to.be.null; // * 3 tracks for 4 rows
+    expect(index.getRowBounds(index.rows[1], rows)).to.be.null; // * not in the rows anymore
+  });
+
+  it('should give up on tracks that do not match the cells', () => {
+    const { index } = createGrid({ heights: [10, 20], columns: 2, templateRows: '10px 25px' });
+    expect(index.getRowBounds(index.rows[0], index.rows)).to.be.null;
+  });
+
+  it('should give up on tracks that are not resolved into pixels', () => {
+    const { index } = createGrid({ heights: [10, 20], columns: 2, templateRows: 'none' });
+    expect(index.getRowBounds(index.rows[0], index.rows)).to.be.null;
+  });
+
+  it('should group explicitly placed cells by position', () => {
+    const cells = [
+      { top: 0, bottom: 10, style: { ...AUTO, gridRowStart: '1' } },
+      { top: 0, bottom: 10, style: { ...AUTO, gridRowStart: '1' } },
+      { top: 10, bottom: 20, style: { ...AUTO, gridRowStart: '2' } },
+    ];
+    const index = new GridTrackIndex({
+      containerStyle: { gridTemplateRows: '10px 10px', gridTemplateColumns: '100px 100px', rowGap: 'normal' },
+      cells,
+      getStyle: (cell) => cell.style,
+      getTop: (cell) => cell.top,
+      getBottom: (cell) => cell.bottom,
+    });
+    expect(index.rows.map(row => row.length)).to.deep.equal([2, 1]);
+    expect(index.hasImplicitRowGaps).to.be.false;
+    expect(index.getRowBounds(index.rows[1], index.rows)).to.deep.equal({ top: 10, bottom: 20 });
+  });
+
+  it('should detect spans and implicit row gaps', () => {
+    const index = new GridTrackIndex({
+      containerStyle: { gridTemplateRows: '10px', gridTemplateColumns: '100px' },
+      cells: [
+        { top: 0, bottom: 10, style: { ...AUTO, gridRowStart: '3', gridColumnEnd: 'span 2' } },
+      ],
+      getStyle: (cell) => cell.style,
+      getTop: (cell) => cell.top,
+      getBottom: (cell) => cell.bottom,
+    });
+    expect(index.hasColumnSpan).to.be.true;
+    expect(index.hasRowSpan).to.be.false;
+    expect(index.hasImplicitRowGaps).to.be.true;
+  });
+});
@@ -0,0 +1,57 @@
+import { expect } from 'chai';
+import MeasureCache from '../../src/node/cache/measureCache.js';
+
+describe('MeasureCache', () => {
+
+  it('should read once per layout generation', () => {
+    let generation = 0;
+    let reads = 0;
+    const cache = new MeasureCache({ getGeneration: () => generation });
+    const element = {};
+    const getter = () => {
+      reads += 1;
+      return reads * 10;
+    };
+
+    expect(cache.getOffset(element, 'offsetTop', getter)).to.equal(10);
+    expect(cache.getOffset(element, 'offsetTop', getter)).to.equal(10);
+    expect(reads).to.equal(1);
+
+    // * A DOM mutation bumps the generation.
+    generation += 1;
+    expect(cache.getOffset(element, 'offsetTop', getter)).to.equal(20);
+    expect(cache.getOffset(element, 'offsetTop', getter)).to.equal(20);
+    expect(reads).to.equal(2);
+  });
+
+  it('should keep values per element and per name', () => {
+    const cache = new MeasureCache({ getGeneration: () => 0 });
+    const first = {};
+    const second = {};
+
+    cache.getOffset(first, 'offsetTop', () => 1);
+    cache.getOffset(first, 'offsetHeight', () => 2);
+    cache.getOffset(second, 'offsetTop', () => 3);
+
+    expect(cache.getOffset(first, 'offsetTop', () => 0)).to.equal(1);
+    expect(cache.getOffset(first, 'offsetHeight', () => 0)).to.equal(2);
+    expect(cache.getOffset(second, 'offsetTop', () => 0)).to.equal(3);
+  });
+
+  it('should keep values until reset without a generation source', () => {
+    const cache = new MeasureCache();
+    const element = {};
+
+    cache.getBCR(element, 'default', () => ({ top: 1 }));
+    expect(cache.getBCR(element, 'default', () => ({ top: 2 })).top).to.equal(1);
+
+    cache.reset();
+    expect(cache.getBCR(element, 'default', () => ({ top: 2 })).top).to.equal(2);
+  });
+
+  it('should return undefined for a missing element', () => {
+    const cache = new MeasureCache({ getGeneration: () => 0 });
+    expect(cache.getOffset(null, 'offsetTop', () => 1)).to.be.undefined;
+    expect(cache.getStyle(undefined)).to.be.undefined;
+  });
+});
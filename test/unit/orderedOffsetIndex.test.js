@@ -0,0 +1,91 @@
+import { expect } from 'chai';
+import OrderedOffsetIndex from '../../src/node/utils/orderedOffsetIndex.js';
+
+// * Blocks of the given heights, stacked top to bottom.
+function createIndex(heights) {
+  let reads = 0;
+  let top = 0;
+  const elements = heights.map((height) => {
+    const element = { top, bottom: top + height };
+    top += height;
+    return element;
+  });
+  const index = new OrderedOffsetIndex({
+    elements,
+    getTop: (element) => { reads += 1; return element.top },
+    getBottom: (element) => { reads += 1; return element.bottom },
+  });
+  return { index, reads: () => reads };
+}
+
+describe('OrderedOffsetIndex', () => {
+
+  it('should find the first element crossing the limit', () => {
+    const { index } = createIndex(new Array(100).fill(10));
+    // * Element 24 ends at 250, element 25 starts at 250 and ends at 260.
+    expect(index.findFirstOverflow(0, 99, 245)).to.equal(24);
+    expect(index.findFirstOverflow(0, 99, 250)).to.equal(25);
+    expect(index.findFirstOverflow(30, 99, 255)).to.equal(30);
+    expect(index.findFirstOverflow(0, 99, 10000)).to.equal(99);
+  });
+
+  it('should take a logarithmic number of measurements', () => {
+    const { index, reads } = createIndex(new Array(10000).fill(10));
+    expect(index.findFirstOverflow(0, 9999, 50000)).to.equal(5000);
+    expect(reads()).to.be.below(3 * 15);
+  });
+
+  it('should give up on unordered elements', () => {
+    const elements = [{ top: 0, bottom: 10 }, { top: 10, bottom: 20 }, { top: 5, bottom: 15 }, { top: 20, bottom: 30 }];
+    const index = new OrderedOffsetIndex({
+      elements,
+      getTop: (element) => element.top,
+      getBottom: (element) => element.bottom,
+    });
+    expect(index.findFirstOverflow(0, 3, 100)).to.be.null;
+  });
+
+  it('should give up on elements that cannot be measured', () => {
+    const index = new OrderedOffsetIndex({
+      elements: [{}, {}, {}],
+      getTop: () => undefined,
+      getBottom: () => undefined,
+    });
+    expect(index.findFirstOverflow(0, 2, 100)).to.be.null;
+  });
+
+  it('should give up on unsampled elements out of flow', () => {
+    // * A float in element 1 overflows the limit, while the tops of the next elements stay above it.
+    // * The binary search over [0, 7) samples 3, 5 and 6, so it never looks at element 1.
+    const elements = new Array(8).fill(null).map((_, i) => ({ top: i, bottom: i + 1, float: 'none' }));
+    elements[1] = { top: 1, bottom: 100, float: 'left' };
+    const params = {
+      elements,
+      getTop: (element) => element.top,
+      getBottom: (element) => element.bottom,
+    };
+
+    expect(new OrderedOffsetIndex(params).findFirstOverflow(0, 7, 50)).to.equal(7);
+    const index = new OrderedOffsetIndex({ ...params, isInFlow: (element) => element.float === 'none' });
+    expect(index.findFirstOverflow(0, 7, 50)).to.be.null;
+    // * After the float, the run can be skipped.
+    expect(index.findFirstOverflow(2, 7, 50)).to.equal(7);
+  });
+
+  it('should check the elements in flow lazily, once each', () => {
+    const elements = new Array(1000).fill(null).map((_, i) => ({ top: i * 10, bottom: i * 10 + 10 }));
+    let checks = 0;
+    const index = new OrderedOffsetIndex({
+      elements,
+      getTop: (element) => element.top,
+      getBottom: (element) => element.bottom,
+      isInFlow: () => { checks += 1; return true },
+    });
+    expect(index.findFirstOverflow(0, 999, 45)).to.equal(4);
+    // * The samples of the search (two per step) and the elements before the result.
+    expect(checks).to.be.below(30);
+    const firstChecks = checks;
+    expect(index.findFirstOverflow(0, 999, 45)).to.equal(4);
+    expect(checks).to.equal(firstChecks);
+  });
+});
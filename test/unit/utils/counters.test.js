@@ -0,0 +1,56 @@
+import { expect } from 'chai';
+import {
+  OPERATIONS,
+  resetCounters,
+  countOperation,
+  startCountingPage,
+  stopCountingPages,
+  getCounters,
+} from '../../../src/utils/counters.js';
+
+describe('operation counters', () => {
+
+  afterEach(() => {
+    resetCounters(false);
+  });
+
+  it('should count nothing when disabled', () => {
+    resetCounters(false);
+    countOperation('layoutReads');
+    expect(getCounters()).to.be.null;
+  });
+
+  it('should report all the operations in total', () => {
+    resetCounters(true);
+    countOperation('layoutReads');
+    countOperation('layoutReads');
+    countOperation('clones', 3);
+
+    const { total, pages } = getCounters();
+    expect(Object.keys(total)).to.deep.equal(OPERATIONS);
+    expect(total.layoutReads).to.equal(2);
+    expect(total.clones).to.equal(3);
+    expect(total.insertions).to.equal(0);
+    expect(pages).to.deep.equal([]);
+  });
+
+  it('should attribute operations to the current page', () => {
+    resetCounters(true);
+    countOperation('insertions');
+    startCountingPage();
+    countOperation('parseNode');
+    startCountingPage();
+    countOperation('parseNode');
+    countOperation('parseNode');
+    stopCountingPages();
+    countOperation('parseNode');
+
+    const { total, pages } = getCounters();
+    expect(pages).to.have.length(2);
+    expect(pages[0].parseNode).to.equal(1);
+    expect(pages[1].parseNode).to.equal(2);
+    expect(pages[0].insertions).to.equal(0);
+    expect(total.parseNode).to.equal(4);
+    expect(total.insertions).to.equal(1);
+  });
+});
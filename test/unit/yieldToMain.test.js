@@ -0,0 +1,23 @@
+import { expect } from 'chai';
+import { yieldToMain, createTimeSlice } from '../../src/utils/yieldToMain.js';
+
+describe('yieldToMain', () => {
+
+  it('should resume after the pending tasks', async () => {
+    let ran = false;
+    setTimeout(() => { ran = true; }, 0);
+    await yieldToMain();
+    await yieldToMain();
+    expect(ran).to.equal(true);
+  });
+
+  it('should be over when the budget is spent, until restarted', () => {
+    const slice = createTimeSlice(0);
+    expect(slice.isOver()).to.equal(true);
+
+    const longSlice = createTimeSlice(60000);
+    expect(longSlice.isOver()).to.equal(false);
+    longSlice.restart();
+    expect(longSlice.isOver()).to.equal(false);
+  });
+});